@@ -0,0 +1,92 @@
+"""Benchmark: legal move detection on midgame positions.
+
+Compares probing (try all 64x64 from/to pairs, play each candidate that
+follows the piece rules, test for check and take it back) with
+Board.generate_legal_moves on a fresh position (caches cleared before every
+call), and shows the cost of a repeated call on an unchanged position (a
+cache hit) separately. The probing reference is built on the current Board
+primitives (follows_move_rules, make_move/unmake_move), so the comparison is
+between the two algorithms, not against the code of earlier versions.
+Run from the project root with: python benchmarks/bench_legal_moves.py
+"""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from chessgame.board import Board
+from chessgame.pieces import Pawn, Rook, Knight, Bishop, Queen, King, WHITE, BLACK
+from chessgame.move import Move
+
+PIECE_CLASSES = {"p": Pawn, "r": Rook, "n": Knight, "b": Bishop, "q": Queen, "k": King}
+
+# Midgame positions written rank 8 first, one string per rank ('.' = empty)
+POSITIONS = [
+    ["r...k..r", "p.ppqpb.", "bn..pnp.", "...PN...", ".p..P...", "..N..Q.p", "PPPBBPPP", "R...K..R"],
+    ["r.bq.rk.", "pp..bppp", "..np.n..", "..p.p...", "..P.P...", "..NP.N..", "PP..BPPP", "R.BQ.RK."],
+    ["..rq.rk.", "pp..bppp", "..n.pn..", "...p....", "...P.B..", "..NB.N..", "PP...PPP", "R..Q.RK."],
+]
+
+def build_board(ranks):
+    """Build a board from eight rank strings (uppercase = white).
+    """
+    b = Board()
+    for row, rank in enumerate(ranks):
+        for col, char in enumerate(rank):
+            if char == ".":
+                continue
+            color = WHITE if char.isupper() else BLACK
+            b.set_piece_at(row * 8 + col, PIECE_CLASSES[char.lower()](color))
+    return b
+
+def probe_legal_moves(b, color):
+    """Probe all 64 destinations for every own piece,
+    playing each candidate that follows the piece rules to see if it leaves the king in check.
+    """
+    moves = []
+    for from_index in range(64):
+        piece = b.squares[from_index]
+        if piece is None or piece.color != color:
+            continue
+        for to_index in range(64):
+            if not b.follows_move_rules(from_index, to_index, color):
+                continue
+            if isinstance(piece, King) and abs(to_index - from_index) == 2:
+                moves.append((from_index, to_index)) # follows_move_rules checked the castling rules
+                continue
+            undo = b.make_move(Move(from_index, to_index))
+            if not b.is_in_check(color):
+                moves.append((from_index, to_index))
+            b.unmake_move(undo)
+    return moves
+
+def uncached_legal_moves(b, color):
+    """Board.generate_legal_moves as on a position seen for the first time.
+    """
+    b.legality_cache = b.legal_moves_cache = b.check_cache = None
+    return b.generate_legal_moves(color)
+
+def time_it(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+def main(repeat: int = 20) -> None:
+    boards = [build_board(ranks) for ranks in POSITIONS]
+
+    for i, b in enumerate(boards, start = 1):
+        for color in (WHITE, BLACK):
+            probe_time = time_it(lambda: probe_legal_moves(b, color), repeat)
+            new_time = time_it(lambda: uncached_legal_moves(b, color), repeat)
+            b.generate_legal_moves(color)
+            cached_time = time_it(lambda: b.generate_legal_moves(color), repeat)
+            count = len(uncached_legal_moves(b, color))
+            assert count == len(probe_legal_moves(b, color))
+            print(f"position {i} {color:5}: {count:3} moves  "
+                  f"probe {probe_time * 1000:7.2f} ms  new {new_time * 1000:6.3f} ms  "
+                  f"speedup x{probe_time / new_time:5.1f}  (cached {cached_time * 1000:6.3f} ms)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Benchmark: root-parallel search throughput against the number of workers.
+
+Searches the perft suite positions to a fixed depth with 1, 2, 4, ... worker
+processes and prints nodes/second and the speedup over one worker.
+Run from the project root with: python benchmarks/bench_parallel_search.py [depth] [max workers]
+"""
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from chessgame.engine import SearchLimits
+from chessgame.parallel import ParallelSearcher
+from chessgame.perft import PERFT_SUITE
+from chessgame.fen import board_from_fen
+
+def run(workers: int, depth: int) -> tuple[int, float]:
+    """Search every suite position with the given number of workers.
+    Returns (total nodes, total seconds).
+    """
+    positions = [board_from_fen(fen) for _, fen, _ in PERFT_SUITE]
+
+    with ParallelSearcher(workers) as searcher:
+        searcher.search(*positions[0], SearchLimits(depth = 1)) # Start the worker processes
+
+        nodes = 0
+        start = time.perf_counter()
+        for board, turn in positions:
+            nodes += searcher.search(board, turn, SearchLimits(depth = depth)).nodes
+        return nodes, time.perf_counter() - start
+
+def main(depth: int = 4, max_workers: int | None = None) -> None:
+    max_workers = max_workers or os.cpu_count() or 1
+    counts = []
+    workers = 1
+    while workers <= max_workers:
+        counts.append(workers)
+        workers *= 2
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+
+    base_nps = None
+    for workers in counts:
+        nodes, elapsed = run(workers, depth)
+        nps = nodes / elapsed
+        base_nps = base_nps or nps
+        print(f"{workers:3} workers: {nodes:9} nodes  {elapsed:7.2f} s  {nps:9.0f} nodes/s  "
+              f"throughput x{nps / base_nps:5.2f}")
+
+if __name__ == "__main__":
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    max_workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    main(depth, max_workers)
@@ -0,0 +1,76 @@
+"""Benchmark: streaming PGN reading, with and without replaying the moves.
+
+Writes an archive of seeded random games with the PGN writer, then reads it
+back lazily and prints games/second and the peak memory of each pass. The
+peak should stay flat as the archive grows, since one game is held at a time.
+Run from the project root with: python benchmarks/bench_pgn.py [games] [plies]
+"""
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.pgn import Game, read_games, write_games
+
+def random_games(count: int, plies: int, seed: int = 1):
+    """Yield count games of up to plies random legal moves each.
+    """
+    rng = random.Random(seed)
+    for number in range(count):
+        board = Board()
+        board.setup_starting_position()
+        turn = WHITE
+        moves = []
+        for _ in range(plies):
+            legal = board.generate_legal_moves(turn)
+            if not legal:
+                break
+            move = rng.choice(legal)
+            board.make_move(move)
+            moves.append(move)
+            turn = BLACK if turn == WHITE else WHITE
+        yield Game.from_moves(moves, {"Event": "Benchmark", "Round": str(number + 1)})
+
+def read_all(path: Path, replay: bool) -> int:
+    """Read every game of the archive (and replay it if asked). Returns the number of games.
+    """
+    games = 0
+    for game in read_games(path):
+        if replay:
+            game.final_position()
+        games += 1
+    return games
+
+def timed(path: Path, replay: bool) -> tuple[int, float, int]:
+    """Time one pass over the archive, then measure the peak memory of a second pass
+    (tracemalloc slows Python down too much to time the same pass).
+    Returns (games, seconds, peak bytes).
+    """
+    start = time.perf_counter()
+    games = read_all(path, replay)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    read_all(path, replay)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return games, seconds, peak
+
+def main(count: int = 100, plies: int = 80) -> None:
+    with tempfile.TemporaryDirectory() as folder:
+        path = Path(folder) / "archive.pgn"
+        write_games(random_games(count, plies), path)
+        print(f"Archive: {count} games, {path.stat().st_size / 1024:.0f} KiB")
+
+        for label, replay in (("parse", False), ("parse + replay", True)):
+            games, seconds, peak = timed(path, replay)
+            print(f"{label:>15}: {games / seconds:10.0f} games/s   peak {peak / 1024:8.1f} KiB")
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
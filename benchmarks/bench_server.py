@@ -0,0 +1,106 @@
+"""Load test: many concurrent games against the asyncio game server.
+
+Starts the server in a separate process, opens a pool of connections and
+plays random legal moves in N games at once (each game asks MOVES, picks one
+and sends MOVE). Prints moves/second and the p50/p99 latency of MOVE
+requests for each number of concurrent games.
+Run from the project root with: python benchmarks/bench_server.py [games ...] [--plies N] [--connections N]
+"""
+import argparse
+import asyncio
+import random
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+class Connection:
+    """One client connection sending a request and waiting for its reply line.
+    """
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def request(self, line: str) -> str:
+        self.writer.write(line.encode("utf-8") + b"\n")
+        await self.writer.drain()
+        return (await self.reader.readline()).decode("utf-8").rstrip("\n")
+
+async def play_game(pool: asyncio.Queue, plies: int, rng: random.Random, latencies: list[float]) -> int:
+    """Create a game and play up to plies random moves. Returns the number of moves played.
+    """
+    async def request(line: str) -> tuple[str, float]:
+        connection = await pool.get()
+        try:
+            start = time.perf_counter()
+            reply = await connection.request(line)
+            return reply, time.perf_counter() - start
+        finally:
+            pool.put_nowait(connection)
+
+    reply, _ = await request("NEW")
+    game_id = reply.split()[1]
+
+    played = 0
+    for _ in range(plies):
+        reply, _ = await request(f"MOVES {game_id}")
+        moves = reply.split()[1:]
+        if not moves:
+            break # The game is over
+
+        reply, seconds = await request(f"MOVE {game_id} {rng.choice(moves)}")
+        if not reply.startswith("OK"):
+            raise RuntimeError(reply)
+        latencies.append(seconds)
+        played += 1
+
+    await request(f"CLOSE {game_id}")
+    return played
+
+async def run(port: int, games: int, plies: int, connections: int) -> None:
+    """Play games concurrently and print the throughput and latency.
+    """
+    pool = asyncio.Queue()
+    for _ in range(connections):
+        pool.put_nowait(Connection(*await asyncio.open_connection("127.0.0.1", port)))
+
+    rng = random.Random(games)
+    latencies = []
+    start = time.perf_counter()
+    moves = sum(await asyncio.gather(*(play_game(pool, plies, rng, latencies) for _ in range(games))))
+    seconds = time.perf_counter() - start
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[min(len(latencies) - 1, len(latencies) * 99 // 100)] * 1000
+    print(f"{games:6} games: {moves:7} moves in {seconds:6.1f} s  {moves / seconds:8.0f} moves/s  "
+          f"p50 {p50:7.2f} ms  p99 {p99:7.2f} ms")
+
+    while not pool.empty():
+        connection = pool.get_nowait()
+        connection.writer.write(b"QUIT\n")
+        connection.writer.close()
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description = __doc__.splitlines()[0])
+    parser.add_argument("games", nargs = "*", type = int, default = [1000, 10000])
+    parser.add_argument("--plies", type = int, default = 10)
+    parser.add_argument("--connections", type = int, default = 64)
+    parser.add_argument("--port", type = int, default = 7879)
+    args = parser.parse_args()
+
+    server = subprocess.Popen([sys.executable, "-m", "chessgame.server", str(args.port)], cwd = ROOT,
+                              stdout = subprocess.PIPE, text = True)
+    try:
+        print(server.stdout.readline().strip()) # Wait until it is listening
+        for games in args.games:
+            asyncio.run(run(args.port, games, args.plies, args.connections))
+    finally:
+        server.terminate()
+        server.wait()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark: the binary game store against one JSON file per save.
+
+Saves the same position under many names both ways, then times listing the
+saves, loading random saves by name and reading random positions by id.
+Run from the project root with: python benchmarks/bench_store.py [games]
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import chessgame.save_load as save_load
+from chessgame.board import Board
+from chessgame.pieces import WHITE
+from chessgame.move import Move
+from chessgame.store import GameStore
+
+def json_save(board, name: str) -> None:
+    """Write one save the way save_load did before the game store.
+    """
+    pieces = [json_record(index, board) for index in range(64) if board.squares[index] is not None]
+    data = {"turn": WHITE, "en_passant_target": board.en_passant_target, "pieces": pieces}
+    (save_load.SAVES_DIR / f"{name}.json").write_text(json.dumps(data, indent = 2), encoding = "utf-8")
+
+def json_record(index: int, board) -> dict:
+    """Return the JSON record of one piece.
+    """
+    from chessgame.types import SQUARE_NAMES
+
+    piece = board.squares[index]
+    return {"square": SQUARE_NAMES[index], "type": piece.__class__.__name__,
+            "color": piece.color, "has_moved": board.has_moved_at(index)}
+
+def timed(label: str, count: int, function) -> None:
+    """Run function once and print the rate per item.
+    """
+    start = time.perf_counter()
+    function()
+    seconds = time.perf_counter() - start
+    print(f"{label:>28}: {count / seconds:12.0f} /s   ({seconds:.3f} s)")
+
+def main(games: int = 20000) -> None:
+    board = Board()
+    board.setup_starting_position()
+    moves = [Move.from_uci(text) for text in ("e2e4", "e7e5", "g1f3", "b8c6", "f1b5", "a7a6")] * 5
+    rng = random.Random(1)
+    picks = [rng.randrange(games) for _ in range(1000)]
+
+    with tempfile.TemporaryDirectory() as folder:
+        folder = Path(folder)
+        print(f"{games} saved games")
+
+        save_load.SAVES_DIR = folder / "json"
+        save_load.SAVES_DIR.mkdir()
+        timed("JSON save", games, lambda: [json_save(board, f"game{i}") for i in range(games)])
+        timed("JSON list", games, save_load.list_saves)
+        timed("JSON load by name", len(picks),
+              lambda: [save_load.load_json_game(Board(), f"game{i}") for i in picks])
+
+        store = GameStore(folder / "store" / "games.store")
+        timed("store append", games, lambda: [store.append(f"game{i}", board, WHITE, moves) for i in range(games)])
+        reader = GameStore(store.path)
+        timed("store list (cold)", games, reader.names)
+        timed("store load by name", len(picks), lambda: [reader.load(reader.find(f"game{i}"), Board()) for i in picks])
+        timed("store position by id", len(picks), lambda: [reader.position(i) for i in picks])
+        timed("store moves by id", len(picks), lambda: [reader.game(i).moves() for i in picks])
+        print(f"{'bytes per game':>28}: {(store.path.stat().st_size + store.index_path.stat().st_size) / games:12.0f}")
+        reader.close()
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,100 @@
+# Precomputed Attack Tables
+#
+# Every table is built once when the module is imported and is indexed by
+# square index (index = row * 8 + col, a8 = 0, h1 = 63). Move generation and
+# attack detection look squares up here instead of re-deriving piece shapes.
+from chessgame.pieces import WHITE, BLACK
+
+# Move patterns as (row step, col step) pairs
+KNIGHT_OFFSETS = [(-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)]
+KING_OFFSETS = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
+
+# The 8 ray directions. Rooks use the first four, bishops the last four.
+NORTH, SOUTH, WEST, EAST, NORTH_WEST, NORTH_EAST, SOUTH_WEST, SOUTH_EAST = range(8)
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1), (-1, -1), (-1, 1), (1, -1), (1, 1)]
+ROOK_DIRECTIONS = (NORTH, SOUTH, WEST, EAST)
+BISHOP_DIRECTIONS = (NORTH_WEST, NORTH_EAST, SOUTH_WEST, SOUTH_EAST)
+QUEEN_DIRECTIONS = ROOK_DIRECTIONS + BISHOP_DIRECTIONS
+
+def _on_board(row: int, col: int) -> bool:
+    """Check that a (row, col) position is inside the board.
+    """
+    return 0 <= row <= 7 and 0 <= col <= 7
+
+def _jump_targets(offsets: list[tuple[int, int]]) -> list[tuple[int, ...]]:
+    """Build the squares reachable with one jump from each square.
+    """
+    table = []
+    for index in range(64):
+        row, col = index >> 3, index & 7
+        targets = []
+        for step_row, step_col in offsets:
+            if _on_board(row + step_row, col + step_col):
+                targets.append((row + step_row) * 8 + col + step_col)
+        table.append(tuple(targets))
+    return table
+
+def _rays() -> list[tuple[tuple[int, ...], ...]]:
+    """Build, for each square, the squares along each of the 8 directions (nearest first).
+    """
+    table = []
+    for index in range(64):
+        row, col = index >> 3, index & 7
+        rays = []
+        for step_row, step_col in DIRECTIONS:
+            ray = []
+            to_row, to_col = row + step_row, col + step_col
+            while _on_board(to_row, to_col):
+                ray.append(to_row * 8 + to_col)
+                to_row += step_row
+                to_col += step_col
+            rays.append(tuple(ray))
+        table.append(tuple(rays))
+    return table
+
+def _mask(indices) -> int:
+    """Turn a collection of square indices into a bitboard.
+    """
+    mask = 0
+    for index in indices:
+        mask |= 1 << index
+    return mask
+
+# Squares a knight / king on each square can jump to
+KNIGHT_TARGETS = _jump_targets(KNIGHT_OFFSETS)
+KING_TARGETS = _jump_targets(KING_OFFSETS)
+
+# Squares a pawn of each color captures from each square (white moves up the board)
+PAWN_CAPTURES = {
+    WHITE: _jump_targets([(-1, -1), (-1, 1)]),
+    BLACK: _jump_targets([(1, -1), (1, 1)]),
+}
+
+# RAYS[index][direction]: squares along a direction, nearest first
+RAYS = _rays()
+
+def _line_tables() -> tuple[list[list], list[list]]:
+    """Build the direction and the squares strictly between every pair of aligned squares.
+    """
+    direction_to = [[None] * 64 for _ in range(64)]
+    between = [[()] * 64 for _ in range(64)]
+
+    for from_index in range(64):
+        for direction in range(8):
+            ray = RAYS[from_index][direction]
+            for distance, to_index in enumerate(ray):
+                direction_to[from_index][to_index] = direction
+                between[from_index][to_index] = ray[:distance]
+
+    return direction_to, between
+
+# DIRECTION_TO[from][to]: the direction leading from one square to another, or None
+# SQUARES_BETWEEN[from][to]: squares strictly between two aligned squares
+DIRECTION_TO, SQUARES_BETWEEN = _line_tables()
+
+# Bitboard versions of the same tables (bit i = square index i)
+KNIGHT_MASKS = [_mask(targets) for targets in KNIGHT_TARGETS]
+KING_MASKS = [_mask(targets) for targets in KING_TARGETS]
+PAWN_ATTACK_MASKS = {color: [_mask(targets) for targets in table] for color, table in PAWN_CAPTURES.items()}
+RAY_MASKS = [[_mask(RAYS[index][direction]) for index in range(64)] for direction in range(8)]
+BETWEEN_MASKS = [[_mask(between) for between in row] for row in SQUARES_BETWEEN]
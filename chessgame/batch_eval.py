@@ -0,0 +1,103 @@
+# NumPy Batch Evaluation
+#
+# Scores many positions at once for bulk analysis and training-data labelling.
+# Positions are packed into an (N, 64) int8 array of piece codes (0 = empty,
+# 1..12 = zobrist piece code + 1), and the material + piece-square score of
+# all of them is a table lookup and a sum over the last axis. The scores are
+# the same as the material/piece-square part of chessgame.evaluation
+# (tapered by game phase); pawn structure and king safety are left out.
+#
+# Needs numpy (pip install numpy).
+import numpy as np
+
+from chessgame.pieces import WHITE
+from chessgame.zobrist import COLOR_CODE_OFFSET
+from chessgame.evaluation import SQUARE_SCORES_MG, SQUARE_SCORES_EG, PHASE_BY_CODE, MAX_PHASE
+from chessgame.packing import PACKED_SIZE
+from chessgame.fen import fen_to_packed
+
+# Lookup tables with a row of zeros in front for empty squares (code 0)
+MG_TABLE = np.array([[0] * 64] + SQUARE_SCORES_MG, dtype=np.int32)   # (13, 64)
+EG_TABLE = np.array([[0] * 64] + SQUARE_SCORES_EG, dtype=np.int32)   # (13, 64)
+PHASE_TABLE = np.array([0] + PHASE_BY_CODE, dtype=np.int32)          # (13,)
+SQUARE_RANGE = np.arange(64)
+
+def board_to_codes(board) -> list[int]:
+    """Return the 64 piece codes of a board, read from Board.grid (a8 first).
+    """
+    codes = []
+    for row in board.grid:
+        for piece in row:
+            codes.append(0 if piece is None else COLOR_CODE_OFFSET[piece.color] + piece.type_code + 1)
+    return codes
+
+def positions_to_array(positions) -> tuple[np.ndarray, np.ndarray]:
+    """Pack positions into an (N, 64) int8 code array and an (N,) array of side to move (+1 white, -1 black).
+    A position is a Board (white to move), a (Board, color) pair, a FEN string or a
+    42-byte packed board (chessgame.packing).
+    """
+    positions = list(positions)
+    codes = np.zeros((len(positions), 64), dtype=np.int8)
+    sides = np.ones(len(positions), dtype=np.int8)
+
+    packed_rows = []
+    packed_data = []
+    for i, position in enumerate(positions):
+        if isinstance(position, (bytes, bytearray, memoryview, str)):
+            packed_rows.append(i)
+            packed_data.append(fen_to_packed(position) if isinstance(position, str) else bytes(position))
+            continue
+
+        board, color = position if isinstance(position, tuple) else (position, WHITE)
+        codes[i] = board_to_codes(board)
+        sides[i] = 1 if color == WHITE else -1
+
+    if packed_rows:
+        packed_codes, packed_sides = packed_to_array(b"".join(packed_data))
+        codes[packed_rows] = packed_codes
+        sides[packed_rows] = packed_sides
+
+    return codes, sides
+
+def packed_to_array(data: bytes) -> tuple[np.ndarray, np.ndarray]:
+    """Unpack concatenated 42-byte packed boards into (N, 64) codes and (N,) sides without a Python loop.
+    """
+    raw = np.frombuffer(data, dtype=np.uint8)
+    if raw.size % PACKED_SIZE:
+        raise ValueError(f"Packed data must be a multiple of {PACKED_SIZE} bytes")
+
+    raw = raw.reshape(-1, PACKED_SIZE)
+    placement = raw[:, :32]
+
+    codes = np.empty((raw.shape[0], 64), dtype=np.int8)
+    codes[:, 0::2] = placement & 15 # Low nibble = even square index
+    codes[:, 1::2] = placement >> 4
+    sides = np.where(raw[:, 41] == 0, 1, -1).astype(np.int8)
+    return codes, sides
+
+def evaluate_array(codes: np.ndarray, sides: np.ndarray | None = None) -> np.ndarray:
+    """Score an (N, 64) code array. Returns an (N,) int32 array in centipawns,
+    from the side to move's point of view (white's if sides is None).
+    """
+    codes = np.asarray(codes, dtype=np.intp)
+    mg = MG_TABLE[codes, SQUARE_RANGE].sum(axis=1)
+    eg = EG_TABLE[codes, SQUARE_RANGE].sum(axis=1)
+    phase = PHASE_TABLE[codes].sum(axis=1)
+    return taper_scores(mg, eg, phase, sides)
+
+def taper_scores(mg: np.ndarray, eg: np.ndarray, phase: np.ndarray, sides: np.ndarray | None = None) -> np.ndarray:
+    """Blend (N,) middlegame and endgame scores by game phase, as chessgame.evaluation does.
+    Returns an (N,) int32 array, from the side to move's point of view (white's if sides is None).
+    """
+    phase = np.minimum(phase, MAX_PHASE)
+
+    scores = (mg * phase + eg * (MAX_PHASE - phase)) // MAX_PHASE
+    if sides is not None:
+        scores = scores * sides
+    return scores.astype(np.int32)
+
+def batch_evaluate(positions) -> np.ndarray:
+    """Score many positions (see positions_to_array) and return an (N,) int32 array.
+    """
+    codes, sides = positions_to_array(positions)
+    return evaluate_array(codes, sides)
@@ -0,0 +1,192 @@
+# Bitboard Board Backend
+#
+# A bitboard is a 64-bit integer with one bit per square (bit i = square index i,
+# so a8 is bit 0 and h1 is bit 63). The backend keeps twelve of them, one per
+# (color, piece type), next to the normal square list. Moves, castling, promotion
+# and en passant still go through the Board rule engine, but occupancy, attack,
+# king and path queries become bitwise operations.
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.move import Move, pawn_moves, QUIET, CAPTURE, EN_PASSANT, CASTLE, DOUBLE_PUSH
+from chessgame.attacks import (KNIGHT_MASKS, KING_MASKS, PAWN_ATTACK_MASKS, RAY_MASKS, BETWEEN_MASKS,
+                               NORTH, SOUTH, WEST, EAST, NORTH_WEST, NORTH_EAST, SOUTH_WEST, SOUTH_EAST)
+
+# Piece type order inside the twelve bitboards (white 0..5, black 6..11)
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+COLOR_OFFSET = {WHITE: 0, BLACK: 6}
+
+FULL = (1 << 64) - 1
+
+# Directions whose index step is positive find their nearest blocker with the
+# lowest set bit, negative steps with the highest set bit.
+POSITIVE_RAYS = {"rook": [RAY_MASKS[SOUTH], RAY_MASKS[EAST]],
+                 "bishop": [RAY_MASKS[SOUTH_EAST], RAY_MASKS[SOUTH_WEST]]}
+NEGATIVE_RAYS = {"rook": [RAY_MASKS[NORTH], RAY_MASKS[WEST]],
+                 "bishop": [RAY_MASKS[NORTH_WEST], RAY_MASKS[NORTH_EAST]]}
+
+def sliding_attacks(index: int, occupied: int, kind: str) -> int:
+    """Return the squares a rook or bishop on index attacks given the occupancy.
+    """
+    attacks = 0
+
+    for rays in POSITIVE_RAYS[kind]:
+        ray = rays[index]
+        blockers = ray & occupied
+        if blockers:
+            first = (blockers & -blockers).bit_length() - 1 # Nearest blocker
+            ray ^= rays[first]                              # Cut off everything behind it
+        attacks |= ray
+
+    for rays in NEGATIVE_RAYS[kind]:
+        ray = rays[index]
+        blockers = ray & occupied
+        if blockers:
+            first = blockers.bit_length() - 1 # Nearest blocker
+            ray ^= rays[first]
+        attacks |= ray
+
+    return attacks
+
+def iter_bits(bitboard: int):
+    """Yield the square index of every set bit.
+    """
+    while bitboard:
+        low = bitboard & -bitboard
+        yield low.bit_length() - 1
+        bitboard ^= low
+
+class BitboardBoard(Board):
+    """Board backend that mirrors the position in twelve 64-bit bitboards.
+    """
+    def __init__(self, flyweight: bool = False):
+        """Create an empty board with all bitboards cleared.
+        """
+        self.bitboards = [0] * 12               # One bitboard per (color, piece type)
+        self.occupancy = {WHITE: 0, BLACK: 0}   # All pieces of each color
+        super().__init__(flyweight)
+
+    def copy(self) -> "BitboardBoard":
+        """Return an independent copy of the board, bitboards included.
+        """
+        new_board = super().copy()
+        new_board.bitboards = self.bitboards[:]
+        new_board.occupancy = dict(self.occupancy)
+        return new_board
+
+    def set_piece_at(self, index: int, piece) -> None:
+        """Set the piece at the given square index and update the bitboards.
+        """
+        bit = 1 << index
+        old_piece = self.squares[index]
+
+        if old_piece is not None:
+            self.bitboards[COLOR_OFFSET[old_piece.color] + old_piece.type_code] &= ~bit
+            self.occupancy[old_piece.color] &= ~bit
+
+        if piece is not None:
+            self.bitboards[COLOR_OFFSET[piece.color] + piece.type_code] |= bit
+            self.occupancy[piece.color] |= bit
+
+        super().set_piece_at(index, piece)
+
+    def pieces_of(self, color: str, piece_type: int) -> int:
+        """Return the bitboard of one piece type (PAWN..KING) for a color.
+        """
+        return self.bitboards[COLOR_OFFSET[color] + piece_type]
+
+    @property
+    def occupied(self) -> int:
+        """Return the bitboard of every occupied square.
+        """
+        return self.occupancy[WHITE] | self.occupancy[BLACK]
+
+    def attackers_of(self, target_index: int, attacker_color: str) -> int:
+        """Return the bitboard of attacker_color pieces that attack the target square.
+        """
+        offset = COLOR_OFFSET[attacker_color]
+        bitboards = self.bitboards
+        defender_color = BLACK if attacker_color == WHITE else WHITE
+        occupied = self.occupied
+
+        # Pawns attack the target from where a defender pawn on the target would attack
+        attackers = PAWN_ATTACK_MASKS[defender_color][target_index] & bitboards[offset + PAWN]
+        attackers |= KNIGHT_MASKS[target_index] & bitboards[offset + KNIGHT]
+        attackers |= KING_MASKS[target_index] & bitboards[offset + KING]
+
+        queens = bitboards[offset + QUEEN]
+        rook_like = bitboards[offset + ROOK] | queens
+        bishop_like = bitboards[offset + BISHOP] | queens
+
+        if rook_like:
+            attackers |= sliding_attacks(target_index, occupied, "rook") & rook_like
+        if bishop_like:
+            attackers |= sliding_attacks(target_index, occupied, "bishop") & bishop_like
+
+        return attackers
+
+    def is_index_attacked(self, target_index: int, attacker_color: str) -> bool:
+        """Check if the square index is under attack by any piece of the attacker_color.
+        """
+        return self.attackers_of(target_index, attacker_color) != 0
+
+    def _path_is_clear(self, from_index: int, to_index: int) -> bool:
+        """Check that every square strictly between two squares on a line is empty.
+        """
+        return BETWEEN_MASKS[from_index][to_index] & self.occupied == 0
+
+    def pseudo_legal_moves(self, color: str):
+        """Yield Move candidates for the given color using bitboards.
+        """
+        offset = COLOR_OFFSET[color]
+        bitboards = self.bitboards
+        own = self.occupancy[color]
+        enemy = self.occupancy[BLACK if color == WHITE else WHITE]
+        occupied = own | enemy
+        empty = ~occupied & FULL
+
+        # Pawns: pushes onto empty squares, captures onto enemy pieces or the en passant square
+        direction = -8 if color == WHITE else 8
+        start_rank = (0xFF << 48) if color == WHITE else (0xFF << 8)
+        capture_targets = enemy
+        if self.en_passant_index is not None:
+            capture_targets |= 1 << self.en_passant_index
+
+        for from_index in iter_bits(bitboards[offset + PAWN]):
+            to_index = from_index + direction
+            if to_index < 0 or to_index > 63:
+                continue # Unpromoted pawn on the last rank has no moves
+
+            if empty >> to_index & 1:
+                yield from pawn_moves(from_index, to_index)
+                if (start_rank >> from_index & 1) and (empty >> (to_index + direction) & 1):
+                    yield Move(from_index, to_index + direction, None, DOUBLE_PUSH)
+
+            for to_index in iter_bits(PAWN_ATTACK_MASKS[color][from_index] & capture_targets):
+                if enemy >> to_index & 1:
+                    yield from pawn_moves(from_index, to_index, CAPTURE)
+                else:
+                    yield Move(from_index, to_index, None, EN_PASSANT)
+
+        for from_index in iter_bits(bitboards[offset + KNIGHT]):
+            yield from self._moves_to(from_index, KNIGHT_MASKS[from_index] & ~own, enemy)
+
+        for from_index in iter_bits(bitboards[offset + BISHOP] | bitboards[offset + QUEEN]):
+            yield from self._moves_to(from_index, sliding_attacks(from_index, occupied, "bishop") & ~own, enemy)
+
+        for from_index in iter_bits(bitboards[offset + ROOK] | bitboards[offset + QUEEN]):
+            yield from self._moves_to(from_index, sliding_attacks(from_index, occupied, "rook") & ~own, enemy)
+
+        for from_index in iter_bits(bitboards[offset + KING]):
+            yield from self._moves_to(from_index, KING_MASKS[from_index] & ~own, enemy)
+
+            # Castling candidates: the king steps two squares toward a rook
+            if (from_index & 7) == 4 and not self.has_moved_at(from_index):
+                yield Move(from_index, from_index + 2, None, CASTLE)
+                yield Move(from_index, from_index - 2, None, CASTLE)
+
+    @staticmethod
+    def _moves_to(from_index: int, targets: int, enemy: int):
+        """Yield a Move from one square to every square in the targets bitboard.
+        """
+        for to_index in iter_bits(targets):
+            yield Move(from_index, to_index, None, CAPTURE if enemy >> to_index & 1 else QUIET)
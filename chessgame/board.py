@@ -1,33 +1,286 @@
 # Chess Game Board Module
-from chessgame.types import square_to_position, position_to_square
+from chessgame.types import square_to_index, SQUARE_NAMES, SQUARE_INDEX
+from chessgame.move import Move, pawn_moves, CAPTURE, EN_PASSANT, CASTLE, DOUBLE_PUSH
+from chessgame.zobrist import (en_passant_key, PIECE_KEYS, COLOR_CODE_OFFSET, CASTLING_KEYS, BLACK_TO_MOVE_KEY,
+                               WHITE_KINGSIDE, WHITE_QUEENSIDE, BLACK_KINGSIDE, BLACK_QUEENSIDE)
+from chessgame.evaluation import SQUARE_SCORES_MG, SQUARE_SCORES_EG, PHASE_BY_CODE
+from chessgame.fen import set_board_from_fen, board_to_fen
+from chessgame.attacks import (KNIGHT_TARGETS, KING_TARGETS, PAWN_CAPTURES, RAYS, SQUARES_BETWEEN,
+                               ROOK_DIRECTIONS, BISHOP_DIRECTIONS, QUEEN_DIRECTIONS, DIRECTION_TO, BETWEEN_MASKS)
+
+ALL_SQUARES = (1 << 64) - 1 # Check mask when not in check: every destination is allowed
+
+# Game results (as in PGN)
+WHITE_WINS = "1-0"
+BLACK_WINS = "0-1"
+DRAW = "1/2-1/2"
+
+# Squares are stored as indices 0..63 (index = row * 8 + col, a8 = 0, h1 = 63).
+# The algebraic-string methods (get_piece, move_piece, ...) are thin wrappers
+# around the index methods (get_piece_at, move_by_index, ...) used internally.
 
 # ChessBoard Class
 class Board: # ChessBoard 8x8 grid
     """Class representing an 8x8 chess board.
     """
-    def __init__(self):
+    def __init__(self, flyweight: bool = False):
         """Create an 8x8 chess board initialized with None values.
+        With flyweight=True the board holds shared immutable pieces and keeps
+        has_moved itself (see has_moved_at), so pieces carry no per-game state.
         """
-        self.grid = [] # Create an empty board
+        self.squares = [None] * 64 # One entry per square, indexed 0..63
 
-        for r in range(8):            # 8 rows
-            row_list = []             # Create an empty row
-            for c in range(8):        # 8 columns
-                row_list.append(None) # Initialize each square to None
-
-            self.grid.append(row_list) # Add the row to the grid
+        self.flyweight = flyweight
+        self.moved_mask = 0 # Flyweight mode: bit i is set when the piece on square i has moved
 
         # We track en passant target square here if needed.
         # It only happens when a pawn moves two squares from its starting position.
         # An enemy pawn next to it can capture as if it moved only one square.
         # This capture is only allowed immediately on the next move.
-        self.en_passant_target = None # No en passant target square initially
+        self.en_passant_index = None # No en passant target square initially
+
+        # Move counters as in FEN: halfmoves since the last capture or pawn move, and the move number
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+
+        # King squares are tracked as pieces are placed, so find_king is a lookup
+        from chessgame.pieces import WHITE, BLACK
+        self.king_index = {WHITE: None, BLACK: None}
+
+        # Zobrist key of the piece placement, updated by set_piece_at (see zobrist_key)
+        self.placement_key = 0
+        self.pawn_key = 0 # The same for the pawns only (pawn structure cache key)
+
+        # Material + piece-square sums and game phase, updated by set_piece_at (see chessgame.evaluation)
+        self.eval_mg = 0
+        self.eval_eg = 0
+        self.phase = 0
+
+        # Pieces per zobrist piece code, and bishops per square shade (0 = light, 1 = dark),
+        # updated by set_piece_at (see is_insufficient_material)
+        self.piece_counts = [0] * 12
+        self.bishop_shades = [0, 0]
+
+        # Zobrist keys of the positions reached by played moves (move_piece), and how
+        # often each was reached, so repetitions are a dictionary lookup
+        self.position_history = []
+        self.position_counts = {}
+
+        # Pins and checks of the last side asked for (see legality), cleared by set_piece_at
+        self.legality_cache = None
+
+        # Legal moves and check status of the last side asked for, also cleared by set_piece_at:
+        # (color, en passant index, castling rights, moves) and (color, in check)
+        self.legal_moves_cache = None
+        self.check_cache = None
+        self.cache_hits = 0   # Answers served from legal_moves_cache / check_cache
+        self.cache_misses = 0 # Answers that had to be computed
+
+    @property
+    def grid(self) -> tuple[tuple, ...]:
+        """Return the board as 8 rows of 8 squares (row 0 is rank 8).
+        The rows are a read-only snapshot (tuples, so writing to them raises TypeError):
+        every change to the board must go through set_piece_at (or set_piece).
+        """
+        squares = self.squares
+        return tuple(tuple(squares[row * 8:row * 8 + 8]) for row in range(8))
+
+    @property
+    def en_passant_target(self) -> str | None:
+        """Return the en passant target square (e.g. 'd6') or None.
+        """
+        if self.en_passant_index is None:
+            return None
+        return SQUARE_NAMES[self.en_passant_index]
+
+    @en_passant_target.setter
+    def en_passant_target(self, square: str | None) -> None:
+        """Set the en passant target square from a chess square or None.
+        """
+        self.en_passant_index = None if square is None else square_to_index(square)
+
+    @classmethod
+    def from_fen(cls, fen: str, flyweight: bool = False) -> tuple["Board", str]:
+        """Create a board from a FEN. Returns (board, side to move).
+        """
+        board = cls(flyweight)
+        return board, set_board_from_fen(board, fen)
+
+    def set_fen(self, fen: str) -> str:
+        """Replace the position with the one in a FEN and return the side to move.
+        Castling rights are mapped onto has_moved of the kings and rooks.
+        """
+        return set_board_from_fen(self, fen)
+
+    def to_fen(self, turn_color: str) -> str:
+        """Return the FEN of the position with the given side to move.
+        """
+        return board_to_fen(self, turn_color)
+
+    def get_piece_at(self, index: int):
+        """Return the piece at the given square index.
+        """
+        return self.squares[index]
+
+    def set_piece_at(self, index: int, piece) -> None:
+        """Set the piece at the given square index.
+        Every change to the squares goes through here, so it also keeps the king
+        squares, the placement keys and the evaluation sums up to date, and drops
+        the legality, legal move and check caches.
+        """
+        if self.flyweight:
+            piece = self._store_shared(index, piece)
+
+        # Pins, checks and legal moves may have changed
+        self.legality_cache = self.legal_moves_cache = self.check_cache = None
+        old_piece = self.squares[index]
+        if old_piece is not None:
+            code = COLOR_CODE_OFFSET[old_piece.color] + old_piece.type_code
+            self.placement_key ^= PIECE_KEYS[code][index] # XOR the old piece out
+            self.eval_mg -= SQUARE_SCORES_MG[code][index]
+            self.eval_eg -= SQUARE_SCORES_EG[code][index]
+            self.phase -= PHASE_BY_CODE[code]
+            self.piece_counts[code] -= 1
+            if old_piece.type_code == 0:
+                self.pawn_key ^= PIECE_KEYS[code][index]
+            elif old_piece.type_code == 2:
+                self.bishop_shades[((index >> 3) + index) & 1] -= 1
+            elif old_piece.type_code == 5 and self.king_index[old_piece.color] == index:
+                self.king_index[old_piece.color] = None   # King removed from this square
+
+        if piece is not None:
+            code = COLOR_CODE_OFFSET[piece.color] + piece.type_code
+            self.placement_key ^= PIECE_KEYS[code][index] # XOR the new piece in
+            self.eval_mg += SQUARE_SCORES_MG[code][index]
+            self.eval_eg += SQUARE_SCORES_EG[code][index]
+            self.phase += PHASE_BY_CODE[code]
+            self.piece_counts[code] += 1
+            if piece.type_code == 0:
+                self.pawn_key ^= PIECE_KEYS[code][index]
+            elif piece.type_code == 2:
+                self.bishop_shades[((index >> 3) + index) & 1] += 1
+            elif piece.type_code == 5:
+                self.king_index[piece.color] = index      # King placed on this square
+
+        self.squares[index] = piece
+
+    def _store_shared(self, index: int, piece):
+        """Flyweight mode: swap a piece for its shared instance and record its has_moved here.
+        """
+        if piece is not None and piece.has_moved:
+            self.moved_mask |= 1 << index
+        else:
+            self.moved_mask &= ~(1 << index)
+
+        if piece is not None and not piece.is_shared:
+            from chessgame.pieces import shared_piece
+
+            piece = shared_piece(type(piece), piece.color)
+        return piece
+
+    def has_moved_at(self, index: int) -> bool:
+        """Return whether the piece on the given square index has moved.
+        """
+        if self.flyweight:
+            return (self.moved_mask >> index) & 1 == 1
+        return self.squares[index].has_moved
+
+    def set_moved_at(self, index: int, moved: bool) -> None:
+        """Set whether the piece on the given square index has moved.
+        """
+        if self.flyweight:
+            if moved:
+                self.moved_mask |= 1 << index
+            else:
+                self.moved_mask &= ~(1 << index)
+        else:
+            self.squares[index].has_moved = moved
+
+    def new_piece(self, piece_class, color: str):
+        """Create a piece for this board: a fresh one, or the shared one in flyweight mode.
+        """
+        from chessgame.pieces import shared_piece
+
+        if self.flyweight:
+            return shared_piece(piece_class, color)
+        return piece_class(color)
+
+    def copy(self) -> "Board":
+        """Return an independent copy of the board.
+        In flyweight mode the pieces are shared, so this is just a list copy.
+        The caches are shared too: cached entries are never changed, only replaced.
+        """
+        new_board = self.__class__.__new__(self.__class__)
+        new_board.__dict__.update(self.__dict__)
+        new_board.king_index = dict(self.king_index)
+        new_board.piece_counts = self.piece_counts[:]
+        new_board.bishop_shades = self.bishop_shades[:]
+        new_board.position_history = self.position_history[:]
+        new_board.position_counts = dict(self.position_counts)
+
+        if self.flyweight:
+            new_board.squares = self.squares[:]
+        else:
+            new_board.squares = [None if piece is None else piece.copy() for piece in self.squares]
+
+        return new_board
+
+    def clear(self) -> None:
+        """Remove every piece and reset the en passant target, move counters and position history.
+        """
+        for index in range(64):
+            if self.squares[index] is not None:
+                self.set_piece_at(index, None)
+
+        self.en_passant_index = None
+        self.halfmove_clock = 0
+        self.fullmove_number = 1
+        self.position_history = []
+        self.position_counts = {}
+
+    def castling_rights(self) -> int:
+        """Return the castling rights as bits (see chessgame.zobrist), derived from has_moved.
+        A side keeps a right while its king and that rook are unmoved on their home squares.
+        """
+        from chessgame.pieces import King, Rook, WHITE, BLACK
+
+        rights = 0
+        squares = self.squares
+
+        for color, king_square, rights_and_rooks in (
+            (WHITE, 60, ((WHITE_KINGSIDE, 63), (WHITE_QUEENSIDE, 56))),
+            (BLACK, 4, ((BLACK_KINGSIDE, 7), (BLACK_QUEENSIDE, 0))),
+        ):
+            king = squares[king_square]
+            if king is None or king.color != color or not isinstance(king, King) or self.has_moved_at(king_square):
+                continue
+
+            for right, rook_square in rights_and_rooks:
+                rook = squares[rook_square]
+                if (rook is not None and rook.color == color and isinstance(rook, Rook)
+                        and not self.has_moved_at(rook_square)):
+                    rights |= right
+
+        return rights
+
+    def zobrist_key(self, color: str) -> int:
+        """Return the 64-bit Zobrist key of the position with the given side to move.
+        It covers piece placement, side to move, castling rights and the en passant target.
+        """
+        from chessgame.pieces import BLACK
+
+        key = self.placement_key ^ CASTLING_KEYS[self.castling_rights()]
+        if self.en_passant_index is not None:
+            key ^= en_passant_key(self, color)
+        if color == BLACK:
+            key ^= BLACK_TO_MOVE_KEY
+
+        return key
 
     def get_piece(self, square: str):
         """Return the piece at the given chess square.
         """
-        row, col = square_to_position(square)  # Convert square to (row, col)
-        return self.grid[row][col]             # Return the piece at that position
+        return self.squares[square_to_index(square)] # Return the piece at that position
 
     def is_empty(self, square: str) -> bool:
         """Check if the given chess square is empty.
@@ -38,208 +291,473 @@ class Board: # ChessBoard 8x8 grid
         """Check if the piece at the given square belongs to the opponent.
         """
         piece = self.get_piece(square)         # Get the piece at the square
-        
+
         if piece is None:                      # If no piece is present
             return False                       # Return False
-        
+
         return piece.color != color            # Return True if colors differ
-    
+
+    def find_king_index(self, color: str) -> int | None:
+        """Find the square index of the king of the given color.
+        """
+        return self.king_index[color] # None if the king is not on the board
+
     def find_king(self, color: str) -> str | None:
         """Find the square of the king of the given color.
         """
-        from chessgame.pieces import King # Import here to avoid circular imports
-
-        for row in range(8):         # Go through each row
-            for col in range(8):     # Go through each column
-                piece = self.grid[row][col]
-                
-                if piece is not None and isinstance(piece, King) and piece.color == color:
-                    return position_to_square((row, col)) # Return the square of the king
-        
-        return None # King not found 
+        index = self.find_king_index(color)
+        return None if index is None else SQUARE_NAMES[index]
 
     def try_move_no_turn_switch(self, from_square: str, to_square: str, turn_color: str) -> bool:
         """Try to move a piece from one square to another without switching turns.
         Returns True if the move was successful, False otherwise.
         """
-        if from_square == to_square: # Cannot move to the same square
-            return False
-        
-        from_piece = self.get_piece(from_square)
-        if from_piece is None or from_piece.color != turn_color:
-            return False # No piece to move or not the player's piece
-        
-        to_piece_before = self.get_piece(to_square)
-        if to_piece_before is not None and to_piece_before.color == turn_color:
-            return False # Cannot capture own piece
-        
-        # Save current state to restore later
-        old_has_moved = from_piece.has_moved           # Save current has_moved status
-        old_en_passant_target = self.en_passant_target # Save current en passant target
-        
-         # Track possible en passant capture removal so we can restore it
-        captured_ep_square = None
-        captured_ep_piece = None
-
-        from chessgame.pieces import Pawn, King, WHITE
-
-        # If this try-move is an en passant capture, the captured pawn is NOT on to_square.
-        # It sits behind the target square at (from_row, to_col).
-        if isinstance(from_piece, Pawn):
-            from_row, from_col = square_to_position(from_square)
-            to_row, to_col = square_to_position(to_square)
-
-            if from_col != to_col and to_piece_before is None and old_en_passant_target == to_square:
-                captured_ep_square = position_to_square((from_row, to_col))
-                captured_ep_piece = self.get_piece(captured_ep_square)
-
-        # Track castling rook movement so we can undo it too
-        castling = False
-        rook_square = None
-        rook_to_square = None
-        old_rook_has_moved = None
-
-        if isinstance(from_piece, King):
-            from_row, from_col = square_to_position(from_square)
-            to_row, to_col = square_to_position(to_square)
-            
-            if from_row == to_row and abs(to_col - from_col) == 2:
-                castling = True
-                kingside = to_col > from_col
+        return self.try_move_by_index(square_to_index(from_square), square_to_index(to_square), turn_color)
 
-                if turn_color == WHITE:
-                    rook_square = "h1" if kingside else "a1"
-                    rook_to_square = "f1" if kingside else "d1"
-                else:
-                    rook_square = "h8" if kingside else "a8"
-                    rook_to_square = "f8" if kingside else "d8"
-
-                # We don't yet know if castle succeeds, so we also save the rook at original square now:
-                rook_at_start = self.get_piece(rook_square)
-                if rook_at_start is not None:
-                    old_rook_has_moved = rook_at_start.has_moved
-
-        moved = self.move_piece(from_square, to_square, turn_color)
-        if not moved:
-            from_piece.has_moved = old_has_moved           # Restore has_moved status
-            self.en_passant_target = old_en_passant_target # Restore en passant target
-            return False                                   # Move was not successful
-        
-        # Save rook AFTER move 
-        rook_after = None
-        if castling and rook_to_square is not None:
-            rook_after = self.get_piece(rook_to_square)
-
-        self.set_piece(from_square, from_piece) # Undo the move
-        self.set_piece(to_square, to_piece_before)     # Restore captured piece if any
-
-        # If en passant capture removed a pawn, restore it
-        if captured_ep_square is not None:
-            self.set_piece(captured_ep_square, captured_ep_piece)
-
-        # If castling happened, restore rook back to its original square
-        if castling and rook_square is not None and rook_to_square is not None and rook_after is not None:
-            self.set_piece(rook_square, rook_after)
-            self.set_piece(rook_to_square, None)
-             # Restore rook has_moved if we saved it
-            if old_rook_has_moved is not None:
-                rook_after.has_moved = old_rook_has_moved
-
-        from_piece.has_moved = old_has_moved           # Restore has_moved status
-        self.en_passant_target = old_en_passant_target # Restore en passant target
-
-        return True # Move was successful
+    def try_move_by_index(self, from_index: int, to_index: int, turn_color: str) -> bool:
+        """Index version of try_move_no_turn_switch: the board is left unchanged.
+        """
+        if not self.follows_move_rules(from_index, to_index, turn_color):
+            return False # Not a valid move for this piece
 
-    def has_any_legal_move(self, color: str) -> bool:
-        """Check if the player of the given color has any legal moves.
+        return self.is_legal_move(from_index, to_index, turn_color)
+
+    def is_legal_move(self, from_index: int, to_index: int, turn_color: str) -> bool:
+        """Check that a move which follows the piece rules does not leave the own king in check.
+        Uses the pins and checks of the position (see legality), so the board is left unchanged.
         """
-        for from_row in range(8):         # Go through each row
-            for from_col in range(8):     # Go through each column
-                piece = self.grid[from_row][from_col]
-                if piece is None or piece.color != color:
-                    continue # No piece or not player's piece
+        from chessgame.pieces import Pawn, King
 
-                from_square = position_to_square((from_row, from_col))
+        piece = self.squares[from_index]
+        flags = 0
 
-                for to_row in range(8):       # Go through each row for destination
-                    for to_col in range(8):   # Go through each column for destination
-                        to_square = position_to_square((to_row, to_col))
+        if isinstance(piece, King) and abs(to_index - from_index) == 2:
+            flags = CASTLE
+        elif isinstance(piece, Pawn) and (from_index & 7) != (to_index & 7) and self.squares[to_index] is None:
+            flags = EN_PASSANT
 
-                        if self.try_move_no_turn_switch(from_square, to_square, color):
-                            return True # Found a legal move
+        return self.is_legal_candidate(Move(from_index, to_index, None, flags), turn_color)
 
-        return False # No legal moves found
+    def legality(self, color: str) -> "LegalityInfo":
+        """Return the pins and checks against the king of the given color.
+        They are computed once per position and kept until the next set_piece_at.
+        """
+        info = self.legality_cache
+        if info is None or info.color != color:
+            info = self.legality_cache = self._compute_legality(color)
+        return info
 
-    def is_square_under_attack(self, target_square: str, attacker_color: str) -> bool:
-        """Check if the target square is under attack by any piece of the attacker_color.
+    def _compute_legality(self, color: str) -> "LegalityInfo":
+        """Walk outward from the king once to find the checking pieces and the pinned pieces.
         """
-        from chessgame.pieces import Pawn, Rook, Bishop, Knight, Queen, King, WHITE, BLACK
+        from chessgame.pieces import WHITE, BLACK
 
-        # Determine which color is attacking
-        target_row, target_col = square_to_position(target_square)
-
-        for r in range(8):                        # Go through each row
-            for c in range(8):                    # Go through each column
-                piece = self.grid[r][c]           # Get the piece at (r, c)
-                if piece is None:                 # No piece present
-                    continue                      # Skip to next square
-                if piece.color != attacker_color: # Not an attacking piece
-                    continue                      # Skip to next square
-
-                # Pawn attacks are special: only diagonals (not forward)
-                if isinstance(piece, Pawn):
-                    direction = -1 if piece.color == WHITE else 1      # White pawns go up, black pawns go down
-                    col_diff = target_col - c                          # Calculate column difference
-                    if col_diff < 0:                                   # If the column difference is negative
-                        col_diff = -col_diff                           # Make it positive
-
-                    if target_row == r + direction and col_diff == 1:
-                        return True
+        info = LegalityInfo()
+        info.color = color
+        info.king_index = king_index = self.king_index[color]
+        info.checkers = checkers = []
+        info.pins = pins = {}
+
+        if king_index is None:
+            info.check_mask = ALL_SQUARES # No king, nothing to protect
+            return info
+
+        squares = self.squares
+        opponent = BLACK if color == WHITE else WHITE
+
+        # Pawns and knights can only give check, never pin
+        for index in PAWN_CAPTURES[color][king_index]:
+            piece = squares[index]
+            if piece is not None and piece.color == opponent and piece.type_code == 0:
+                checkers.append(index)
+        for index in KNIGHT_TARGETS[king_index]:
+            piece = squares[index]
+            if piece is not None and piece.color == opponent and piece.type_code == 1:
+                checkers.append(index)
+
+        # Sliding pieces: the first piece on a ray may give check; an own piece
+        # followed by an enemy slider on the same ray is pinned to the king
+        rays = RAYS[king_index]
+        for direction in QUEEN_DIRECTIONS:
+            slider = 3 if direction in ROOK_DIRECTIONS else 2 # Rook or bishop type code (queens: 4)
+            pinned = None
+            for index in rays[direction]:
+                piece = squares[index]
+                if piece is None:
                     continue
-
-                # Knight + King attacks are just their shape rules
-                if isinstance(piece, Knight) or isinstance(piece, King):
-                    if piece.can_move(r, c, target_row, target_col):
-                        return True
+                if piece.color == color:
+                    if pinned is not None:
+                        break # Two own pieces: no pin
+                    pinned = index
                     continue
+                if piece.type_code == slider or piece.type_code == 4:
+                    if pinned is None:
+                        checkers.append(index)
+                    else:
+                        pins[pinned] = BETWEEN_MASKS[king_index][index] | 1 << index
+                break # First enemy piece ends the ray
+
+        # Out of a single check: capture the checker or block between it and the king
+        if not checkers:
+            info.check_mask = ALL_SQUARES
+        elif len(checkers) == 1:
+            info.check_mask = BETWEEN_MASKS[king_index][checkers[0]] | 1 << checkers[0]
+        else:
+            info.check_mask = 0 # Double check: only the king can move
 
-                # Sliding pieces (rook/bishop/queen) need clear path
-                if isinstance(piece, Rook) or isinstance(piece, Bishop) or isinstance(piece, Queen):
-                    if not piece.can_move(r, c, target_row, target_col):
-                        continue
+        return info
 
-                    dr = target_row - r
-                    dc = target_col - c
+    def is_legal_candidate(self, move: Move, color: str, info: "LegalityInfo | None" = None) -> bool:
+        """Check that a pseudo_legal_moves candidate does not leave the own king in check.
+        Pass info (from legality) when the board changes between calls, e.g. in a search loop.
+        Only king steps and en passant look at the board beyond the pins and the check mask.
+        """
+        from_index = move.from_index
+        to_index = move.to_index
+
+        if move.flags & CASTLE:
+            # Castling has its own rules (not out of, through or into check)
+            return self.can_castle_by_index(from_index, to_index, color)
+
+        if info is None:
+            info = self.legality(color)
+
+        if from_index == info.king_index:
+            return self._king_step_is_safe(from_index, to_index, info)
+
+        if move.flags & EN_PASSANT:
+            # Two pawns leave the rank at once, which can uncover a check: play it to see
+            cache = self.legality_cache
+            undo = self.make_move(move)
+            in_check = self.is_in_check(color)
+            self.unmake_move(undo)
+            self.legality_cache = cache # The position is the same again
+            return not in_check
+
+        if not info.check_mask >> to_index & 1:
+            return False # Does not answer the check
+        pin = info.pins.get(from_index)
+        return pin is None or pin >> to_index & 1 == 1 # A pinned piece stays on its pin ray
+
+    def _king_step_is_safe(self, from_index: int, to_index: int, info: "LegalityInfo") -> bool:
+        """Check that the king can step to a square: it is not attacked, and it is not
+        further along the line of a sliding piece giving check (the king does not block it).
+        """
+        from chessgame.pieces import WHITE, BLACK
 
-                    step_row = 0 if dr == 0 else (1 if dr > 0 else -1)
-                    step_col = 0 if dc == 0 else (1 if dc > 0 else -1)
+        squares = self.squares
+        direction = DIRECTION_TO[from_index][to_index]
+        for checker in info.checkers:
+            if squares[checker].type_code >= 2 and DIRECTION_TO[checker][from_index] == direction:
+                return False
 
-                    cur_row = r + step_row
-                    cur_col = c + step_col
+        return not self.is_index_attacked(to_index, BLACK if info.color == WHITE else WHITE)
 
-                    while cur_row != target_row or cur_col != target_col:
-                        # Check if any piece blocks the path
-                        if self.grid[cur_row][cur_col] is not None:
-                            break
-                        cur_row += step_row
-                        cur_col += step_col
-                    else: # The while loop ended normally no break => no blocking
-                        return True
+    def make_move(self, move: Move) -> "UndoRecord":
+        """Play a move without any legality check and return a record to undo it.
+        Castling moves the rook too and en passant removes the captured pawn.
+        Without a promotion choice a pawn on the last rank stays a pawn until
+        promote_pawn is called.
+        """
+        from chessgame.pieces import Pawn, King, BLACK
+
+        from_index = move.from_index
+        to_index = move.to_index
+        promotion = move.promotion
+
+        squares = self.squares
+        piece = squares[from_index]
+
+        undo = UndoRecord()
+        undo.from_index = from_index
+        undo.to_index = to_index
+        undo.piece = piece
+        undo.piece_has_moved = self.has_moved_at(from_index)
+        undo.captured_index = to_index
+        undo.captured_piece = squares[to_index]
+        undo.captured_has_moved = undo.captured_piece is not None and self.has_moved_at(to_index)
+        undo.en_passant_index = self.en_passant_index
+        undo.halfmove_clock = self.halfmove_clock
+        undo.rook_from_index = None
+        undo.rook_to_index = None
+        undo.rook_has_moved = False
+
+        # Reset by default: en passant target only exists for ONE move after a pawn double-step
+        self.en_passant_index = None
+
+        # Move counters: a capture or pawn move resets the halfmove clock, black's move ends a full move
+        if undo.captured_piece is not None or isinstance(piece, Pawn):
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
+        if piece.color == BLACK:
+            self.fullmove_number += 1
+
+        if isinstance(piece, Pawn):
+            if (from_index & 7) != (to_index & 7) and undo.captured_piece is None:
+                # En passant: the captured pawn sits behind the target square at (from_row, to_col)
+                undo.captured_index = (from_index & ~7) | (to_index & 7)
+                undo.captured_piece = squares[undo.captured_index]
+                undo.captured_has_moved = self.has_moved_at(undo.captured_index)
+                self.set_piece_at(undo.captured_index, None)
+            elif abs(to_index - from_index) == 16:
+                # Double step: the square in between can be captured en passant on the next move
+                self.en_passant_index = (from_index + to_index) // 2
+
+        elif isinstance(piece, King) and abs(to_index - from_index) == 2:
+            # Castling: the rook jumps to the square the king passed over
+            kingside = to_index > from_index
+            undo.rook_from_index = (from_index & ~7) | (7 if kingside else 0)
+            undo.rook_to_index = from_index + 1 if kingside else from_index - 1
+
+            rook = squares[undo.rook_from_index]
+            undo.rook_has_moved = self.has_moved_at(undo.rook_from_index)
+            self.set_piece_at(undo.rook_to_index, rook)
+            self.set_piece_at(undo.rook_from_index, None)
+            self.set_moved_at(undo.rook_to_index, True)
+
+        self.set_piece_at(from_index, None)
+
+        if promotion is not None:
+            self.set_piece_at(to_index, promotion_piece(piece.color, promotion, self.flyweight))
+        else:
+            self.set_piece_at(to_index, piece)
+
+        self.set_moved_at(to_index, True) # Mark piece as having moved
+
+        return undo
+
+    def unmake_move(self, undo: "UndoRecord") -> None:
+        """Take back a move played with make_move, restoring exactly what it changed.
+        """
+        from chessgame.pieces import BLACK
+
+        piece = undo.piece
+
+        # Put the moving piece back (this also removes a promoted piece)
+        self.set_piece_at(undo.to_index, None)
+        self.set_piece_at(undo.from_index, piece)
+        self.set_moved_at(undo.from_index, undo.piece_has_moved)
+
+        # Restore the captured piece (on the target square or behind it for en passant)
+        if undo.captured_piece is not None:
+            self.set_piece_at(undo.captured_index, undo.captured_piece)
+            if self.flyweight:
+                self.set_moved_at(undo.captured_index, undo.captured_has_moved)
+
+        # Put a castling rook back on its corner
+        if undo.rook_from_index is not None:
+            rook = self.squares[undo.rook_to_index]
+            self.set_piece_at(undo.rook_to_index, None)
+            self.set_piece_at(undo.rook_from_index, rook)
+            self.set_moved_at(undo.rook_from_index, undo.rook_has_moved)
+
+        self.en_passant_index = undo.en_passant_index
+        self.halfmove_clock = undo.halfmove_clock
+        if piece.color == BLACK:
+            self.fullmove_number -= 1
+
+    def pseudo_legal_moves(self, color: str):
+        """Yield Move candidates for the given color.
+        Candidates follow each piece's move pattern but may leave the king in check.
+        """
+        from chessgame.pieces import Pawn, Knight, Bishop, Rook, Queen, King, WHITE
+
+        squares = self.squares
+        en_passant_index = self.en_passant_index
+        pawn_captures = PAWN_CAPTURES[color]
+
+        for from_index in range(64):
+            piece = squares[from_index]
+            if piece is None or piece.color != color:
+                continue # No piece or not player's piece
+
+            if isinstance(piece, Pawn):
+                direction = -8 if color == WHITE else 8 # White pawns go up, black pawns go down
+                start_row = 6 if color == WHITE else 1
+                to_index = from_index + direction
+
+                if to_index < 0 or to_index > 63:
+                    continue # Unpromoted pawn on the last rank has no moves
+
+                # Forward steps only onto empty squares
+                if squares[to_index] is None:
+                    yield from pawn_moves(from_index, to_index)
+
+                    if (from_index >> 3) == start_row and squares[to_index + direction] is None:
+                        yield Move(from_index, to_index + direction, None, DOUBLE_PUSH)
+
+                # Diagonal captures, including en passant
+                for to_index in pawn_captures[from_index]:
+                    target = squares[to_index]
+                    if target is not None and target.color != color:
+                        yield from pawn_moves(from_index, to_index, CAPTURE)
+                    elif target is None and to_index == en_passant_index:
+                        yield Move(from_index, to_index, None, EN_PASSANT)
+                continue
+
+            if isinstance(piece, Knight) or isinstance(piece, King):
+                targets = KNIGHT_TARGETS if isinstance(piece, Knight) else KING_TARGETS
+                for to_index in targets[from_index]:
+                    target = squares[to_index]
+                    if target is None:
+                        yield Move(from_index, to_index)
+                    elif target.color != color:
+                        yield Move(from_index, to_index, None, CAPTURE)
+
+                # Castling candidates: the king steps two squares toward a rook
+                if isinstance(piece, King) and (from_index & 7) == 4 and not self.has_moved_at(from_index):
+                    yield Move(from_index, from_index + 2, None, CASTLE)
+                    yield Move(from_index, from_index - 2, None, CASTLE)
+                continue
+
+            # Sliding pieces walk each ray until the first blocker
+            if isinstance(piece, Rook):
+                directions = ROOK_DIRECTIONS
+            elif isinstance(piece, Bishop):
+                directions = BISHOP_DIRECTIONS
+            elif isinstance(piece, Queen):
+                directions = QUEEN_DIRECTIONS
+            else:
+                continue
+
+            rays = RAYS[from_index]
+            for direction in directions:
+                for to_index in rays[direction]:
+                    target = squares[to_index]
+                    if target is None:
+                        yield Move(from_index, to_index)
+                    else:
+                        if target.color != color:
+                            yield Move(from_index, to_index, None, CAPTURE)
+                        break # Blocked
+
+    def generate_legal_moves(self, color: str) -> list[Move]:
+        """Return every legal move for the given color.
+        A pawn reaching the last rank gives one move per promotion choice.
+        The list is cached for the position (see legal_moves_cache); callers get their own copy.
+        """
+        en_passant_index = self.en_passant_index
+        rights = self.castling_rights() # Can change without set_piece_at (has_moved set directly)
+
+        cache = self.legal_moves_cache
+        if cache is not None and cache[0] == color and cache[1] == en_passant_index and cache[2] == rights:
+            self.cache_hits += 1
+            return list(cache[3])
+
+        self.cache_misses += 1
+        moves = tuple(self._legal_moves(color))
+        self.legal_moves_cache = (color, en_passant_index, rights, moves)
+        return list(moves)
+
+    def has_any_legal_move(self, color: str) -> bool:
+        """Check if the player of the given color has any legal moves.
+        The move list is generated once and cached, so the checkmate, stalemate
+        and game result checks of one position share it.
+        """
+        return len(self.generate_legal_moves(color)) > 0
+
+    def _legal_moves(self, color: str):
+        """Yield the legal moves of a color: pseudo-legal candidates filtered with the pins
+        and checks of the position, without making any move.
+        """
+        info = self.legality(color)
+        check_mask = info.check_mask
+        pins = info.pins
+        king_index = info.king_index
+
+        for move in self.pseudo_legal_moves(color):
+            to_index = move.to_index
+            from_index = move.from_index
+            if from_index == king_index or move.flags & (CASTLE | EN_PASSANT):
+                if self.is_legal_candidate(move, color, info):
+                    yield move
+            elif check_mask >> to_index & 1 and (from_index not in pins or pins[from_index] >> to_index & 1):
+                yield move
+
+    def is_square_under_attack(self, target_square: str, attacker_color: str) -> bool:
+        """Check if the target square is under attack by any piece of the attacker_color.
+        """
+        return self.is_index_attacked(square_to_index(target_square), attacker_color)
+
+    def is_index_attacked(self, target_index: int, attacker_color: str) -> bool:
+        """Check if the square index is under attack by any piece of the attacker_color.
+        We look outward from the target square instead of scanning every enemy piece.
+        """
+        from chessgame.pieces import Pawn, Rook, Bishop, Knight, Queen, King, WHITE, BLACK
+
+        squares = self.squares
+
+        # Pawns: an attacking pawn stands where a defending pawn on the target would capture
+        defender_color = BLACK if attacker_color == WHITE else WHITE
+        for index in PAWN_CAPTURES[defender_color][target_index]:
+            piece = squares[index]
+            if piece is not None and piece.color == attacker_color and isinstance(piece, Pawn):
+                return True
+
+        # Knights: one knight jump away from the target
+        for index in KNIGHT_TARGETS[target_index]:
+            piece = squares[index]
+            if piece is not None and piece.color == attacker_color and isinstance(piece, Knight):
+                return True
+
+        # King: one square away from the target
+        for index in KING_TARGETS[target_index]:
+            piece = squares[index]
+            if piece is not None and piece.color == attacker_color and isinstance(piece, King):
+                return True
+
+        # Sliding pieces: walk each ray and stop at the first piece
+        rays = RAYS[target_index]
+        for direction in QUEEN_DIRECTIONS:
+            slider = Rook if direction in ROOK_DIRECTIONS else Bishop
+            for index in rays[direction]:
+                piece = squares[index]
+                if piece is None:
+                    continue # Keep walking
+                if piece.color == attacker_color and (isinstance(piece, slider) or isinstance(piece, Queen)):
+                    return True
+                break # First blocker is not an attacker
 
         return False
 
+    def _path_is_clear(self, from_index: int, to_index: int) -> bool:
+        """Check that every square strictly between two squares on a line is empty.
+        """
+        squares = self.squares
+        for index in SQUARES_BETWEEN[from_index][to_index]:
+            if squares[index] is not None:
+                return False # Blocked
+
+        return True
+
     def is_in_check(self, color: str) -> bool:
         """Check if the king of the given color is in check.
+        The answer is cached for the position (see check_cache).
         """
         from chessgame.pieces import WHITE, BLACK
 
-        king_square = self.find_king(color) # Find the king's square
+        cache = self.check_cache
+        if cache is not None and cache[0] == color:
+            self.cache_hits += 1
+            return cache[1]
+        self.cache_misses += 1
+
+        king_index = self.find_king_index(color) # Find the king's square
+
+        if king_index is None:                   # If king not found
+            in_check = False                     # Cannot be in check
+        else:
+            opponent_color = BLACK if color == WHITE else WHITE
+            in_check = self.is_index_attacked(king_index, opponent_color)
 
-        if king_square is None:             # If king not found
-            return False                    # Cannot be in check
+        self.check_cache = (color, in_check)
+        return in_check
 
-        opponent_color = BLACK if color == WHITE else WHITE
-        return self.is_square_under_attack(king_square, opponent_color)
+    def cache_stats(self) -> dict[str, int]:
+        """Return the hits and misses of the legal move and check caches.
+        """
+        return {"hits": self.cache_hits, "misses": self.cache_misses}
 
     def is_checkmate(self, color: str) -> bool:
         """Check if the player of the given color is in checkmate.
@@ -263,17 +781,95 @@ class Board: # ChessBoard 8x8 grid
 
         return True # Not in check and no legal moves => stalemate
 
+    def record_position(self, color: str) -> None:
+        """Add the current position (with color to move) to the position history.
+        move_piece does this after every move it plays.
+        """
+        key = self.zobrist_key(color)
+        self.position_history.append(key)
+        self.position_counts[key] = self.position_counts.get(key, 0) + 1
+
+    def repetition_count(self) -> int:
+        """Return how many times the current position has occurred in the position history.
+        """
+        if not self.position_history:
+            return 1
+        return self.position_counts[self.position_history[-1]]
+
+    def is_threefold_repetition(self) -> bool:
+        """Check if the current position has occurred three times (a draw can be claimed).
+        """
+        return self.repetition_count() >= 3
+
+    def is_fivefold_repetition(self) -> bool:
+        """Check if the current position has occurred five times (an automatic draw).
+        """
+        return self.repetition_count() >= 5
+
+    def is_fifty_move_rule(self) -> bool:
+        """Check if 50 moves by each side passed without a capture or pawn move (a draw can be claimed).
+        """
+        return self.halfmove_clock >= 100
+
+    def is_seventy_five_move_rule(self) -> bool:
+        """Check if 75 moves by each side passed without a capture or pawn move (an automatic draw).
+        """
+        return self.halfmove_clock >= 150
+
+    def is_insufficient_material(self) -> bool:
+        """Check if neither side has the material to checkmate: bare kings, a single
+        knight or bishop, or only bishops that all stand on squares of one shade.
+        """
+        counts = self.piece_counts
+
+        # Pawns, rooks and queens (zobrist codes of both colors) can always mate
+        if counts[0] or counts[3] or counts[4] or counts[6] or counts[9] or counts[10]:
+            return False
+
+        knights = counts[1] + counts[7]
+        bishops = counts[2] + counts[8]
+        if knights + bishops <= 1:
+            return True
+        return knights == 0 and (self.bishop_shades[0] == 0 or self.bishop_shades[1] == 0)
+
+    def game_result(self, color: str, claim_draw: bool = False) -> tuple[str, str] | None:
+        """Return (result, reason) if the game is over with color to move, otherwise None.
+        The result is WHITE_WINS, BLACK_WINS or DRAW. Checkmate and stalemate come first,
+        then the automatic draws (insufficient material, fivefold repetition, 75-move rule).
+        With claim_draw=True a threefold repetition or the 50-move rule also ends the game.
+        """
+        from chessgame.pieces import WHITE
+
+        if not self.has_any_legal_move(color):
+            if self.is_in_check(color):
+                return (BLACK_WINS if color == WHITE else WHITE_WINS), "checkmate"
+            return DRAW, "stalemate"
+
+        if self.is_insufficient_material():
+            return DRAW, "insufficient material"
+        if self.is_fivefold_repetition():
+            return DRAW, "fivefold repetition"
+        if self.is_seventy_five_move_rule():
+            return DRAW, "75-move rule"
+
+        if claim_draw:
+            if self.is_threefold_repetition():
+                return DRAW, "threefold repetition"
+            if self.is_fifty_move_rule():
+                return DRAW, "50-move rule"
+
+        return None
+
     def set_piece(self, square: str, piece) -> None:
         """Set the piece at the given chess square.
         """
-        row, col = square_to_position(square)  # Convert square to (row, col)
-        self.grid[row][col] = piece            # Set the piece at that position
+        self.set_piece_at(square_to_index(square), piece) # Set the piece at that position
 
     def print_board(self) -> None:
         """Print the current state of the chess board.
         """
         # Print column letters which we start with 2 spaces so it aligns with the rows
-        print("  a b c d e f g h") 
+        print("  a b c d e f g h")
 
         # Print each row and go through each row index
         for row in range(8):
@@ -281,8 +877,8 @@ class Board: # ChessBoard 8x8 grid
             line = str(rank) + " " # Start the line with the rank number
 
             for col in range(8): # Go through each column index (0 to 7)
-                piece = self.grid[row][col]
-                
+                piece = self.squares[row * 8 + col]
+
                 if piece is None:
                     line += ". "
                 else: # Otherwise print the piece
@@ -299,339 +895,299 @@ class Board: # ChessBoard 8x8 grid
 
         # Pawns
         for file in ["a", "b", "c", "d", "e", "f", "g", "h"]:
-            self.set_piece(file + "2", Pawn(WHITE))
-            self.set_piece(file + "7", Pawn(BLACK))
+            self.set_piece(file + "2", self.new_piece(Pawn, WHITE))
+            self.set_piece(file + "7", self.new_piece(Pawn, BLACK))
 
         # White back rank
-        self.set_piece("a1", Rook(WHITE))
-        self.set_piece("b1", Knight(WHITE))
-        self.set_piece("c1", Bishop(WHITE))
-        self.set_piece("d1", Queen(WHITE))
-        self.set_piece("e1", King(WHITE))
-        self.set_piece("f1", Bishop(WHITE))
-        self.set_piece("g1", Knight(WHITE))
-        self.set_piece("h1", Rook(WHITE))
+        self.set_piece("a1", self.new_piece(Rook, WHITE))
+        self.set_piece("b1", self.new_piece(Knight, WHITE))
+        self.set_piece("c1", self.new_piece(Bishop, WHITE))
+        self.set_piece("d1", self.new_piece(Queen, WHITE))
+        self.set_piece("e1", self.new_piece(King, WHITE))
+        self.set_piece("f1", self.new_piece(Bishop, WHITE))
+        self.set_piece("g1", self.new_piece(Knight, WHITE))
+        self.set_piece("h1", self.new_piece(Rook, WHITE))
 
         # Black back rank
-        self.set_piece("a8", Rook(BLACK))
-        self.set_piece("b8", Knight(BLACK))
-        self.set_piece("c8", Bishop(BLACK))
-        self.set_piece("d8", Queen(BLACK))
-        self.set_piece("e8", King(BLACK))
-        self.set_piece("f8", Bishop(BLACK))
-        self.set_piece("g8", Knight(BLACK))
-        self.set_piece("h8", Rook(BLACK))
+        self.set_piece("a8", self.new_piece(Rook, BLACK))
+        self.set_piece("b8", self.new_piece(Knight, BLACK))
+        self.set_piece("c8", self.new_piece(Bishop, BLACK))
+        self.set_piece("d8", self.new_piece(Queen, BLACK))
+        self.set_piece("e8", self.new_piece(King, BLACK))
+        self.set_piece("f8", self.new_piece(Bishop, BLACK))
+        self.set_piece("g8", self.new_piece(Knight, BLACK))
+        self.set_piece("h8", self.new_piece(Rook, BLACK))
 
     def try_castle(self, from_square: str, to_square: str, turn_color: str) -> bool:
         """Attempt to castle (king moves 2 squares).
         Returns True if castling is legal and performed, otherwise False.
         """
+        return self.castle_by_index(square_to_index(from_square), square_to_index(to_square), turn_color)
+
+    def castle_by_index(self, from_index: int, to_index: int, turn_color: str) -> bool:
+        """Index version of try_castle.
+        """
+        if not self.can_castle_by_index(from_index, to_index, turn_color):
+            return False
+
+        self.make_move(Move(from_index, to_index)) # Moves the rook too
+        return True
+
+    def can_castle_by_index(self, from_index: int, to_index: int, turn_color: str) -> bool:
+        """Check every castling rule for a king move of two squares, without moving anything.
+        """
         from chessgame.pieces import King, Rook, WHITE, BLACK
 
-        king = self.get_piece(from_square)
+        king = self.squares[from_index]
         if king is None or not isinstance(king, King) or king.color != turn_color:
             return False
 
         # King must not have moved
-        if king.has_moved:
+        if self.has_moved_at(from_index):
             return False
 
-        from_row, from_col = square_to_position(from_square)
-        to_row, to_col = square_to_position(to_square)
-
         # Must be same row and exactly 2 columns
-        if from_row != to_row or abs(to_col - from_col) != 2:
-            return False
-
-        # King cannot castle out of check
-        if self.is_in_check(turn_color):
+        if (from_index >> 3) != (to_index >> 3) or abs(to_index - from_index) != 2:
             return False
 
         # Determine side
-        kingside = to_col > from_col
+        kingside = to_index > from_index
 
         # Rook square and squares between
         if turn_color == WHITE:
-            rook_square = "h1" if kingside else "a1"
-            king_path_squares = ["f1", "g1"] if kingside else ["d1", "c1"]
-            between_squares = ["f1", "g1"] if kingside else ["b1", "c1", "d1"]
-            rook_to_square = "f1" if kingside else "d1"
+            rook_index = SQUARE_INDEX["h1"] if kingside else SQUARE_INDEX["a1"]
         else:
-            rook_square = "h8" if kingside else "a8"
-            king_path_squares = ["f8", "g8"] if kingside else ["d8", "c8"]
-            between_squares = ["f8", "g8"] if kingside else ["b8", "c8", "d8"]
-            rook_to_square = "f8" if kingside else "d8"
+            rook_index = SQUARE_INDEX["h8"] if kingside else SQUARE_INDEX["a8"]
 
-        rook = self.get_piece(rook_square)
+        if (rook_index >> 3) != (from_index >> 3):
+            return False # King is not on its home rank
+
+        if kingside:
+            king_path = [from_index + 1, from_index + 2]
+            between = [from_index + 1, from_index + 2]
+        else:
+            king_path = [from_index - 1, from_index - 2]
+            between = [from_index - 1, from_index - 2, from_index - 3]
+
+        rook = self.squares[rook_index]
         if rook is None or not isinstance(rook, Rook) or rook.color != turn_color:
             return False
 
         # Rook must not have moved
-        if rook.has_moved:
+        if self.has_moved_at(rook_index):
             return False
 
         # Squares between king and rook must be empty
-        for sq in between_squares:
-            if self.get_piece(sq) is not None:
+        for index in between:
+            if self.squares[index] is not None:
                 return False
 
+        # King cannot castle out of check
+        if self.is_in_check(turn_color):
+            return False
+
         # Squares the king passes through (and destination) must not be under attack
         opponent_color = BLACK if turn_color == WHITE else WHITE
 
-        for sq in king_path_squares:
-            if self.is_square_under_attack(sq, opponent_color):
+        for index in king_path:
+            if self.is_index_attacked(index, opponent_color):
                 return False
 
-        # Perform castling
-        self.set_piece(to_square, king)
-        self.set_piece(from_square, None)
+        return True
 
-        self.set_piece(rook_to_square, rook)
-        self.set_piece(rook_square, None)
+    def move_piece(self, from_square: str, to_square: str, turn_color: str) -> bool:
+        """Move a piece from one square to another, if it belongs to the current player's color.
+        Returns True if the move was successful, False otherwise."""
+        return self.move_by_index(square_to_index(from_square), square_to_index(to_square), turn_color)
 
-        # Safety undo if still in check
-        if self.is_in_check(turn_color):
-            self.set_piece(from_square, king)
-            self.set_piece(to_square, None)
-            self.set_piece(rook_square, rook)
-            self.set_piece(rook_to_square, None)
-            return False
+    def play_move(self, move: Move, turn_color: str) -> bool:
+        """Validate a Move for the given color and perform it, including its promotion.
+        Returns True if the move was successful, False otherwise."""
+        from chessgame.pieces import Pawn
 
-        # Mark both as moved
-        king.has_moved = True
-        rook.has_moved = True
+        if move.promotion is not None:
+            piece = self.squares[move.from_index]
+            if piece is None or not isinstance(piece, Pawn) or not (move.to_index < 8 or move.to_index > 55):
+                return False # Only a pawn reaching the last rank can promote
 
-        return True
+        return self.move_by_index(move.from_index, move.to_index, turn_color, move.promotion)
 
-    def move_piece(self, from_square: str, to_square: str, turn_color: str) -> bool:
-        """Move a piece from one square to another, if it belongs to the current player's color.
+    def move_by_index(self, from_index: int, to_index: int, turn_color: str, promotion: str | None = None) -> bool:
+        """Index version of move_piece: validate the move and perform it.
+        A promotion choice is applied before the new position is recorded.
         Returns True if the move was successful, False otherwise."""
-        piece = self.get_piece(from_square) # Get the piece at the source square
-        
-        from chessgame.pieces import King, Pawn, Queen, Knight, WHITE, BLACK
-        
+        from chessgame.pieces import King, WHITE, BLACK
+
+        if not self.follows_move_rules(from_index, to_index, turn_color):
+            return False # Move not allowed by piece rules
+
+        piece = self.squares[from_index]
+
+        if not self.position_history:
+            self.record_position(turn_color) # The position before the first played move
+
+        # Handle castling separately (because king.can_move doesn't allow 2 squares)
+        if isinstance(piece, King) and abs(to_index - from_index) == 2:
+            if not self.castle_by_index(from_index, to_index, turn_color):
+                return False
+        else:
+            # Check against the pins and checks of the position, then make the move
+            if not self.is_legal_move(from_index, to_index, turn_color):
+                return False
+            self.make_move(Move(from_index, to_index, promotion))
+
+        self.record_position(BLACK if turn_color == WHITE else WHITE)
+        return True # Move completed successfully
+
+    def follows_move_rules(self, from_index: int, to_index: int, turn_color: str) -> bool:
+        """Check the movement rules of the piece on from_index, without moving anything.
+        Whether the move leaves the own king in check is checked by is_legal_move.
+        """
+        squares = self.squares
+        piece = squares[from_index] # Get the piece at the source square
+
+        from chessgame.pieces import King, Pawn, Rook, Bishop, Queen
+
         if piece is None: # Must be a piece to move
             return False  # No piece to move
-        
+
         if piece.color != turn_color: # Check if the piece belongs to the current player
             return False              # Cannot move opponent's piece
 
-        from_row, from_col = square_to_position(from_square)
-        to_row, to_col = square_to_position(to_square)
+        if from_index == to_index: # Cannot move to the same square
+            return False
 
-        # Save en passant state from previous move   
-        old_en_passant_target = self.en_passant_target
-        
-        # Reset by default: en passant target only exists for ONE move after a pawn double-step
-        self.en_passant_target = None
+        from_row, from_col = from_index >> 3, from_index & 7
+        to_row, to_col = to_index >> 3, to_index & 7
 
-        # Helper: any failed move must restore old en passant target
-        def fail() -> bool:
-            self.en_passant_target = old_en_passant_target
-            return False
-        
-        # Handle castling BEFORE normal can_move check (because king.can_move doesn't allow 2 squares)
+        # Castling is checked BEFORE normal can_move (because king.can_move doesn't allow 2 squares)
         if isinstance(piece, King):
             if from_row == to_row and abs(to_col - from_col) == 2:
-                if self.try_castle(from_square, to_square, turn_color):
-                    return True
-                return fail()
-    
+                return self.can_castle_by_index(from_index, to_index, turn_color)
+
         # Check if the piece can move according to its movement rules
         if not piece.can_move(from_row, from_col, to_row, to_col):
-            return fail() # Move not allowed by piece rules
+            return False # Move not allowed by piece rules
 
-        if isinstance(piece, Pawn):
-            target_piece = self.get_piece(to_square) # Get the piece at the destination square
+        # What is currently on the destination square
+        target_piece = squares[to_index]
 
-            if from_col == to_col: # Moving forward 
+        if isinstance(piece, Pawn):
+            if from_col == to_col: # Moving forward
                 if target_piece is not None:
-                    return fail() # Cannot move forward to an occupied square
-               
+                    return False # Cannot move forward to an occupied square
+
                 # Check if the square in between is empty
                 if abs(to_row - from_row) == 2: # Double move
-                    middle_row = (from_row + to_row) // 2
-                    middle_square = position_to_square((middle_row, from_col))
-                    
-                    if self.get_piece(middle_square) is not None:
-                        return fail() # Cannot jump over a piece
-
-                    # Store the square that can be captured via en passant on the next move
-                    self.en_passant_target = middle_square 
+                    if squares[(from_index + to_index) // 2] is not None:
+                        return False # Cannot jump over a piece
 
             else: # Capturing diagonally
                 if target_piece is None:
                     # Allow en passant only if landing square equals previous target
-                    if old_en_passant_target != to_square:
-                        return fail() # Cannot move diagonally without capturing
+                    if self.en_passant_index != to_index:
+                        return False # Cannot move diagonally without capturing
+
+                    # Captured pawn is on the same rank the capturing pawn started from
+                    # and must be an opponent pawn
+                    victim = squares[from_row * 8 + to_col]
+                    if victim is None or not isinstance(victim, Pawn) or victim.color == piece.color:
+                        return False
                 else:
                     if target_piece.color == piece.color:
-                        return fail() # Cannot capture own piece
-
-        # Check for Rook movement blocking
-        if piece.__class__.__name__ == "Rook":
-            # Determine direction of movement (step_row, step_col)
-            if from_row == to_row:
-                step_row = 0
-                step_col = 1 if to_col > from_col else -1
-            else:
-                step_col = 0
-                step_row = 1 if to_row > from_row else -1
-
-            # Walk squares between start and destination 
-            cur_row = from_row + step_row
-            cur_col = from_col + step_col
-
-            while (cur_row, cur_col) != (to_row, to_col):
-                middle_square = position_to_square((cur_row, cur_col))
-                if self.get_piece(middle_square) is not None:
-                    return fail()  # blocked
-
-                cur_row += step_row
-                cur_col += step_col
-
-            # Final square cannot capture your own piece
-            target_piece = self.get_piece(to_square)
-            if target_piece is not None and target_piece.color == piece.color:
-                return fail()
-        
-        if isinstance(piece, Knight): # Knight movement
-            target_piece = self.get_piece(to_square)
-            if target_piece is not None and target_piece.color == piece.color:
-                return fail()
-
-        # Check for Bishop movement blocking
-        if piece.__class__.__name__ == "Bishop":
-            step_row = 1 if to_row > from_row else -1
-            step_col = 1 if to_col > from_col else -1
-
-            cur_row = from_row + step_row
-            cur_col = from_col + step_col
-
-            # Walk diagonally until destination 
-            while cur_row != to_row or cur_col != to_col:
-                middle_square = position_to_square((cur_row, cur_col))
-
-                if self.get_piece(middle_square) is not None:
-                    return fail()  # blocked
-
-                cur_row += step_row
-                cur_col += step_col
-
-            # Destination cannot capture your own piece
-            target_piece = self.get_piece(to_square)
-            if target_piece is not None and target_piece.color == piece.color:
-                return fail()
-            
-        # Queen movement blocking  
-        if isinstance(piece, Queen):
-            delta_row = to_row - from_row
-            delta_col = to_col - from_col
-
-            # Determine direction of movement
-            step_row = 0 if delta_row == 0 else (1 if delta_row > 0 else -1)
-            step_col = 0 if delta_col == 0 else (1 if delta_col > 0 else -1)
-
-            # Walk squares between start and destination
-            cur_row = from_row + step_row
-            cur_col = from_col + step_col
-
-            # Walk squares between start and destination
-            while (cur_row, cur_col) != (to_row, to_col):
-                middle_square = position_to_square((cur_row, cur_col))
-                if self.get_piece(middle_square) is not None:
-                    return fail()  # blocked
-
-                # Move to next square in the path
-                cur_row += step_row
-                cur_col += step_col
-
-            # Final square cannot capture your own piece
-            target_piece = self.get_piece(to_square)
-            if target_piece is not None and target_piece.color == piece.color:
-                return fail()
-
-        # King normal move: cannot capture your own piece (castling already handled above)
-        if isinstance(piece, King):
-            target_piece = self.get_piece(to_square)
-            if target_piece is not None and target_piece.color == piece.color:
-                return fail()
-    
-        # # Variables to track a potential en passant capture so we can undo it if the move is illegal     
-        captured_en_passant_square = None
-        captured_en_passant_piece = None
-
-        # Save what is currently on the destination square 
-        captured_piece = self.get_piece(to_square)
-
-        # If this is an en passant capture, remove the pawn behind the target square
-        if isinstance(piece, Pawn) and from_col != to_col and captured_piece is None and old_en_passant_target == to_square:
-            # Captured pawn is on the same rank the capturing pawn started from
-            captured_en_passant_square = position_to_square((from_row, to_col))
-            captured_en_passant_piece = self.get_piece(captured_en_passant_square)
-
-            # Must exist and must be opponent pawn
-            if (captured_en_passant_piece is None 
-                or not isinstance(captured_en_passant_piece, Pawn)
-                or captured_en_passant_piece.color == piece.color
-            ):
-                return fail()
-
-            # Remove it temporarily (like a capture)
-            self.set_piece(captured_en_passant_square, None)
-
-        # Make the move temporarily
-        self.set_piece(to_square, piece)
-        self.set_piece(from_square, None)
-
-        # Illegal if it leaves your king in check
-        if self.is_in_check(turn_color):
-            # Undo the normal move
-            self.set_piece(from_square, piece) 
-            self.set_piece(to_square, captured_piece)
-            
-            # Restore en passant captured pawn if we removed one
-            if captured_en_passant_square is not None:
-                self.set_piece(captured_en_passant_square, captured_en_passant_piece)
-            
-            return fail()
+                        return False # Cannot capture own piece
 
-        piece.has_moved = True # Mark piece as having moved
+            return True
 
-        # Get the piece that just moved to the destination square
-        moved_piece = self.get_piece(to_square)
+        # Sliding pieces (rook/bishop/queen) cannot jump over other pieces
+        if isinstance(piece, Rook) or isinstance(piece, Bishop) or isinstance(piece, Queen):
+            if not self._path_is_clear(from_index, to_index):
+                return False # blocked
 
-        return True # Move completed successfully
-    
-    def promote_pawn(self, square: str, choice: str) -> bool:
+        # Rooks, knights, bishops, queens and kings cannot capture their own pieces
+        if target_piece is not None and target_piece.color == piece.color:
+            return False
+
+        return True
+
+    def promote_pawn(self, square, choice: str | None = None) -> bool:
         """
         Promote a pawn on the given square.
         Our choice: 'Q', 'R', 'B', 'N'. Defaults to Queen.
+        Also accepts a Move, promoting on its destination to its promotion choice.
         Returns True if promotion happened, False otherwise.
         """
-        from chessgame.pieces import Pawn, Queen, Rook, Bishop, Knight
+        from chessgame.pieces import Pawn
+
+        if isinstance(square, Move):
+            index = square.to_index
+            choice = square.promotion
+        else:
+            index = square_to_index(square)
+
+        if choice is None:
+            choice = "Q"
 
-        piece = self.get_piece(square)
+        piece = self.squares[index]
         if piece is None or not isinstance(piece, Pawn):
             return False
 
         # Must be on last rank
         if not (
-            (piece.color == "white" and square[1] == "8") or
-            (piece.color == "black" and square[1] == "1")
+            (piece.color == "white" and index < 8) or
+            (piece.color == "black" and index >= 56)
         ):
             return False
 
-        c = choice.strip().upper()
+        new_piece = promotion_piece(piece.color, choice, self.flyweight)
+        self.set_piece_at(index, new_piece)
 
-        if c == "R":
-            new_piece = Rook(piece.color)
-        elif c == "B":
-            new_piece = Bishop(piece.color)
-        elif c == "N":
-            new_piece = Knight(piece.color)
-        else:
-            new_piece = Queen(piece.color) # default
+        return True
+
+class UndoRecord:
+    """Everything make_move changed, so unmake_move can restore it exactly.
+    """
+    __slots__ = ("from_index", "to_index", "piece", "piece_has_moved",
+                 "captured_index", "captured_piece", "captured_has_moved", "en_passant_index", "halfmove_clock",
+                 "rook_from_index", "rook_to_index", "rook_has_moved")
+
+class LegalityInfo:
+    """Pins and checks against one king in one position (see Board.legality).
+    check_mask: squares a non-king move must land on (all squares when not in check,
+    the checker and the squares in between for one check, none for a double check).
+    pins: pinned square index -> the squares it may move to (its pin ray up to the pinner).
+    """
+    __slots__ = ("color", "king_index", "checkers", "check_mask", "pins")
+
+def promotion_piece(color: str, choice: str, shared: bool = False):
+    """Create the piece a pawn promotes to (the shared instance if shared=True).
+    Our choice: 'Q', 'R', 'B', 'N'. Defaults to Queen.
+    """
+    from chessgame.pieces import Queen, Rook, Bishop, Knight, shared_piece
+
+    c = choice.strip().upper()
+
+    if c == "R":
+        piece_class = Rook
+    elif c == "B":
+        piece_class = Bishop
+    elif c == "N":
+        piece_class = Knight
+    else:
+        piece_class = Queen # default
+
+    return shared_piece(piece_class, color) if shared else piece_class(color)
+
+def create_board(backend: str = "list", flyweight: bool = False) -> Board:
+    """Create an empty board with the chosen backend.
+    'list' is the plain square list, 'bitboard' adds bitboards for fast attack queries.
+    flyweight=True makes the board use shared immutable pieces (see Board.__init__).
+    """
+    if backend == "list":
+        return Board(flyweight)
+
+    if backend == "bitboard":
+        from chessgame.bitboard import BitboardBoard # Import here to avoid circular imports
+        return BitboardBoard(flyweight)
 
-        self.set_piece(square, new_piece)
-        return True
\ No newline at end of file
+    raise ValueError(f"Unknown board backend: {backend}")
@@ -0,0 +1,410 @@
+# Chess Engine: Alpha-Beta Search
+#
+# The engine picks a move by searching the tree of positions reached through
+# Board.make_move / unmake_move. It uses negamax with alpha-beta pruning: a
+# score is always from the point of view of the side to move, and a branch is
+# cut as soon as it is proven worse than an alternative already found.
+#
+# Iterative deepening searches depth 1, 2, 3, ... until the budget runs out.
+# Each finished depth gives a best move, and the best move of the last depth
+# is searched first in the next one, which makes the cutoffs much better.
+# Within a node the moves are ordered: captures first (most valuable victim,
+# least valuable attacker), then killer moves (quiet moves that caused a cutoff
+# at the same ply) and then quiet moves by their history score. The best move
+# stored in the transposition table for a position always goes first.
+import time
+
+from chessgame.pieces import WHITE, BLACK
+from chessgame.move import Move, CAPTURE, EN_PASSANT, CASTLE
+from chessgame.transposition import TranspositionTable, EXACT, LOWER_BOUND, UPPER_BOUND
+from chessgame.evaluation import evaluate, PIECE_VALUES
+
+OPPONENT = {WHITE: BLACK, BLACK: WHITE}
+
+PROMOTION_VALUES = {None: 0, "N": 320, "B": 330, "R": 500, "Q": 900}
+
+MATE_SCORE = 100000 # Mate in n plies scores MATE_SCORE - n
+INFINITY = 1000000
+MAX_PLY = 64
+
+CHECK_EVERY = 1024 # Nodes between two looks at the clock
+DEFAULT_TABLE_MB = 16
+
+class SearchLimits:
+    """The budget of one search. Any limit left as None is not used.
+    depth is in plies, movetime in seconds and nodes counts visited positions.
+    """
+    __slots__ = ("depth", "movetime", "nodes")
+
+    def __init__(self, depth: int | None = None, movetime: float | None = None, nodes: int | None = None):
+        """Create search limits; with no limit at all the search stops after depth 4.
+        """
+        if depth is None and movetime is None and nodes is None:
+            depth = 4
+
+        self.depth = depth
+        self.movetime = movetime
+        self.nodes = nodes
+
+    def __repr__(self) -> str:
+        """Return a readable representation of the limits.
+        """
+        return f"SearchLimits(depth={self.depth}, movetime={self.movetime}, nodes={self.nodes})"
+
+class SearchResult:
+    """What a search found: best move, score (centipawns, side to move), depth and node count.
+    pv is the expected line of play starting with the best move.
+    """
+    __slots__ = ("move", "score", "depth", "nodes", "elapsed", "pv")
+
+    def __init__(self, move: Move | None, score: int, depth: int, nodes: int, elapsed: float,
+                 pv: list[Move] | None = None):
+        """Create a search result.
+        """
+        self.move = move
+        self.score = score
+        self.depth = depth
+        self.nodes = nodes
+        self.elapsed = elapsed
+        self.pv = pv if pv is not None else ([] if move is None else [move])
+
+    def __repr__(self) -> str:
+        """Return a readable representation of the result.
+        """
+        return (f"SearchResult(move={self.move!r}, score={self.score}, depth={self.depth}, "
+                f"nodes={self.nodes})")
+
+NO_KILLERS = (None, None)
+
+def order_moves(board, moves: list[Move], table_move: Move | None = None, killers=NO_KILLERS,
+                history: list[list[int]] | None = None) -> None:
+    """Sort moves in place: table move, captures by MVV-LVA, promotions, killers, then history.
+    killers are two quiet moves and history[from][to] a score for quiet moves (both optional).
+    """
+    squares = board.squares
+
+    def move_score(move: Move) -> int:
+        if move == table_move:
+            return 2000000
+        if move.flags & (CAPTURE | EN_PASSANT):
+            victim = squares[move.to_index]
+            victim_value = PIECE_VALUES[0] if victim is None else PIECE_VALUES[victim.type_code]
+            attacker_value = PIECE_VALUES[squares[move.from_index].type_code]
+            return 1000000 + victim_value * 10 - attacker_value // 10 + PROMOTION_VALUES[move.promotion]
+        if move.promotion is not None:
+            return 900000 + PROMOTION_VALUES[move.promotion]
+        if move == killers[0]:
+            return 800000
+        if move == killers[1]:
+            return 700000
+        return 0 if history is None else history[move.from_index][move.to_index]
+
+    moves.sort(key=move_score, reverse=True)
+
+class SearchAborted(Exception):
+    """Raised inside the search when the budget runs out."""
+
+class Searcher:
+    """Negamax alpha-beta search over one Board.
+    The transposition, killer and history tables are kept between searches on the
+    same object, so reusing a Searcher for the moves of one game helps the ordering.
+    """
+    def __init__(self, board, table: TranspositionTable | None = None):
+        """Create a searcher for the given board (with a new 16 MB table if none is given).
+        """
+        self.board = board
+        self.table = table if table is not None else TranspositionTable(DEFAULT_TABLE_MB)
+        self.killers = [[None, None] for _ in range(MAX_PLY)]     # Two killer moves per ply
+        self.history = {WHITE: [[0] * 64 for _ in range(64)],    # history[color][from][to]
+                        BLACK: [[0] * 64 for _ in range(64)]}
+        self.nodes = 0
+        self.stopped = False
+        self.deadline = None
+        self.node_limit = None
+        self.path = set() # Keys of the positions from the root to the current node
+        self.on_iteration = None # Optional callback(SearchResult) after each finished depth
+
+    def stop(self) -> None:
+        """Ask a running search to stop as soon as possible (safe from another thread).
+        A stop that comes just before the search starts is kept, so it is not lost in a race.
+        """
+        self.stopped = True
+
+    def search(self, color: str, limits: SearchLimits | None = None,
+               root_moves: list[Move] | None = None) -> SearchResult:
+        """Search the position with color to move and return the best move found.
+        root_moves limits the search to some of the legal moves (used by the parallel search).
+        The board is left exactly as it was.
+        """
+        try:
+            return self._search(color, limits, root_moves)
+        finally:
+            self.stopped = False # The stop request is used up
+
+    def _search(self, color: str, limits: SearchLimits | None, root_moves: list[Move] | None) -> SearchResult:
+        """Iterative deepening for search (see there).
+        """
+        if limits is None:
+            limits = SearchLimits()
+
+        start = time.perf_counter()
+        self.nodes = 0
+        self.deadline = None if limits.movetime is None else start + limits.movetime
+        self.node_limit = limits.nodes
+        for killers in self.killers:
+            killers[0] = killers[1] = None
+        self.path = {self.board.zobrist_key(color)}
+
+        legal_moves = self.board.generate_legal_moves(color)
+        if root_moves is None:
+            root_moves = legal_moves
+        else:
+            root_moves = [move for move in legal_moves if move in root_moves] # Keep the generator's flags
+        if not legal_moves:
+            score = -MATE_SCORE if self.board.is_in_check(color) else 0
+            return SearchResult(None, score, 0, 0, time.perf_counter() - start)
+        if not root_moves:
+            raise ValueError("None of the given root moves is legal")
+
+        self._order_moves(root_moves, color, 0)
+        best = SearchResult(root_moves[0], 0, 0, 0, 0.0) # Something to play even if depth 1 is cut short
+        max_depth = MAX_PLY - 1 if limits.depth is None else min(limits.depth, MAX_PLY - 1)
+
+        for depth in range(1, max_depth + 1):
+            try:
+                move, score = self._search_root(root_moves, color, depth)
+            except SearchAborted:
+                break
+
+            best = SearchResult(move, score, depth, self.nodes, time.perf_counter() - start,
+                                self._principal_variation(move, color, depth))
+            if self.on_iteration is not None:
+                self.on_iteration(best)
+
+            # Search the best move first next time
+            root_moves.remove(move)
+            root_moves.insert(0, move)
+
+            if abs(score) >= MATE_SCORE - MAX_PLY:
+                break # A forced mate was found, deeper searches cannot improve it
+
+        best.nodes = self.nodes
+        best.elapsed = time.perf_counter() - start
+        return best
+
+    def _search_root(self, root_moves: list[Move], color: str, depth: int) -> tuple[Move, int]:
+        """Search every root move to the given depth and return the best one with its score.
+        """
+        board = self.board
+        opponent = OPPONENT[color]
+        alpha = -INFINITY
+        best_move = root_moves[0]
+
+        for move in root_moves:
+            undo = board.make_move(move)
+            try:
+                score = -self._negamax(depth - 1, -INFINITY, -alpha, opponent, 1)
+            finally:
+                board.unmake_move(undo)
+
+            if score > alpha:
+                alpha = score
+                best_move = move
+
+        self.table.store(board.zobrist_key(color), depth, alpha, EXACT, best_move)
+        return best_move, alpha
+
+    def _principal_variation(self, move: Move, color: str, depth: int) -> list[Move]:
+        """Follow the best moves stored in the table from the root to build the expected line.
+        """
+        board = self.board
+        pv = [move]
+        undos = [board.make_move(move)]
+        seen = set()
+
+        try:
+            while len(pv) < depth:
+                color = OPPONENT[color]
+                key = board.zobrist_key(color)
+                entry = self.table.probe(key)
+                if entry is None or entry.move is None or key in seen:
+                    break
+                if entry.move not in board.generate_legal_moves(color):
+                    break # Another position's move (key collision)
+
+                seen.add(key)
+                pv.append(entry.move)
+                undos.append(board.make_move(entry.move))
+        finally:
+            for undo in reversed(undos):
+                board.unmake_move(undo)
+
+        return pv
+
+    def _negamax(self, depth: int, alpha: int, beta: int, color: str, ply: int) -> int:
+        """Return the score of the position for color, searched to the given depth.
+        """
+        self._count_node()
+
+        if depth <= 0 or ply >= MAX_PLY - 1:
+            return self._quiesce(alpha, beta, color, ply)
+
+        board = self.board
+        table = self.table
+        key = board.zobrist_key(color)
+        original_alpha = alpha
+
+        # A position seen before (in the game or on this line) or the 50-move rule is a draw
+        if key in self.path or key in board.position_counts or board.halfmove_clock >= 100:
+            return 0
+
+        entry = table.probe(key)
+        table_move = None
+        if entry is not None:
+            table_move = entry.move
+            if entry.depth >= depth:
+                score = _score_from_table(entry.score, ply)
+                if entry.bound == EXACT:
+                    return score
+                if entry.bound == LOWER_BOUND and score > alpha:
+                    alpha = score
+                elif entry.bound == UPPER_BOUND and score < beta:
+                    beta = score
+                if alpha >= beta:
+                    return score
+
+        opponent = OPPONENT[color]
+        moves = list(board.pseudo_legal_moves(color))
+        self._order_moves(moves, color, ply, table_move)
+
+        legal_moves = 0
+        best_score = -INFINITY
+        best_move = None
+        self.path.add(key)
+
+        for move in moves:
+            if move.flags & CASTLE and not board.can_castle_by_index(move.from_index, move.to_index, color):
+                continue
+
+            undo = board.make_move(move)
+            try:
+                if board.is_in_check(color):
+                    continue # Leaves the own king in check
+                legal_moves += 1
+                score = -self._negamax(depth - 1, -beta, -alpha, opponent, ply + 1)
+            finally:
+                board.unmake_move(undo)
+
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        if not move.flags & (CAPTURE | EN_PASSANT):
+                            self._store_quiet_cutoff(move, color, depth, ply)
+                        break
+
+        self.path.discard(key)
+        if legal_moves == 0:
+            return -(MATE_SCORE - ply) if board.is_in_check(color) else 0 # Mated or stalemate
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        table.store(key, depth, _score_to_table(best_score, ply), bound,
+                    best_move if bound != UPPER_BOUND else None)
+
+        return best_score
+
+    def _quiesce(self, alpha: int, beta: int, color: str, ply: int) -> int:
+        """Search captures and queen promotions only, so the evaluation is not taken
+        in the middle of an exchange.
+        """
+        board = self.board
+        stand_pat = evaluate(board, color)
+        if stand_pat >= beta or ply >= MAX_PLY - 1:
+            return stand_pat
+        if stand_pat > alpha:
+            alpha = stand_pat
+
+        opponent = OPPONENT[color]
+        moves = [move for move in board.pseudo_legal_moves(color)
+                 if move.flags & (CAPTURE | EN_PASSANT) or move.promotion == "Q"]
+        self._order_moves(moves, color, ply)
+
+        for move in moves:
+            self._count_node()
+
+            undo = board.make_move(move)
+            try:
+                if board.is_in_check(color):
+                    continue
+                score = -self._quiesce(-beta, -alpha, opponent, ply + 1)
+            finally:
+                board.unmake_move(undo)
+
+            if score > alpha:
+                alpha = score
+                if alpha >= beta:
+                    break
+
+        return alpha
+
+    def _order_moves(self, moves: list[Move], color: str, ply: int, table_move: Move | None = None) -> None:
+        """Sort moves in place with this searcher's killers and history (see order_moves).
+        """
+        order_moves(self.board, moves, table_move, self.killers[ply], self.history[color])
+
+    def _store_quiet_cutoff(self, move: Move, color: str, depth: int, ply: int) -> None:
+        """Remember a quiet move that caused a cutoff as a killer and in the history table.
+        """
+        killers = self.killers[ply]
+        if move != killers[0]:
+            killers[1] = killers[0]
+            killers[0] = move
+
+        self.history[color][move.from_index][move.to_index] += depth * depth
+
+    def _count_node(self) -> None:
+        """Count a node and stop the search when the budget is used up.
+        """
+        self.nodes += 1
+
+        if self.stopped:
+            raise SearchAborted
+        if self.node_limit is not None and self.nodes >= self.node_limit:
+            raise SearchAborted
+        if self.deadline is not None and self.nodes % CHECK_EVERY == 0 and time.perf_counter() >= self.deadline:
+            raise SearchAborted
+
+def _score_to_table(score: int, ply: int) -> int:
+    """Store mate scores as distance from this position instead of from the root.
+    """
+    if score >= MATE_SCORE - MAX_PLY:
+        return score + ply
+    if score <= -(MATE_SCORE - MAX_PLY):
+        return score - ply
+    return score
+
+def _score_from_table(score: int, ply: int) -> int:
+    """Turn a stored mate score back into a distance from the root.
+    """
+    if score >= MATE_SCORE - MAX_PLY:
+        return score - ply
+    if score <= -(MATE_SCORE - MAX_PLY):
+        return score + ply
+    return score
+
+def search(board, color: str, limits: SearchLimits | None = None) -> SearchResult:
+    """Search the position with a fresh Searcher and return the full result.
+    """
+    return Searcher(board).search(color, limits)
+
+def best_move(board, color: str, limits: SearchLimits | None = None) -> Move | None:
+    """Return the best move the engine finds for color, or None if there is no legal move.
+    """
+    return search(board, color, limits).move
@@ -0,0 +1,278 @@
+# Static Evaluation
+#
+# The evaluation scores a position in centipawns from the point of view of a
+# side: material, piece-square tables (where each piece likes to stand), pawn
+# structure and king safety.
+#
+# Material and piece-square values are summed per (piece, square), so the Board
+# keeps their total up to date in set_piece_at (eval_mg, eval_eg and phase)
+# and a leaf never has to walk the 64 squares for them. There are two sums: a
+# middlegame and an endgame one, blended by the game phase (how much non-pawn
+# material is left), because a king wants shelter early and activity late.
+# Pawn structure only changes when pawns move, so it is cached by pawn_key.
+#
+# Tables are written from white's side with a8 first, matching square indices.
+# Black uses the same tables mirrored top to bottom (index ^ 56).
+#
+# evaluate_many scores a list of positions in one call. With numpy installed
+# the blending runs as array operations from chessgame.batch_eval; without it
+# the scores come from a plain loop. Both give exactly the scores of evaluate.
+from chessgame.pieces import WHITE, BLACK
+from chessgame.zobrist import COLOR_CODE_OFFSET
+
+try:
+    import numpy
+except ImportError:
+    numpy = None # Optional: evaluate_many falls back to a loop
+
+# Piece values in centipawns, indexed by Piece.type_code (pawn..king)
+PIECE_VALUES = [100, 320, 330, 500, 900, 0]
+ENDGAME_VALUES = [120, 300, 320, 520, 920, 0]
+
+# Game phase weight per piece type: 24 with all pieces on the board, 0 with only pawns and kings
+PHASE_VALUES = [0, 1, 1, 2, 4, 0]
+MAX_PHASE = 24
+
+PAWN_TABLE = [
+      0,   0,   0,   0,   0,   0,   0,   0,
+     50,  50,  50,  50,  50,  50,  50,  50,
+     10,  10,  20,  30,  30,  20,  10,  10,
+      5,   5,  10,  25,  25,  10,   5,   5,
+      0,   0,   0,  20,  20,   0,   0,   0,
+      5,  -5, -10,   0,   0, -10,  -5,   5,
+      5,  10,  10, -20, -20,  10,  10,   5,
+      0,   0,   0,   0,   0,   0,   0,   0,
+]
+
+KNIGHT_TABLE = [
+    -50, -40, -30, -30, -30, -30, -40, -50,
+    -40, -20,   0,   0,   0,   0, -20, -40,
+    -30,   0,  10,  15,  15,  10,   0, -30,
+    -30,   5,  15,  20,  20,  15,   5, -30,
+    -30,   0,  15,  20,  20,  15,   0, -30,
+    -30,   5,  10,  15,  15,  10,   5, -30,
+    -40, -20,   0,   5,   5,   0, -20, -40,
+    -50, -40, -30, -30, -30, -30, -40, -50,
+]
+
+BISHOP_TABLE = [
+    -20, -10, -10, -10, -10, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,  10,  10,   5,   0, -10,
+    -10,   5,   5,  10,  10,   5,   5, -10,
+    -10,   0,  10,  10,  10,  10,   0, -10,
+    -10,  10,  10,  10,  10,  10,  10, -10,
+    -10,   5,   0,   0,   0,   0,   5, -10,
+    -20, -10, -10, -10, -10, -10, -10, -20,
+]
+
+ROOK_TABLE = [
+      0,   0,   0,   0,   0,   0,   0,   0,
+      5,  10,  10,  10,  10,  10,  10,   5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+     -5,   0,   0,   0,   0,   0,   0,  -5,
+      0,   0,   0,   5,   5,   0,   0,   0,
+]
+
+QUEEN_TABLE = [
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+    -10,   0,   0,   0,   0,   0,   0, -10,
+    -10,   0,   5,   5,   5,   5,   0, -10,
+     -5,   0,   5,   5,   5,   5,   0,  -5,
+      0,   0,   5,   5,   5,   5,   0,  -5,
+    -10,   5,   5,   5,   5,   5,   0, -10,
+    -10,   0,   5,   0,   0,   0,   0, -10,
+    -20, -10, -10,  -5,  -5, -10, -10, -20,
+]
+
+KING_MIDDLEGAME_TABLE = [
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -30, -40, -40, -50, -50, -40, -40, -30,
+    -20, -30, -30, -40, -40, -30, -30, -20,
+    -10, -20, -20, -20, -20, -20, -20, -10,
+     20,  20,   0,   0,   0,   0,  20,  20,
+     20,  30,  10,   0,   0,  10,  30,  20,
+]
+
+KING_ENDGAME_TABLE = [
+    -50, -40, -30, -20, -20, -30, -40, -50,
+    -30, -20, -10,   0,   0, -10, -20, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  30,  40,  40,  30, -10, -30,
+    -30, -10,  20,  30,  30,  20, -10, -30,
+    -30, -30,   0,   0,   0,   0, -30, -30,
+    -50, -30, -30, -30, -30, -30, -30, -50,
+]
+
+MIDDLEGAME_TABLES = [PAWN_TABLE, KNIGHT_TABLE, BISHOP_TABLE, ROOK_TABLE, QUEEN_TABLE, KING_MIDDLEGAME_TABLE]
+ENDGAME_TABLES = [PAWN_TABLE, KNIGHT_TABLE, BISHOP_TABLE, ROOK_TABLE, QUEEN_TABLE, KING_ENDGAME_TABLE]
+
+def _signed_tables(values: list[int], tables: list[list[int]]) -> list[list[int]]:
+    """Build value + table per zobrist piece code 0..11, positive for white and negative for black.
+    """
+    signed = []
+    for color_sign, mirror in ((1, 0), (-1, 56)):
+        for type_code in range(6):
+            table = tables[type_code]
+            signed.append([color_sign * (values[type_code] + table[index ^ mirror]) for index in range(64)])
+    return signed
+
+# SQUARE_SCORES_MG[code][index]: material + piece-square value, white-positive
+SQUARE_SCORES_MG = _signed_tables(PIECE_VALUES, MIDDLEGAME_TABLES)
+SQUARE_SCORES_EG = _signed_tables(ENDGAME_VALUES, ENDGAME_TABLES)
+PHASE_BY_CODE = PHASE_VALUES * 2
+
+# Pawn structure terms as (middlegame, endgame)
+DOUBLED_PAWN = (-10, -20)
+ISOLATED_PAWN = (-10, -15)
+PASSED_PAWN_BY_RANK = [0, 5, 10, 20, 35, 60, 100, 0] # Ranks advanced from the pawn's own side
+
+# King safety (middlegame only): own pawns in front of the king, open files next to it
+SHIELD_PAWN = 10
+OPEN_FILE_NEAR_KING = -15
+
+PAWN_CACHE_SIZE = 1 << 16
+_pawn_cache = {}
+
+def compute_piece_scores(board) -> tuple[int, int, int]:
+    """Compute (middlegame score, endgame score, phase) from scratch.
+    The Board keeps the same three numbers incrementally in eval_mg, eval_eg and phase.
+    """
+    mg = eg = phase = 0
+    for index, piece in enumerate(board.squares):
+        if piece is not None:
+            code = COLOR_CODE_OFFSET[piece.color] + piece.type_code
+            mg += SQUARE_SCORES_MG[code][index]
+            eg += SQUARE_SCORES_EG[code][index]
+            phase += PHASE_BY_CODE[code]
+    return mg, eg, phase
+
+def pawn_structure(board) -> tuple[int, int]:
+    """Return the (middlegame, endgame) pawn structure score, white-positive.
+    Doubled and isolated pawns cost, passed pawns gain more the further they are.
+    """
+    cached = _pawn_cache.get(board.pawn_key)
+    if cached is not None:
+        return cached
+
+    # Row of every pawn per file (row 0 = rank 8)
+    rows = {WHITE: [[] for _ in range(8)], BLACK: [[] for _ in range(8)]}
+    for index, piece in enumerate(board.squares):
+        if piece is not None and piece.type_code == 0:
+            rows[piece.color][index & 7].append(index >> 3)
+
+    mg = eg = 0
+    for color, sign in ((WHITE, 1), (BLACK, -1)):
+        own = rows[color]
+        enemy = rows[BLACK if color == WHITE else WHITE]
+
+        for file in range(8):
+            pawns = own[file]
+            if not pawns:
+                continue
+
+            if len(pawns) > 1:
+                mg += sign * DOUBLED_PAWN[0] * (len(pawns) - 1)
+                eg += sign * DOUBLED_PAWN[1] * (len(pawns) - 1)
+
+            neighbours = [f for f in (file - 1, file + 1) if 0 <= f <= 7]
+            if not any(own[f] for f in neighbours):
+                mg += sign * ISOLATED_PAWN[0] * len(pawns)
+                eg += sign * ISOLATED_PAWN[1] * len(pawns)
+
+            for row in pawns:
+                # Passed: no enemy pawn in front of it on its own or a neighbouring file
+                if color == WHITE:
+                    blocked = any(r < row for f in [file] + neighbours for r in enemy[f])
+                    advanced = 6 - row
+                else:
+                    blocked = any(r > row for f in [file] + neighbours for r in enemy[f])
+                    advanced = row - 1
+                if not blocked:
+                    bonus = PASSED_PAWN_BY_RANK[advanced]
+                    mg += sign * bonus // 2
+                    eg += sign * bonus
+
+    if len(_pawn_cache) >= PAWN_CACHE_SIZE:
+        _pawn_cache.clear()
+    _pawn_cache[board.pawn_key] = (mg, eg)
+    return mg, eg
+
+def king_safety(board) -> int:
+    """Return the middlegame king safety score, white-positive: pawn shield and open files.
+    """
+    squares = board.squares
+    score = 0
+
+    for color, sign, forward in ((WHITE, 1, -1), (BLACK, -1, 1)):
+        king_index = board.king_index[color]
+        if king_index is None:
+            continue
+
+        row, col = king_index >> 3, king_index & 7
+        for file in range(max(0, col - 1), min(7, col + 1) + 1):
+            shielded = False
+            for distance in (1, 2):
+                shield_row = row + forward * distance
+                if 0 <= shield_row <= 7:
+                    piece = squares[shield_row * 8 + file]
+                    if piece is not None and piece.type_code == 0 and piece.color == color:
+                        score += sign * SHIELD_PAWN // distance
+                        shielded = True
+                        break
+
+            if not shielded and not _has_pawn_on_file(squares, file, color):
+                score += sign * OPEN_FILE_NEAR_KING
+
+    return score
+
+def _has_pawn_on_file(squares: list, file: int, color: str) -> bool:
+    """Check if color has a pawn anywhere on a file.
+    """
+    for index in range(file + 8, 56, 8): # Pawns never stand on the first or last rank
+        piece = squares[index]
+        if piece is not None and piece.type_code == 0 and piece.color == color:
+            return True
+    return False
+
+def evaluate(board, color: str) -> int:
+    """Return the score of the position in centipawns from the point of view of color.
+    """
+    pawn_mg, pawn_eg = pawn_structure(board)
+    mg = board.eval_mg + pawn_mg + king_safety(board)
+    eg = board.eval_eg + pawn_eg
+
+    phase = min(board.phase, MAX_PHASE)
+    score = (mg * phase + eg * (MAX_PHASE - phase)) // MAX_PHASE
+    return score if color == WHITE else -score
+
+def evaluate_many(positions) -> list[int]:
+    """Score many (board, color) positions at once, with the same scores as evaluate.
+    The piece scores are already on each Board, so no squares are walked except for
+    pawn structures not seen before. With numpy the phase blend is vectorized.
+    """
+    if numpy is None:
+        return [evaluate(board, color) for board, color in positions]
+
+    from chessgame.batch_eval import taper_scores
+
+    positions = list(positions)
+    mg = numpy.empty(len(positions), dtype=numpy.int32)
+    eg = numpy.empty(len(positions), dtype=numpy.int32)
+    phase = numpy.empty(len(positions), dtype=numpy.int32)
+    sides = numpy.empty(len(positions), dtype=numpy.int8)
+
+    for i, (board, color) in enumerate(positions):
+        pawn_mg, pawn_eg = pawn_structure(board)
+        mg[i] = board.eval_mg + pawn_mg + king_safety(board)
+        eg[i] = board.eval_eg + pawn_eg
+        phase[i] = board.phase
+        sides[i] = 1 if color == WHITE else -1
+
+    return taper_scores(mg, eg, phase, sides).tolist()
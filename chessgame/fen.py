@@ -0,0 +1,197 @@
+# FEN (Forsyth-Edwards Notation)
+#
+# A FEN is one line describing a position, e.g. the start position:
+#   rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1
+# Fields: piece placement (rank 8 first, digits = empty squares), side to move,
+# castling rights, en passant target, halfmove clock and fullmove number.
+#
+# The Board has no castling-rights field: rights come from has_moved. When a
+# FEN is read, kings and rooks are marked as moved unless they keep a right.
+# Parsing expands the placement with a few str.replace calls, so the squares
+# come out in index order (a8 = 0) with no per-character Python loop.
+from chessgame.pieces import Pawn, Knight, Bishop, Rook, Queen, King, WHITE, BLACK
+from chessgame.types import SQUARE_NAMES, SQUARE_INDEX
+from chessgame.zobrist import COLOR_CODE_OFFSET
+from chessgame.packing import NO_EN_PASSANT
+
+START_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+# Piece letter of each zobrist piece code 0..11
+FEN_CHARS = "PNBRQKpnbrqk"
+PIECE_CLASSES = {"p": Pawn, "n": Knight, "b": Bishop, "r": Rook, "q": Queen, "k": King}
+
+# Castling right letter -> (king square, rook square)
+CASTLING_SQUARES = {"K": (60, 63), "Q": (60, 56), "k": (4, 7), "q": (4, 0)}
+
+_SLASHES = "/" * 7
+_PIECE_CHARS = set(FEN_CHARS + ".") # Characters of an expanded placement
+
+# Piece letters -> packed code (zobrist code + 1), '.' -> 0, anything else -> 255 (invalid)
+_PACKED_CODES = bytes(FEN_CHARS.index(chr(c)) + 1 if chr(c) in FEN_CHARS else 0 if chr(c) == "." else 255
+                      for c in range(256))
+
+def _moved_table(moved_letters: str) -> bytes:
+    """Build a bytes.translate table from packed codes to b'1' (moved) or b'0'.
+    """
+    return bytes(ord("1") if 1 <= code <= 12 and FEN_CHARS[code - 1] in moved_letters else ord("0")
+                 for code in range(256))
+
+# has_moved as b'0'/b'1' per square: kings, rooks and pawns away from their starting rank are moved
+_MOVED = _moved_table("KRkrPp")
+_MOVED_WHITE_PAWN_RANK = _moved_table("KRkrp")
+_MOVED_BLACK_PAWN_RANK = _moved_table("KRkrP")
+
+def expand_placement(placement: str) -> str:
+    """Return the 64-character placement with '.' for empty squares (a8 first).
+    """
+    # Digits become runs of '1' (one per empty square), then every '1' becomes '.'
+    expanded = (placement.replace("8", "11111111").replace("7", "1111111").replace("6", "111111")
+                .replace("5", "11111").replace("4", "1111").replace("3", "111").replace("2", "11")
+                .replace("1", "."))
+
+    # 8 ranks of 8 squares: 71 characters with a '/' after every 8
+    if len(expanded) != 71 or expanded[8::9] != _SLASHES:
+        raise ValueError(f"FEN placement must have 8 ranks of 8 squares: {placement!r}")
+
+    return expanded.replace("/", "")
+
+def split_fen(fen: str) -> tuple[str, str, str, str, int, int]:
+    """Split a FEN into (placement, side, castling, en passant, halfmove clock, fullmove number).
+    Missing trailing fields get their usual defaults ('w', '-', '-', 0, 1).
+    """
+    fields = fen.split()
+    if not fields or len(fields) > 6:
+        raise ValueError(f"Invalid FEN: {fen!r}")
+
+    fields += ["w", "-", "-", "0", "1"][len(fields) - 1:]
+    placement, side, castling, en_passant, halfmove, fullmove = fields
+
+    if side not in ("w", "b"):
+        raise ValueError(f"FEN side to move must be 'w' or 'b': {fen!r}")
+    if en_passant != "-" and en_passant not in SQUARE_INDEX:
+        raise ValueError(f"Invalid FEN en passant square: {fen!r}")
+    if castling != "-" and (not castling or castling.strip("KQkq")):
+        raise ValueError(f"Invalid FEN castling rights: {fen!r}")
+    if not halfmove.isdigit() or not fullmove.isdigit():
+        raise ValueError(f"FEN move counters must be numbers: {fen!r}")
+
+    return placement, side, castling, en_passant, int(halfmove), int(fullmove)
+
+def set_board_from_fen(board, fen: str) -> str:
+    """Set up a board from a FEN (clearing it first) and return the side to move.
+    """
+    placement, side, castling, en_passant, halfmove, fullmove = split_fen(fen)
+    expanded = expand_placement(placement)
+
+    # Every field is checked before the board is touched, so a bad FEN leaves it as it was
+    invalid = set(expanded) - _PIECE_CHARS
+    if invalid:
+        raise ValueError(f"Invalid FEN piece {min(invalid)!r}: {fen!r}")
+
+    board.clear()
+    new_piece = board.new_piece
+    set_piece_at = board.set_piece_at
+    set_moved_at = board.set_moved_at
+
+    for index, char in enumerate(expanded):
+        if char == ".":
+            continue
+        piece_class = PIECE_CLASSES[char.lower()]
+        set_piece_at(index, new_piece(piece_class, WHITE if char < "a" else BLACK))
+        if piece_class is King or piece_class is Rook:
+            set_moved_at(index, True) # Unmarked below if it keeps a right
+        elif piece_class is Pawn and (index >> 3) != (6 if char == "P" else 1):
+            set_moved_at(index, True) # Pawn away from its starting rank
+
+    squares = board.squares
+    for right in castling.replace("-", ""):
+        king_index, rook_index = CASTLING_SQUARES[right]
+        color = WHITE if right < "a" else BLACK
+        king, rook = squares[king_index], squares[rook_index]
+        if (isinstance(king, King) and king.color == color and isinstance(rook, Rook) and rook.color == color):
+            set_moved_at(king_index, False)
+            set_moved_at(rook_index, False)
+
+    board.en_passant_index = None if en_passant == "-" else SQUARE_INDEX[en_passant]
+    board.halfmove_clock = halfmove
+    board.fullmove_number = fullmove
+    return WHITE if side == "w" else BLACK
+
+def board_to_fen(board, color: str) -> str:
+    """Return the FEN of a board with color to move.
+    """
+    squares = board.squares
+    ranks = []
+
+    for row in range(0, 64, 8):
+        rank = ""
+        empty = 0
+        for index in range(row, row + 8):
+            piece = squares[index]
+            if piece is None:
+                empty += 1
+                continue
+            if empty:
+                rank += str(empty)
+                empty = 0
+            rank += FEN_CHARS[COLOR_CODE_OFFSET[piece.color] + piece.type_code]
+        if empty:
+            rank += str(empty)
+        ranks.append(rank)
+
+    rights = board.castling_rights()
+    castling = "".join(letter for letter, bit in (("K", 1), ("Q", 2), ("k", 4), ("q", 8)) if rights & bit) or "-"
+    en_passant = "-" if board.en_passant_index is None else SQUARE_NAMES[board.en_passant_index]
+
+    return (f"{'/'.join(ranks)} {'w' if color == WHITE else 'b'} {castling} {en_passant} "
+            f"{board.halfmove_clock} {board.fullmove_number}")
+
+def board_from_fen(fen: str, backend: str = "list", flyweight: bool = False):
+    """Create a board from a FEN with the chosen backend. Returns (board, side to move).
+    """
+    from chessgame.board import create_board # Import here to avoid circular imports
+
+    board = create_board(backend, flyweight)
+    return board, set_board_from_fen(board, fen)
+
+def fen_to_packed(fen: str) -> bytes:
+    """Convert a FEN straight to the 42-byte packed form (chessgame.packing) without building a Board.
+    This is the fast path for bulk files: no Piece objects are created.
+    """
+    placement, side, castling, en_passant, _, _ = split_fen(fen)
+    codes = expand_placement(placement).encode("latin-1", "replace").translate(_PACKED_CODES)
+    if 255 in codes:
+        raise ValueError(f"Invalid FEN piece: {fen!r}")
+
+    # has_moved: kings and rooks without a right, pawns off their starting rank.
+    # Built as a '0'/'1' string (a8 first) and read as a base-2 number, h1 first.
+    moved_bits = (codes[:8].translate(_MOVED) + codes[8:16].translate(_MOVED_BLACK_PAWN_RANK)
+                  + codes[16:48].translate(_MOVED) + codes[48:56].translate(_MOVED_WHITE_PAWN_RANK)
+                  + codes[56:].translate(_MOVED))
+    moved = int(moved_bits[::-1], 2)
+    if castling != "-":
+        for right in castling:
+            king_index, rook_index = CASTLING_SQUARES[right]
+            king_code, rook_code = (6, 4) if right < "a" else (12, 10)
+            if codes[king_index] == king_code and codes[rook_index] == rook_code:
+                moved &= ~((1 << king_index) | (1 << rook_index))
+
+    # Two squares per byte: every code is below 16, so shifting the odd squares
+    # up by 4 bits puts them in the high nibble of the same byte
+    placement_bits = int.from_bytes(codes[0::2], "little") | (int.from_bytes(codes[1::2], "little") << 4)
+    data = bytearray(placement_bits.to_bytes(32, "little"))
+    data += moved.to_bytes(8, "little")
+    data.append(NO_EN_PASSANT if en_passant == "-" else SQUARE_INDEX[en_passant])
+    data.append(0 if side == "w" else 1)
+    return bytes(data)
+
+def read_fen_file(path, packed: bool = False):
+    """Yield the positions of a file with one FEN per line (blank lines and '#' comments skipped).
+    Yields (board, side to move) pairs, or 42-byte packed boards with packed=True.
+    """
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            yield fen_to_packed(line) if packed else board_from_fen(line)
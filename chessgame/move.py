@@ -0,0 +1,133 @@
+# Chess Move Module
+from chessgame.types import square_to_index, SQUARE_NAMES
+
+# Move flags (extra facts about a move, filled in by the move generator)
+QUIET = 0
+CAPTURE = 1
+EN_PASSANT = 2
+CASTLE = 4
+DOUBLE_PUSH = 8
+
+# Promotion choices and their codes in the packed form (0 = no promotion)
+PROMOTION_CODES = {None: 0, "N": 1, "B": 2, "R": 3, "Q": 4}
+PROMOTION_CHOICES = [None, "N", "B", "R", "Q"]
+
+# Promotion choices in the order the move generator lists them
+PROMOTION_ORDER = ["Q", "R", "B", "N"]
+
+class Move:
+    """Class representing one chess move: from, to, promotion choice and flags.
+
+    Squares are indices 0..63 like on the Board. Two moves are equal when they
+    have the same squares and promotion; the flags are only extra information.
+    """
+    __slots__ = ("from_index", "to_index", "promotion", "flags")
+
+    def __init__(self, from_index: int, to_index: int, promotion: str | None = None, flags: int = QUIET):
+        """Create a move between two square indices.
+        """
+        if promotion is not None:
+            promotion = promotion.strip().upper()
+            if promotion not in PROMOTION_CODES:
+                raise ValueError("Promotion must be one of 'Q', 'R', 'B', 'N'.")
+
+        self.from_index = from_index
+        self.to_index = to_index
+        self.promotion = promotion # 'Q', 'R', 'B', 'N' or None
+        self.flags = flags         # Combination of CAPTURE, EN_PASSANT, CASTLE, DOUBLE_PUSH
+
+    @classmethod
+    def from_squares(cls, from_square: str, to_square: str, promotion: str | None = None) -> "Move":
+        """Create a move from chess squares like 'e2' and 'e4'.
+        """
+        return cls(square_to_index(from_square), square_to_index(to_square), promotion)
+
+    @classmethod
+    def from_uci(cls, text: str) -> "Move":
+        """Create a move from coordinate notation like 'e2e4' or 'e7e8q'.
+        """
+        text = text.strip().lower()
+        if len(text) not in (4, 5):
+            raise ValueError("Invalid move format. Must be like 'e2e4' or 'e7e8q'.")
+
+        promotion = text[4] if len(text) == 5 else None
+        return cls.from_squares(text[0:2], text[2:4], promotion)
+
+    @property
+    def from_square(self) -> str:
+        """Return the starting square (e.g. 'e2').
+        """
+        return SQUARE_NAMES[self.from_index]
+
+    @property
+    def to_square(self) -> str:
+        """Return the destination square (e.g. 'e4').
+        """
+        return SQUARE_NAMES[self.to_index]
+
+    def is_capture(self) -> bool:
+        """Return True if the move captures a piece (including en passant).
+        """
+        return self.flags & (CAPTURE | EN_PASSANT) != 0
+
+    def uci(self) -> str:
+        """Return the move in coordinate notation like 'e2e4' or 'e7e8q'.
+        """
+        text = SQUARE_NAMES[self.from_index] + SQUARE_NAMES[self.to_index]
+        if self.promotion is not None:
+            text += self.promotion.lower()
+        return text
+
+    def encode(self) -> int:
+        """Pack the move into a single int (see encode_move).
+        """
+        return encode_move(self)
+
+    def __eq__(self, other) -> bool:
+        """Moves are equal when squares and promotion match.
+        """
+        if not isinstance(other, Move):
+            return NotImplemented
+        return (self.from_index == other.from_index and self.to_index == other.to_index
+                and self.promotion == other.promotion)
+
+    def __hash__(self) -> int:
+        """Hash on squares and promotion, so moves can be used in sets and dicts.
+        """
+        return self.from_index | (self.to_index << 6) | (PROMOTION_CODES[self.promotion] << 12)
+
+    def __repr__(self) -> str:
+        """Return a readable representation of the move.
+        """
+        return f"Move({self.uci()!r})"
+
+    def __str__(self) -> str:
+        """Return the move in coordinate notation.
+        """
+        return self.uci()
+
+# Packed form of a move in a 32-bit int:
+#   bits  0..5   from index
+#   bits  6..11  to index
+#   bits 12..14  promotion code (0 none, 1 N, 2 B, 3 R, 4 Q)
+#   bits 15..18  flags
+# Without flags a move fits in 16 bits.
+def encode_move(move: Move) -> int:
+    """Pack a move into an int.
+    """
+    return (move.from_index | (move.to_index << 6)
+            | (PROMOTION_CODES[move.promotion] << 12) | (move.flags << 15))
+
+def decode_move(value: int) -> Move:
+    """Unpack an int created by encode_move back into a Move.
+    """
+    return Move(value & 63, (value >> 6) & 63, PROMOTION_CHOICES[(value >> 12) & 7], (value >> 15) & 15)
+
+def pawn_moves(from_index: int, to_index: int, flags: int = QUIET):
+    """Yield the pawn move between two squares, one per promotion choice on the last rank.
+    """
+    if to_index < 8 or to_index > 55: # Rank 8 or rank 1
+        for choice in PROMOTION_ORDER:
+            yield Move(from_index, to_index, choice, flags)
+    else:
+        yield Move(from_index, to_index, None, flags)
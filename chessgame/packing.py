@@ -0,0 +1,68 @@
+# Compact Board Packing
+#
+# A position packed into 42 bytes, for sending boards between processes or
+# storing many of them. Pickling a Board would send every Piece object; this
+# sends one 4-bit code per square instead.
+#
+#   bytes  0..31  placement, two squares per byte (low nibble = even index)
+#                 0 = empty, 1..12 = zobrist piece code + 1
+#   bytes 32..39  has_moved bitmask (bit i = square index i), little endian
+#   byte  40      en passant index, 255 for none
+#   byte  41      side to move (0 = white, 1 = black)
+from chessgame.pieces import Pawn, Knight, Bishop, Rook, Queen, King, WHITE, BLACK
+from chessgame.zobrist import COLOR_CODE_OFFSET
+
+PACKED_SIZE = 42
+NO_EN_PASSANT = 255
+
+# Piece classes and colors by zobrist piece code 0..11
+CODE_CLASSES = [Pawn, Knight, Bishop, Rook, Queen, King] * 2
+CODE_COLORS = [WHITE] * 6 + [BLACK] * 6
+
+def pack_board(board, color: str) -> bytes:
+    """Pack a board and the side to move into PACKED_SIZE bytes.
+    """
+    squares = board.squares
+    codes = [0] * 64
+    moved = 0
+
+    for index in range(64):
+        piece = squares[index]
+        if piece is not None:
+            codes[index] = COLOR_CODE_OFFSET[piece.color] + piece.type_code + 1
+            if board.has_moved_at(index):
+                moved |= 1 << index
+
+    data = bytearray(codes[i] | (codes[i + 1] << 4) for i in range(0, 64, 2))
+    data += moved.to_bytes(8, "little")
+    data.append(NO_EN_PASSANT if board.en_passant_index is None else board.en_passant_index)
+    data.append(0 if color == WHITE else 1)
+    return bytes(data)
+
+def set_board_from_packed(board, data) -> str:
+    """Set up a board from pack_board output (clearing it first) and return the side to move.
+    data can be any bytes-like object, e.g. a memoryview into a mapped file.
+    """
+    if len(data) != PACKED_SIZE:
+        raise ValueError(f"Packed board must be {PACKED_SIZE} bytes, got {len(data)}")
+
+    board.clear()
+    moved = int.from_bytes(data[32:40], "little")
+
+    for index in range(64):
+        code = (data[index >> 1] >> (4 * (index & 1))) & 15
+        if code:
+            board.set_piece_at(index, board.new_piece(CODE_CLASSES[code - 1], CODE_COLORS[code - 1]))
+            if (moved >> index) & 1:
+                board.set_moved_at(index, True)
+
+    board.en_passant_index = None if data[40] == NO_EN_PASSANT else data[40]
+    return WHITE if data[41] == 0 else BLACK
+
+def unpack_board(data: bytes, backend: str = "list", flyweight: bool = False):
+    """Rebuild a board from pack_board output. Returns (board, side to move).
+    """
+    from chessgame.board import create_board # Import here to avoid circular imports
+
+    board = create_board(backend, flyweight)
+    return board, set_board_from_packed(board, data)
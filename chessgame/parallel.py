@@ -0,0 +1,142 @@
+# Root-Parallel Search
+#
+# One Python process searches on one core. To use more cores, the legal moves
+# at the root are dealt out over a pool of worker processes, and every worker
+# runs the normal iterative-deepening search on its share of the moves.
+#
+# The position is sent as 42 packed bytes (see chessgame.packing) and moves as
+# encoded ints, so no Piece objects are pickled. The move counters and the keys
+# of the positions played so far go along, so workers see repetitions and the
+# 50-move rule just like the serial search. Each worker reports the best
+# move of every depth it finished. The results are merged at the deepest depth
+# every worker finished, best score first and ties going to the move that comes
+# first in the root order, so the same search always gives the same move.
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from chessgame.engine import (Searcher, SearchLimits, SearchResult, MATE_SCORE, MAX_PLY, DEFAULT_TABLE_MB,
+                              order_moves)
+from chessgame.move import Move, encode_move, decode_move
+from chessgame.packing import pack_board, unpack_board
+from chessgame.transposition import TranspositionTable
+
+def _search_part(packed: bytes, clocks: tuple[int, int], history: list[int], backend: str,
+                 move_codes: list[int], depth: int | None, movetime: float | None, nodes: int | None,
+                 table_mb: float) -> tuple[list, int]:
+    """Worker: search some root moves of a packed position.
+    clocks is (halfmove clock, fullmove number) and history the position keys played so far.
+    Returns ([(depth, move code, score), ...] per finished depth, nodes searched).
+    """
+    board, color = unpack_board(packed, backend)
+    board.halfmove_clock, board.fullmove_number = clocks
+    for key in history:
+        board.position_history.append(key)
+        board.position_counts[key] = board.position_counts.get(key, 0) + 1
+    searcher = Searcher(board, TranspositionTable(table_mb))
+
+    iterations = []
+    searcher.on_iteration = lambda result: iterations.append((result.depth, encode_move(result.move),
+                                                              result.score))
+    searcher.search(color, SearchLimits(depth, movetime, nodes), [decode_move(code) for code in move_codes])
+    return iterations, searcher.nodes
+
+def _is_mate_score(score: int) -> bool:
+    """Check if a score announces a forced mate (the search stops deepening there).
+    """
+    return abs(score) >= MATE_SCORE - MAX_PLY
+
+def merge_results(root_moves: list[Move], parts: list[list]) -> tuple[Move | None, int, int]:
+    """Merge the per-depth results of the workers into (move, score, depth).
+    Every worker is read at the deepest depth all of them finished; a worker that
+    stopped on a forced mate counts as finished at every depth.
+    """
+    parts = [iterations for iterations in parts if iterations]
+    if not parts:
+        return None, 0, 0
+
+    def reached(iterations):
+        return MAX_PLY if _is_mate_score(iterations[-1][2]) else iterations[-1][0]
+
+    depth = min(reached(iterations) for iterations in parts)
+    order = {move: i for i, move in enumerate(root_moves)}
+
+    best = None
+    for iterations in parts:
+        by_depth = {d: (code, score) for d, code, score in iterations}
+        code, score = by_depth.get(depth, iterations[-1][1:])
+        move = decode_move(code)
+        if best is None or score > best[1] or (score == best[1] and order[move] < order[best[0]]):
+            best = (move, score)
+
+    move, score = best
+    depth = max(iterations[-1][0] for iterations in parts) if depth == MAX_PLY else depth
+    return root_moves[order[move]], score, depth
+
+class ParallelSearcher:
+    """Root-parallel search over a process pool.
+    The pool is started once and reused for every search; close it when done
+    (or use the searcher as a context manager).
+    """
+    def __init__(self, workers: int | None = None, backend: str = "list", table_mb: float = DEFAULT_TABLE_MB):
+        """Create a searcher with the given number of worker processes (default: all cores).
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.backend = backend
+        self.table_mb = table_mb
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    def search(self, board, color: str, limits: SearchLimits | None = None) -> SearchResult:
+        """Search the position with color to move using all workers.
+        A node limit is shared out evenly between the workers.
+        """
+        if limits is None:
+            limits = SearchLimits()
+
+        start = time.perf_counter()
+        root_moves = board.generate_legal_moves(color)
+        if not root_moves:
+            score = -MATE_SCORE if board.is_in_check(color) else 0
+            return SearchResult(None, score, 0, 0, time.perf_counter() - start)
+
+        # Order the moves once, then deal them out round-robin so every worker gets good candidates
+        order_moves(board, root_moves)
+        part_count = min(self.workers, len(root_moves))
+        shares = [[encode_move(move) for move in root_moves[i::part_count]] for i in range(part_count)]
+
+        nodes = None if limits.nodes is None else max(1, limits.nodes // part_count)
+        packed = pack_board(board, color)
+        clocks = (board.halfmove_clock, board.fullmove_number)
+        futures = [self.pool.submit(_search_part, packed, clocks, board.position_history, self.backend, share,
+                                    limits.depth, limits.movetime, nodes, self.table_mb / part_count)
+                   for share in shares]
+        results = [future.result() for future in futures]
+
+        move, score, depth = merge_results(root_moves, [iterations for iterations, _ in results])
+        total_nodes = sum(part_nodes for _, part_nodes in results)
+        if move is None:
+            move = root_moves[0] # No worker finished depth 1 in time
+
+        return SearchResult(move, score, depth, total_nodes, time.perf_counter() - start)
+
+    def close(self) -> None:
+        """Shut the worker pool down.
+        """
+        self.pool.shutdown()
+
+    def __enter__(self) -> "ParallelSearcher":
+        """Use the searcher in a with block.
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Shut the pool down at the end of a with block.
+        """
+        self.close()
+
+def parallel_best_move(board, color: str, limits: SearchLimits | None = None,
+                       workers: int | None = None) -> Move | None:
+    """Return the best move found by a root-parallel search, or None if there is no legal move.
+    """
+    with ParallelSearcher(workers) as searcher:
+        return searcher.search(board, color, limits).move
@@ -0,0 +1,99 @@
+# Perft: Move Generator Benchmark and Correctness Check
+#
+# perft(depth) counts every leaf node of the legal move tree down to a depth.
+# The counts for standard positions are well known, so any bug in castling,
+# en passant, promotion or check handling shows up as a wrong number, and the
+# time taken gives a nodes/second figure for the move engine.
+#
+# Run from the project root with: python -m chessgame.perft [depth] [list|bitboard]
+import sys
+import time
+
+from chessgame.board import Board
+from chessgame.fen import board_from_fen
+from chessgame.pieces import WHITE, BLACK
+
+# Standard perft positions (FEN) with their known node counts per depth
+PERFT_SUITE = [
+    ("start", "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+     {1: 20, 2: 400, 3: 8902, 4: 197281}),
+    ("kiwipete", "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+     {1: 48, 2: 2039, 3: 97862}),
+    ("position3", "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+     {1: 14, 2: 191, 3: 2812, 4: 43238}),
+    ("position4", "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+     {1: 6, 2: 264, 3: 9467}),
+    ("position5", "rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8",
+     {1: 44, 2: 1486, 3: 62379}),
+    ("position6", "r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10",
+     {1: 46, 2: 2079, 3: 89890}),
+]
+
+def perft(board: Board, color: str, depth: int) -> int:
+    """Count the leaf nodes of the legal move tree of the given depth.
+    """
+    moves = board.generate_legal_moves(color)
+
+    if depth <= 1:
+        return len(moves) if depth == 1 else 1 # Bulk count at the last level
+
+    opponent = BLACK if color == WHITE else WHITE
+    nodes = 0
+
+    for move in moves:
+        undo = board.make_move(move)
+        nodes += perft(board, opponent, depth - 1)
+        board.unmake_move(undo)
+
+    return nodes
+
+def divide(board: Board, color: str, depth: int) -> dict[str, int]:
+    """Return the perft count below each root move (e.g. {'e2e4': 20, ...}).
+    Comparing this with another engine points to the move that is counted wrong.
+    """
+    opponent = BLACK if color == WHITE else WHITE
+    counts = {}
+
+    for move in board.generate_legal_moves(color):
+        undo = board.make_move(move)
+        counts[move.uci()] = perft(board, opponent, depth - 1)
+        board.unmake_move(undo)
+
+    return counts
+
+def run_suite(max_depth: int = 3, backend: str = "list") -> bool:
+    """Run perft on every suite position up to max_depth and print nodes/second.
+    Returns True if every count matched.
+    """
+    all_ok = True
+    total_nodes = 0
+    total_time = 0.0
+
+    for name, fen, expected in PERFT_SUITE:
+        for depth in sorted(expected):
+            if depth > max_depth:
+                break
+
+            board, turn = board_from_fen(fen, backend)
+            start = time.perf_counter()
+            nodes = perft(board, turn, depth)
+            elapsed = time.perf_counter() - start
+
+            ok = nodes == expected[depth]
+            all_ok = all_ok and ok
+            total_nodes += nodes
+            total_time += elapsed
+
+            nps = nodes / elapsed if elapsed > 0 else 0
+            print(f"{name:10} depth {depth}: {nodes:8} nodes  {elapsed:7.2f} s  {nps:9.0f} nodes/s  "
+                  f"{'ok' if ok else 'WRONG (expected ' + str(expected[depth]) + ')'}")
+
+    if total_time > 0:
+        print(f"total: {total_nodes} nodes in {total_time:.2f} s = {total_nodes / total_time:.0f} nodes/s")
+
+    return all_ok
+
+if __name__ == "__main__":
+    depth = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    backend = sys.argv[2] if len(sys.argv) > 2 else "list"
+    sys.exit(0 if run_suite(depth, backend) else 1)
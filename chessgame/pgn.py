@@ -0,0 +1,245 @@
+# PGN (Portable Game Notation)
+#
+# A PGN file is a list of games. Each game has header tags like
+#   [White "Carlsen, Magnus"]
+# followed by movetext in SAN: "1. e4 e5 2. Nf3 {a comment} Nc6 (2... d6) 3. Bb5 1-0".
+#
+# read_games reads a file line by line and yields one Game at a time, so an
+# archive of any size is processed with the memory of a single game.
+# Comments, variations and annotation glyphs are skipped. Games are replayed
+# through Board.play_move, which applies the promotion as part of the move.
+import os
+import re
+
+from chessgame.pieces import WHITE, BLACK
+from chessgame.fen import START_FEN
+from chessgame.san import parse_san, move_to_san
+
+# The Seven Tag Roster: written first and in this order
+SEVEN_TAG_ROSTER = ["Event", "Site", "Date", "Round", "White", "Black", "Result"]
+RESULTS = ("1-0", "0-1", "1/2-1/2", "*")
+
+HEADER_PATTERN = re.compile(r'^\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+TOKEN_PATTERN = re.compile(r"[()]|[^\s()]+")
+MOVE_NUMBER_PATTERN = re.compile(r"^\d+\.+")
+LINE_WIDTH = 80
+
+class Game:
+    """One game record: header tags, moves in SAN and the result.
+    """
+    __slots__ = ("headers", "moves", "result")
+
+    def __init__(self, headers: dict[str, str] | None = None, moves: list[str] | None = None,
+                 result: str = "*"):
+        """Create a game record.
+        """
+        self.headers = headers if headers is not None else {}
+        self.moves = moves if moves is not None else []
+        self.result = result
+
+    @classmethod
+    def from_moves(cls, moves, headers: dict[str, str] | None = None, result: str = "*",
+                   fen: str | None = None) -> "Game":
+        """Create a game record from Move objects played from the start (or a FEN) position.
+        """
+        from chessgame.board import Board # Import here to avoid circular imports
+
+        headers = dict(headers or {})
+        board, turn = Board.from_fen(fen or START_FEN)
+        if fen is not None and fen != START_FEN:
+            headers["SetUp"] = "1"
+            headers["FEN"] = fen
+
+        sans = []
+        for move in moves:
+            sans.append(move_to_san(board, move, turn))
+            board.make_move(move)
+            turn = BLACK if turn == WHITE else WHITE
+
+        headers["Result"] = result
+        return cls(headers, sans, result)
+
+    def start_position(self):
+        """Return (board, side to move) for the position the game starts from.
+        """
+        from chessgame.board import Board
+
+        fen = self.headers.get("FEN") if self.headers.get("SetUp", "1") == "1" else None
+        return Board.from_fen(fen or START_FEN)
+
+    def replay(self):
+        """Yield (board, side to move, Move) for every move, then leave the board at the final position.
+        The same board object is updated in place through move_piece.
+        Raises ValueError on an illegal or unreadable move.
+        """
+        board, turn = self.start_position()
+
+        for san in self.moves:
+            move = parse_san(board, san, turn)
+            yield board, turn, move
+            if not board.play_move(move, turn):
+                raise ValueError(f"Illegal move in game: {san}")
+            turn = BLACK if turn == WHITE else WHITE
+
+    def final_position(self):
+        """Replay the game and return (board, side to move) at its end.
+        """
+        board, turn = self.start_position()
+        for board, turn, _ in self.replay():
+            turn = BLACK if turn == WHITE else WHITE
+        return board, turn
+
+    def __repr__(self) -> str:
+        """Return a short readable representation of the game.
+        """
+        return (f"Game({self.headers.get('White', '?')} - {self.headers.get('Black', '?')}, "
+                f"{len(self.moves)} moves, {self.result})")
+
+def read_games(source):
+    """Yield the games of a PGN file one at a time.
+    source is a path, an open text file or any iterable of lines; it is read line by line.
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        yield from _parse_lines(source)
+        return
+
+    with open(source, encoding="utf-8", errors="replace") as file:
+        yield from _parse_lines(file)
+
+def _parse_lines(lines):
+    """Parse PGN lines into Games (see read_games).
+    """
+    headers = {}
+    moves = []
+    in_comment = False    # Inside a {...} comment, which can span lines
+    variation_depth = 0   # Inside (...) variations, which are skipped
+
+    for line in lines:
+        if in_comment:
+            end = line.find("}")
+            if end < 0:
+                continue
+            line = line[end + 1:]
+            in_comment = False
+
+        stripped = line.strip()
+        if not stripped or stripped.startswith("%"):
+            continue # Blank line or escape line
+
+        if stripped.startswith("[") and variation_depth == 0:
+            match = HEADER_PATTERN.match(stripped)
+            if match is not None:
+                if moves:
+                    # A new game starts without a result token after the last one
+                    yield Game(headers, moves, headers.get("Result", "*"))
+                    headers, moves = {}, []
+                headers[match.group(1)] = match.group(2).replace('\\"', '"').replace("\\\\", "\\")
+                continue
+
+        # Movetext: drop comments, then read the tokens
+        while True:
+            brace = stripped.find("{")
+            semicolon = stripped.find(";")
+            if semicolon >= 0 and (brace < 0 or semicolon < brace):
+                stripped = stripped[:semicolon] # Comment to the end of the line
+                break
+            if brace < 0:
+                break
+            end = stripped.find("}", brace)
+            if end < 0:
+                stripped = stripped[:brace]
+                in_comment = True
+                break
+            stripped = stripped[:brace] + " " + stripped[end + 1:]
+
+        for token in TOKEN_PATTERN.findall(stripped):
+            if token == "(":
+                variation_depth += 1
+            elif token == ")":
+                variation_depth = max(0, variation_depth - 1)
+            elif variation_depth:
+                continue
+            elif token in RESULTS:
+                yield Game(headers, moves, token)
+                headers, moves = {}, []
+            elif token[0] == "$":
+                continue # Numeric annotation glyph
+            else:
+                token = MOVE_NUMBER_PATTERN.sub("", token) # "12." or "12..." or "12.e4"
+                if token:
+                    moves.append(token)
+
+    if moves or headers:
+        yield Game(headers, moves, headers.get("Result", "*"))
+
+def format_game(game: Game) -> str:
+    """Return the PGN text of a game, headers first and movetext wrapped at 80 columns.
+    """
+    headers = dict(game.headers)
+    headers["Result"] = game.result
+
+    lines = []
+    for tag in SEVEN_TAG_ROSTER:
+        value = headers.pop(tag, "?" if tag != "Result" else "*")
+        lines.append(_header_line(tag, value))
+    for tag, value in headers.items():
+        lines.append(_header_line(tag, value))
+    lines.append("")
+
+    # Move numbers: "1. e4 e5 2. Nf3", or "1... e5" when black moves first
+    fen = game.headers.get("FEN")
+    number, black_first = 1, False
+    if fen:
+        fields = fen.split()
+        black_first = len(fields) > 1 and fields[1] == "b"
+        number = int(fields[5]) if len(fields) > 5 and fields[5].isdigit() else 1
+
+    tokens = []
+    white_to_move = not black_first
+    for i, san in enumerate(game.moves):
+        if white_to_move:
+            tokens.append(f"{number}.")
+        elif i == 0:
+            tokens.append(f"{number}...")
+        tokens.append(san)
+        if not white_to_move:
+            number += 1
+        white_to_move = not white_to_move
+    tokens.append(game.result)
+
+    line = ""
+    for token in tokens:
+        if line and len(line) + 1 + len(token) > LINE_WIDTH:
+            lines.append(line)
+            line = token
+        else:
+            line = f"{line} {token}" if line else token
+    lines.append(line)
+
+    return "\n".join(lines) + "\n"
+
+def _header_line(tag: str, value: str) -> str:
+    """Return one header line with the value escaped.
+    """
+    value = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'[{tag} "{value}"]'
+
+def write_games(games, destination, append: bool = False) -> int:
+    """Write games to a PGN file one at a time (a path or an open text file).
+    Returns the number of games written.
+    """
+    if hasattr(destination, "write"):
+        return _write_to(games, destination)
+
+    with open(destination, "a" if append else "w", encoding="utf-8") as file:
+        return _write_to(games, file)
+
+def _write_to(games, file) -> int:
+    """Write games to an open file with a blank line between them.
+    """
+    count = 0
+    for game in games:
+        file.write(format_game(game))
+        file.write("\n")
+        count += 1
+    return count
@@ -2,6 +2,12 @@ WHITE = "white"
 BLACK = "black"
 
 class Piece:
+    # Slots instead of a per-instance __dict__: pieces are small and there are many of them
+    __slots__ = ("color", "has_moved")
+
+    type_code = None  # 0..5 for pawn, knight, bishop, rook, queen, king (used by tables and hashing)
+    is_shared = False # True for the immutable shared pieces from shared_piece()
+
     def __init__(self, color: str): # Initialize a chess piece with the given color.
         """Initialize a chess piece with the given color.
         """
@@ -10,6 +16,16 @@ class Piece:
         self.color = color
         self.has_moved = False # Track if the piece has moved
 
+    def copy(self) -> "Piece":
+        """Return an independent copy of the piece (shared pieces are returned as they are).
+        """
+        if self.is_shared:
+            return self
+
+        new_piece = self.__class__(self.color)
+        new_piece.has_moved = self.has_moved
+        return new_piece
+
     def symbol(self) -> str:
         """Return the symbol representing the piece.
         """
@@ -31,6 +47,9 @@ class Piece:
 class Pawn(Piece):
     """Class representing a Pawn chess piece.
     """
+    __slots__ = ()
+    type_code = 0
+
     def symbol(self) -> str:
         """Return the symbol representing the Pawn piece.
         """
@@ -66,6 +85,9 @@ class Pawn(Piece):
 class Rook(Piece):
     """Class representing a Rook chess piece.
     """
+    __slots__ = ()
+    type_code = 3
+
     def symbol(self) -> str:
         """Return the symbol representing the Rook piece.
         """
@@ -87,6 +109,9 @@ class Rook(Piece):
 class Knight(Piece):
     """Class representing a Knight chess piece.
     """
+    __slots__ = ()
+    type_code = 1
+
     def symbol(self) -> str:
         """Return the symbol representing the Knight piece.
         """
@@ -110,6 +135,9 @@ class Knight(Piece):
 class Bishop(Piece):
     """Class representing a Bishop chess piece.
     """
+    __slots__ = ()
+    type_code = 2
+
     def symbol(self) -> str:
         """Return the symbol representing the Bishop piece.
         """
@@ -136,6 +164,9 @@ class Bishop(Piece):
 class Queen(Piece):
     """Class representing a Queen chess piece.
     """
+    __slots__ = ()
+    type_code = 4
+
     def symbol(self) -> str:
         """Return the symbol representing the Queen piece.
         """
@@ -166,6 +197,9 @@ class Queen(Piece):
 class King(Piece):
     """Class representing a King chess piece.
     """
+    __slots__ = ()
+    type_code = 5
+
     def symbol(self) -> str:
         """Return the symbol representing the King piece.
         """
@@ -184,4 +218,50 @@ class King(Piece):
         if col_diff < 0:
             col_diff = -col_diff
 
-        return row_diff <= 1 and col_diff <= 1 and (row_diff + col_diff) > 0
\ No newline at end of file
+        return row_diff <= 1 and col_diff <= 1 and (row_diff + col_diff) > 0
+
+# Shared (flyweight) pieces
+#
+# A board in flyweight mode keeps has_moved on the Board, so the pieces carry no
+# per-game state and the same twelve instances can stand on every board.
+# They are instances of a frozen subclass with the same name, so isinstance()
+# and class-name checks keep working, but any attribute change raises.
+_SHARED_PIECES = {}
+
+def _frozen_setattr(self, name, value):
+    raise AttributeError("Shared pieces are immutable; has_moved lives on the Board.")
+
+def _shared_reduce(self):
+    # Pickle as a call to shared_piece, so loading gives back the shared instance
+    return (shared_piece, (self.base_class, self.color))
+
+def _shared_copy(self, memo=None):
+    # There is only one shared piece per class and color, so a copy is the piece itself
+    return self
+
+def shared_piece(piece_class, color: str) -> Piece:
+    """Return the shared immutable piece of the given class and color.
+    """
+    piece_class = getattr(piece_class, "base_class", piece_class) # Accept a shared piece's class too
+    key = (piece_class, color)
+
+    piece = _SHARED_PIECES.get(key)
+    if piece is None:
+        if color not in (WHITE, BLACK):
+            raise ValueError("Color must be 'white' or 'black'")
+
+        frozen_class = type(piece_class.__name__, (piece_class,), {
+            "__slots__": (),
+            "__setattr__": _frozen_setattr,
+            "__reduce__": _shared_reduce,
+            "__copy__": _shared_copy,
+            "__deepcopy__": _shared_copy,
+            "is_shared": True,
+            "base_class": piece_class,
+        })
+        piece = object.__new__(frozen_class)
+        object.__setattr__(piece, "color", color)
+        object.__setattr__(piece, "has_moved", False)
+        _SHARED_PIECES[key] = piece
+
+    return piece
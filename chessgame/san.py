@@ -0,0 +1,124 @@
+# Standard Algebraic Notation (SAN)
+#
+# SAN is the move notation of game records: 'e4', 'Nf3', 'exd5', 'O-O',
+# 'e8=Q+', 'Nbd7', 'R1e2#'. It names the piece and the destination and adds
+# only as much of the starting square as needed to tell two pieces apart.
+#
+# Reading SAN means finding the one legal move that matches. Candidates are
+# taken from the pseudo-legal moves with the right piece type and destination,
+# and only those few are checked for legality (make/unmake), instead of
+# building the full legal move list for every move of a PGN game.
+import re
+
+from chessgame.pieces import Pawn, King, WHITE, BLACK
+from chessgame.types import SQUARE_NAMES, SQUARE_INDEX
+from chessgame.move import Move
+
+PIECE_LETTERS = "PNBRQK" # By Piece.type_code
+LETTER_TYPE_CODES = {"P": 0, "N": 1, "B": 2, "R": 3, "Q": 4, "K": 5}
+
+# piece letter, from file, from rank, capture, destination, promotion
+SAN_PATTERN = re.compile(r"^([NBRQK])?([a-h])?([1-8])?(x)?([a-h][1-8])(?:=?([NBRQnbrq]))?$")
+
+def legal_candidates(board, color: str, type_code: int, to_index: int) -> list[Move]:
+    """Return the legal moves for color of pieces of one type (Piece.type_code) to one square.
+    Promotions give one move per choice.
+    """
+    squares = board.squares
+    return [move for move in board.pseudo_legal_moves(color)
+            if move.to_index == to_index and squares[move.from_index].type_code == type_code
+            and board.is_legal_move(move.from_index, to_index, color)]
+
+def move_to_san(board, move: Move, color: str) -> str:
+    """Return the SAN of a legal move for color, including the check (+) or mate (#) suffix.
+    """
+    piece = board.squares[move.from_index]
+    if piece is None:
+        raise ValueError(f"No piece on {SQUARE_NAMES[move.from_index]}")
+
+    if isinstance(piece, King) and abs(move.to_index - move.from_index) == 2:
+        san = "O-O" if move.to_index > move.from_index else "O-O-O"
+    else:
+        san = _san_without_suffix(board, move, color, piece)
+
+    undo = board.make_move(move)
+    opponent = BLACK if color == WHITE else WHITE
+    if board.is_in_check(opponent):
+        san += "+" if board.has_any_legal_move(opponent) else "#"
+    board.unmake_move(undo)
+
+    return san
+
+def _san_without_suffix(board, move: Move, color: str, piece) -> str:
+    """Build SAN for a non-castling move: piece, disambiguation, capture, destination, promotion.
+    """
+    to_name = SQUARE_NAMES[move.to_index]
+    is_capture = board.squares[move.to_index] is not None
+
+    if isinstance(piece, Pawn):
+        if (move.from_index & 7) != (move.to_index & 7):
+            is_capture = True # Includes en passant
+            san = SQUARE_NAMES[move.from_index][0] + "x" + to_name
+        else:
+            san = to_name
+        if move.promotion is not None:
+            san += "=" + move.promotion
+        return san
+
+    # Other pieces of the same kind that could also go there
+    rivals = [other.from_index for other in legal_candidates(board, color, piece.type_code, move.to_index)
+              if other.from_index != move.from_index]
+
+    from_name = SQUARE_NAMES[move.from_index]
+    disambiguation = ""
+    if rivals:
+        if all((index & 7) != (move.from_index & 7) for index in rivals):
+            disambiguation = from_name[0] # The file is enough
+        elif all((index >> 3) != (move.from_index >> 3) for index in rivals):
+            disambiguation = from_name[1] # The rank is enough
+        else:
+            disambiguation = from_name    # Needs both
+
+    return PIECE_LETTERS[piece.type_code] + disambiguation + ("x" if is_capture else "") + to_name
+
+def parse_san(board, text: str, color: str) -> Move:
+    """Return the legal move for color described by a SAN string.
+    Raises ValueError if the text is not SAN or matches no legal move or several.
+    """
+    san = text.strip().rstrip("+#!?")
+
+    if san in ("O-O", "0-0", "O-O-O", "0-0-0"):
+        king_index = board.find_king_index(color)
+        if king_index is None:
+            raise ValueError(f"Illegal move: {text}")
+        to_index = king_index + (2 if len(san) == 3 else -2)
+        for move in legal_candidates(board, color, King.type_code, to_index):
+            if move.from_index == king_index:
+                return move
+        raise ValueError(f"Illegal move: {text}")
+
+    match = SAN_PATTERN.match(san)
+    if match is None:
+        raise ValueError(f"Invalid SAN: {text}")
+
+    letter, from_file, from_rank, _, to_name, promotion = match.groups()
+    type_code = LETTER_TYPE_CODES[letter or "P"]
+    to_index = SQUARE_INDEX[to_name]
+    promotion = promotion.upper() if promotion else None
+
+    squares = board.squares
+    candidates = []
+    for move in board.pseudo_legal_moves(color):
+        if move.to_index != to_index or move.promotion != promotion:
+            continue
+        if squares[move.from_index].type_code != type_code:
+            continue
+        from_name = SQUARE_NAMES[move.from_index]
+        if (from_file and from_name[0] != from_file) or (from_rank and from_name[1] != from_rank):
+            continue
+        if board.is_legal_move(move.from_index, to_index, color):
+            candidates.append(move)
+
+    if len(candidates) != 1:
+        raise ValueError(f"{'Ambiguous' if candidates else 'Illegal'} move: {text}")
+    return candidates[0]
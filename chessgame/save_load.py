@@ -1,18 +1,14 @@
+# Saved games live in one binary game store (chessgame.store) in SAVES_DIR.
+# Older saves were one JSON file each; those can still be listed and loaded.
 import json
 from pathlib import Path # We import Path for file path manipulations
+from chessgame.board import Board
 from chessgame.pieces import Pawn, Rook, Knight, Bishop, Queen, King
+from chessgame.store import GameStore, pack_position, set_board_from_position
+from chessgame.fen import board_from_fen, board_to_fen
 
 SAVES_DIR = Path("saves") # Directory to store save files
-
-def piece_to_record(square: str, piece: object) -> dict:
-    """Convert a chess piece to a serializable record.
-    """
-    return {
-        "square": square,                 # Position on the board (e.g., 'e4')
-        "type": piece.__class__.__name__, # Type of the piece (e.g., Pawn, Rook)
-        "color": piece.color,             # White or Black
-        "has_moved": piece.has_moved,     # For castling ad pawn
-    }
+STORE_NAME = "games.store" # Game store file inside SAVES_DIR
 
 def record_to_piece(type_name: str, color: str) -> object:
     """Convert a record back to a chess piece object.
@@ -32,48 +28,64 @@ def record_to_piece(type_name: str, color: str) -> object:
     
     raise ValueError(f"Unknown piece type: {type_name}")
 
-def save_game(board, turn: str, save_name: str) -> None:
-    """Save the current game state to a file.
+def open_store() -> GameStore:
+    """Open the game store in SAVES_DIR.
     """
-    SAVES_DIR.mkdir(exist_ok = True) # Ensure the saves directory exists
-    
-    data = {
-        "turn": turn, 
-        "en_passant_target": board.en_passant_target,
-        "pieces": []}
-    
-    from chessgame.types import position_to_square
+    return GameStore(SAVES_DIR / STORE_NAME)
 
-    # It helps to convert board positions to square notation
-    for row in range(8):
-        for col in range(8):
-            piece = board.grid[row][col]
-            if piece is None:
-                continue
-
-            square = position_to_square((row, col))
-            data["pieces"].append(piece_to_record(square, piece))
+def save_game(board, turn: str, save_name: str, moves=(), start_fen: str | None = None) -> None:
+    """Save the current game state to the game store.
+    moves are the moves played from start_fen (the current position if None), kept for PGN export.
+    """
+    start = None
+    if start_fen is not None:
+        start = pack_position(*board_from_fen(start_fen))
 
-    path = SAVES_DIR / f"{save_name}.json" # Save file path
-    path.write_text(json.dumps(data, indent = 2), encoding = "utf-8")
+    with open_store() as store:
+        store.append(save_name, board, turn, moves, start)
 
 def list_saves() -> list[str]:
     """List all saved games.
     """
     if not SAVES_DIR.exists():
         return []
-    return sorted(p.stem for p in SAVES_DIR.glob("*.json"))
+
+    with open_store() as store:
+        names = set(store.names())
+    names.update(p.stem for p in SAVES_DIR.glob("*.json")) # Saves from before the game store
+    return sorted(names)
 
 def load_game(board, save_name: str) -> str:
-    """Load a saved game state from a file.
+    """Load a saved game state and return the side to move.
+    """
+    with open_store() as store:
+        game_id = store.find(save_name)
+        if game_id is not None:
+            return store.load(game_id, board)
+
+    return load_json_game(board, save_name)
+
+def load_history(save_name: str) -> tuple[str | None, list]:
+    """Return (start FEN, moves played from it) of a saved game, or (None, []) if it has none.
+    """
+    with open_store() as store:
+        game_id = store.find(save_name)
+        if game_id is None:
+            return None, []
+
+        game = store.game(game_id)
+        board = Board()
+        turn = set_board_from_position(board, game.start)
+        return board_to_fen(board, turn), game.moves()
+
+def load_json_game(board, save_name: str) -> str:
+    """Load a saved game state from a JSON save file.
     """
     path = SAVES_DIR / f"{save_name}.json"
     data = json.loads(path.read_text(encoding = "utf-8"))
     
     # Clear the board first
-    for row in range(8):
-        for col in range(8):
-            board.grid[row][col] = None
+    board.clear()
 
     # Restore en passant target
     board.en_passant_target = data.get("en_passant_target", None)
@@ -82,6 +94,6 @@ def load_game(board, save_name: str) -> str:
     for rec in data["pieces"]:
         piece = record_to_piece(rec["type"], rec["color"])
         piece.has_moved = rec.get("has_moved", False) 
-        board.set_piece(rec["square"], piece)
+        board.set_piece(rec["square"], piece) # A flyweight board takes has_moved from here
 
-    return data["turn"] # White or Black
\ No newline at end of file
+    return data["turn"] # White or Black
@@ -0,0 +1,244 @@
+# Multi-Game Server
+#
+# One asyncio process hosting many independent games over a line protocol:
+# every request is one line of text and gets one reply line, so the same
+# protocol works over plain TCP (e.g. telnet) or forwarded as WebSocket text
+# frames. Games belong to the server, not to a connection, so a client can
+# play any number of games over one connection.
+#
+#   NEW [fen]             -> OK <id> <side to move>
+#   MOVE <id> <move>      -> OK <uci> <result> [reason]    (move: e2e4, e7e8q or SAN; result '*' while playing)
+#   MOVES <id>            -> OK <uci> <uci> ...            (legal moves of the side to move)
+#   FEN <id>              -> OK <fen>
+#   STATUS <id>           -> OK <side to move> <result> [reason]
+#   DRAW <id>             -> OK 1/2-1/2 <reason>           (claim threefold repetition or the 50-move rule)
+#   CLOSE <id>            -> OK
+#   STATS                 -> OK games=<n> moves=<n>
+#   QUIT                  closes the connection
+# Errors are answered with "ERR <message>".
+#
+# Boards are flyweight (shared pieces, has_moved in a bitmask), so a game is a
+# Board plus three slots. Moves are validated and played through move_piece.
+import asyncio
+import sys
+
+from chessgame.board import create_board
+from chessgame.pieces import WHITE, BLACK, Pawn
+from chessgame.move import Move
+from chessgame.types import SQUARE_INDEX
+from chessgame.fen import START_FEN
+from chessgame.san import parse_san
+
+DEFAULT_PORT = 7878
+DEFAULT_MAX_GAMES = 100000
+ONGOING = "*"
+
+class ServerGame:
+    """One hosted game: the board, the side to move and the result once it is over.
+    """
+    __slots__ = ("board", "turn", "result", "reason")
+
+    def __init__(self, board, turn: str):
+        """Create a game at the board's position with turn to move.
+        """
+        self.board = board
+        self.turn = turn
+        self.result = ONGOING
+        self.reason = ""
+
+def parse_move(board, text: str, color: str) -> Move:
+    """Read a move in coordinates (e2e4, e7e8q) or SAN (Nf3, e8=Q+) for color.
+    A pawn move to the last rank without a choice promotes to a queen.
+    Raises ValueError if the text is not a move.
+    """
+    if len(text) in (4, 5) and text[0:2] in SQUARE_INDEX and text[2:4] in SQUARE_INDEX:
+        move = Move.from_uci(text)
+        if move.promotion is None and (move.to_index < 8 or move.to_index > 55):
+            if isinstance(board.squares[move.from_index], Pawn):
+                move.promotion = "Q"
+        return move
+
+    san = text.rstrip("+#!?")
+    if not san:
+        raise ValueError("Missing move")
+    if san[0] in "abcdefgh" and san[-1] in "18" and "=" not in san:
+        text = san + "=Q" # Pawn to the last rank
+    return parse_san(board, text, color)
+
+class GameHost:
+    """All games of a server and the protocol commands on them.
+    handle(line) answers one request; it does not touch the network, so it can be used directly.
+    """
+    def __init__(self, max_games: int = DEFAULT_MAX_GAMES, backend: str = "list"):
+        """Create an empty host for at most max_games games at once.
+        """
+        self.games = {}
+        self.next_id = 1
+        self.max_games = max_games
+        self.backend = backend
+        self.moves_played = 0
+
+        self.commands = {
+            "NEW": self.new_game,
+            "MOVE": self.play,
+            "MOVES": self.legal_moves,
+            "FEN": self.fen,
+            "STATUS": self.status,
+            "DRAW": self.claim_draw,
+            "CLOSE": self.close_game,
+            "STATS": self.stats,
+        }
+
+    def handle(self, line: str) -> str:
+        """Answer one request line with one reply line (without the newline).
+        """
+        name, _, argument = line.strip().partition(" ")
+        command = self.commands.get(name.upper())
+        if command is None:
+            return f"ERR Unknown command: {name}"
+
+        try:
+            return f"OK {command(argument.strip())}".rstrip()
+        except (ValueError, KeyError) as error:
+            return f"ERR {error.args[0] if error.args else error}"
+        except Exception as error: # Any other failure answers this line only, the connection stays up
+            return f"ERR {type(error).__name__}: {error}"
+
+    def game(self, argument: str) -> tuple[ServerGame, str]:
+        """Return (game, rest of the argument) for a request starting with a game id.
+        """
+        game_id, _, rest = argument.partition(" ")
+        if not game_id.isdigit() or int(game_id) not in self.games:
+            raise KeyError(f"No game {game_id}")
+        return self.games[int(game_id)], rest.strip()
+
+    def new_game(self, argument: str) -> str:
+        """NEW [fen]: start a game from the start position or a FEN.
+        """
+        if len(self.games) >= self.max_games:
+            raise ValueError("Server is full")
+
+        board = create_board(self.backend, flyweight = True)
+        turn = board.set_fen(argument or START_FEN)
+
+        game = ServerGame(board, turn)
+        ended = board.game_result(turn)
+        if ended is not None:
+            game.result, game.reason = ended
+
+        game_id = self.next_id
+        self.next_id += 1
+        self.games[game_id] = game
+        return f"{game_id} {turn}"
+
+    def play(self, argument: str) -> str:
+        """MOVE <id> <move>: validate and play a move, then check for the end of the game.
+        """
+        game, text = self.game(argument)
+        if game.result != ONGOING:
+            raise ValueError(f"Game is over: {game.result} {game.reason}")
+        if not text:
+            raise ValueError("Missing move")
+
+        board = game.board
+        move = parse_move(board, text, game.turn)
+        if not board.play_move(move, game.turn):
+            raise ValueError(f"Illegal move: {text}")
+
+        self.moves_played += 1
+        game.turn = BLACK if game.turn == WHITE else WHITE
+
+        ended = board.game_result(game.turn)
+        if ended is not None:
+            game.result, game.reason = ended
+        return f"{move.uci()} {game.result} {game.reason}".rstrip()
+
+    def legal_moves(self, argument: str) -> str:
+        """MOVES <id>: list the legal moves of the side to move.
+        """
+        game, _ = self.game(argument)
+        if game.result != ONGOING:
+            return ""
+        return " ".join(move.uci() for move in game.board.generate_legal_moves(game.turn))
+
+    def fen(self, argument: str) -> str:
+        """FEN <id>: the current position.
+        """
+        game, _ = self.game(argument)
+        return game.board.to_fen(game.turn)
+
+    def status(self, argument: str) -> str:
+        """STATUS <id>: side to move, result and the reason the game ended.
+        """
+        game, _ = self.game(argument)
+        return f"{game.turn} {game.result} {game.reason}".rstrip()
+
+    def claim_draw(self, argument: str) -> str:
+        """DRAW <id>: end the game as a draw if the side to move can claim one.
+        """
+        game, _ = self.game(argument)
+        if game.result != ONGOING:
+            raise ValueError(f"Game is over: {game.result} {game.reason}")
+
+        ended = game.board.game_result(game.turn, claim_draw = True)
+        if ended is None:
+            raise ValueError("No draw can be claimed")
+        game.result, game.reason = ended
+        return f"{game.result} {game.reason}"
+
+    def close_game(self, argument: str) -> str:
+        """CLOSE <id>: forget a game.
+        """
+        game_id, _, _ = argument.partition(" ")
+        self.game(game_id)
+        del self.games[int(game_id)]
+        return ""
+
+    def stats(self, argument: str) -> str:
+        """STATS: number of hosted games and moves played.
+        """
+        return f"games={len(self.games)} moves={self.moves_played}"
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection until it sends QUIT or disconnects.
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+
+                text = line.decode("utf-8", "replace").strip()
+                if not text:
+                    continue
+                if text.upper() == "QUIT":
+                    break
+
+                writer.write(self.handle(text).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass # Client went away
+        finally:
+            writer.close()
+
+async def start_server(host: GameHost | None = None, address: str = "127.0.0.1",
+                       port: int = DEFAULT_PORT) -> asyncio.base_events.Server:
+    """Start listening and return the asyncio server (port 0 picks a free port).
+    """
+    if host is None:
+        host = GameHost()
+    return await asyncio.start_server(host.handle_connection, address, port, limit = 1 << 16)
+
+async def serve(address: str = "127.0.0.1", port: int = DEFAULT_PORT) -> None:
+    """Run a server until it is interrupted.
+    """
+    server = await start_server(GameHost(), address, port)
+    print(f"Chess server listening on {address}:{server.sockets[0].getsockname()[1]}")
+    async with server:
+        await server.serve_forever()
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(serve(port = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PORT))
+    except KeyboardInterrupt:
+        pass
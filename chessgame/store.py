@@ -0,0 +1,226 @@
+# Binary Game Store
+#
+# Many saved games in one append-only file, with a second file as its index.
+#
+#   games.store  b"CHSTORE1", then one record per saved game, back to back:
+#                  header          move count (u32), name length (u16), reserved (u16)
+#                  start position  46 bytes: packed board (chessgame.packing) + halfmove, fullmove (u16)
+#                  saved position  46 bytes, same layout
+#                  moves           move count x u16 (encode_move without the flags)
+#                  name            UTF-8
+#   games.idx    one u64 record offset per game; the game id is the entry number
+#
+# A record is written before its index entry, so a crash can leave unindexed
+# bytes at the end of the store but never an index entry without its record.
+# Readers map both files with mmap and slice records straight out of the map,
+# so reading game 250000 costs the same as reading game 0. Saving a name again
+# appends a new record; the latest record with a name is the one loaded.
+import mmap
+import struct
+from pathlib import Path
+
+from chessgame.move import encode_move, decode_move
+from chessgame.packing import pack_board, set_board_from_packed, PACKED_SIZE
+
+STORE_MAGIC = b"CHSTORE1"
+RECORD_HEADER = struct.Struct("<IHH")
+INDEX_ENTRY = struct.Struct("<Q")
+CLOCKS = struct.Struct("<HH")
+POSITION_SIZE = PACKED_SIZE + CLOCKS.size
+MOVE_MASK = 0x7FFF # From, to and promotion bits of encode_move
+
+def pack_position(board, color: str) -> bytes:
+    """Pack a board, the side to move and the move counters into POSITION_SIZE bytes.
+    """
+    return pack_board(board, color) + CLOCKS.pack(min(board.halfmove_clock, 0xFFFF),
+                                                  min(board.fullmove_number, 0xFFFF))
+
+def set_board_from_position(board, data) -> str:
+    """Set up a board from pack_position output and return the side to move.
+    """
+    color = set_board_from_packed(board, data[:PACKED_SIZE])
+    board.halfmove_clock, board.fullmove_number = CLOCKS.unpack_from(data, PACKED_SIZE)
+    return color
+
+class StoredGame:
+    """One game read from a GameStore.
+    start and position are memoryviews into the mapped store file (no copy).
+    """
+    __slots__ = ("game_id", "name", "start", "position", "move_data")
+
+    def __init__(self, game_id: int, name: str, start, position, move_data):
+        """Create a stored game view.
+        """
+        self.game_id = game_id
+        self.name = name
+        self.start = start         # POSITION_SIZE bytes
+        self.position = position   # POSITION_SIZE bytes
+        self.move_data = move_data # 2 bytes per move, little endian
+
+    def moves(self) -> list:
+        """Decode the moves played from the start position.
+        """
+        count = len(self.move_data) // 2
+        return [decode_move(value) for value in struct.unpack_from(f"<{count}H", self.move_data)]
+
+    def __repr__(self) -> str:
+        """Return a short readable representation of the stored game.
+        """
+        return f"StoredGame({self.game_id}, {self.name!r}, {len(self.move_data) // 2} moves)"
+
+class GameStore:
+    """Append-only store of saved games with random access by game id.
+    """
+    def __init__(self, path):
+        """Open (or prepare to create) a store file; the index sits next to it with an .idx suffix.
+        """
+        self.path = Path(path)
+        self.index_path = self.path.with_suffix(".idx")
+
+        self._store_map = None
+        self._index_map = None
+        self._mapped_count = 0 # Games covered by the current maps
+        self._names = {}       # Name -> latest game id
+        self._named_count = 0  # Games already read into _names
+
+    def __len__(self) -> int:
+        """Return the number of games in the store.
+        """
+        if not self.index_path.exists():
+            return 0
+        return self.index_path.stat().st_size // INDEX_ENTRY.size
+
+    def append(self, name: str, board, color: str, moves=(), start: bytes | None = None) -> int:
+        """Append a game: its name, current position (board, side to move) and the moves
+        played from start (a pack_position result, or the current position if None).
+        Returns the new game id.
+        """
+        position = pack_position(board, color)
+        if start is None:
+            start = position
+        if len(start) != POSITION_SIZE:
+            raise ValueError(f"Start position must be {POSITION_SIZE} bytes, got {len(start)}")
+
+        name_bytes = name.encode("utf-8")
+        codes = [encode_move(move) & MOVE_MASK for move in moves]
+
+        record = bytearray(RECORD_HEADER.pack(len(codes), len(name_bytes), 0))
+        record += start
+        record += position
+        record += struct.pack(f"<{len(codes)}H", *codes)
+        record += name_bytes
+
+        self.path.parent.mkdir(parents = True, exist_ok = True)
+        with open(self.path, "ab") as store:
+            if store.tell() == 0:
+                store.write(STORE_MAGIC)
+            offset = store.tell()
+            store.write(record)
+
+        with open(self.index_path, "ab") as index:
+            game_id = index.tell() // INDEX_ENTRY.size
+            index.write(INDEX_ENTRY.pack(offset))
+
+        return game_id
+
+    def _remap(self) -> None:
+        """Map the files again to cover games appended since the last mapping.
+        Old maps are not closed here: views handed out keep them alive until released.
+        """
+        count = len(self)
+        if count == 0:
+            return
+
+        with open(self.index_path, "rb") as index:
+            index_map = mmap.mmap(index.fileno(), 0, access = mmap.ACCESS_READ)
+        # The store is mapped after the index, so it holds every indexed record
+        with open(self.path, "rb") as store:
+            store_map = mmap.mmap(store.fileno(), 0, access = mmap.ACCESS_READ)
+
+        if store_map[:len(STORE_MAGIC)] != STORE_MAGIC:
+            raise ValueError(f"Not a game store: {self.path}")
+
+        self._index_map = index_map
+        self._store_map = store_map
+        self._mapped_count = len(index_map) // INDEX_ENTRY.size
+
+    def _record(self, game_id: int) -> tuple[int, int, int]:
+        """Return (record offset, move count, name length) of a game.
+        """
+        if game_id >= self._mapped_count:
+            self._remap()
+        if not 0 <= game_id < self._mapped_count:
+            raise IndexError(f"No game with id {game_id}")
+
+        offset = INDEX_ENTRY.unpack_from(self._index_map, game_id * INDEX_ENTRY.size)[0]
+        move_count, name_length, _ = RECORD_HEADER.unpack_from(self._store_map, offset)
+        return offset, move_count, name_length
+
+    def game(self, game_id: int) -> StoredGame:
+        """Return a game by id.
+        """
+        offset, move_count, name_length = self._record(game_id)
+        view = memoryview(self._store_map)
+
+        start = offset + RECORD_HEADER.size
+        moves = start + 2 * POSITION_SIZE
+        name = moves + 2 * move_count
+        return StoredGame(game_id, bytes(view[name:name + name_length]).decode("utf-8"),
+                          view[start:start + POSITION_SIZE], view[start + POSITION_SIZE:moves],
+                          view[moves:name])
+
+    def position(self, game_id: int):
+        """Return the saved position of a game as a memoryview (see pack_position).
+        """
+        offset = self._record(game_id)[0] + RECORD_HEADER.size + POSITION_SIZE
+        return memoryview(self._store_map)[offset:offset + POSITION_SIZE]
+
+    def load(self, game_id: int, board) -> str:
+        """Set up a board at the saved position of a game and return the side to move.
+        """
+        return set_board_from_position(board, self.position(game_id))
+
+    def names(self) -> dict[str, int]:
+        """Return every saved name with the id of its latest game.
+        """
+        count = len(self)
+        if self._named_count < count:
+            self._record(count - 1) # Map everything up to the last game
+
+            store_map = self._store_map
+            for game_id in range(self._named_count, count):
+                offset, move_count, name_length = self._record(game_id)
+                name = offset + RECORD_HEADER.size + 2 * POSITION_SIZE + 2 * move_count
+                self._names[store_map[name:name + name_length].decode("utf-8")] = game_id
+            self._named_count = count
+
+        return self._names
+
+    def find(self, name: str) -> int | None:
+        """Return the id of the latest game saved under a name, or None.
+        """
+        return self.names().get(name)
+
+    def close(self) -> None:
+        """Release the file maps (maps still viewed by StoredGames stay open until those are gone).
+        """
+        for mapped in (self._store_map, self._index_map):
+            if mapped is not None:
+                try:
+                    mapped.close()
+                except BufferError:
+                    pass # Still exported through a memoryview
+
+        self._store_map = None
+        self._index_map = None
+        self._mapped_count = 0
+
+    def __enter__(self) -> "GameStore":
+        """Use the store in a with block.
+        """
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Close the store at the end of a with block.
+        """
+        self.close()
@@ -0,0 +1,171 @@
+# Transposition Table
+#
+# A search reaches the same position through different move orders. The
+# transposition table remembers what was found for a position (depth, score,
+# bound type and best move) under its Zobrist key, so the search can reuse it.
+#
+# The table has a fixed size chosen in MB. It is two flat arrays of 64-bit
+# numbers (keys and packed data), so it never grows and costs 16 bytes per entry.
+# Entries come in buckets of two:
+#   slot 0 is depth-preferred: only replaced by a search at least as deep
+#   slot 1 is always-replace:  takes every other store
+# so deep results survive while recent shallow ones still find a place.
+from array import array
+
+from chessgame.move import encode_move, decode_move, Move
+
+# Bound types
+EMPTY = 0
+EXACT = 1       # The score is exact
+LOWER_BOUND = 2 # The score is at least this (the search failed high)
+UPPER_BOUND = 3 # The score is at most this (the search failed low)
+
+ENTRY_BYTES = 16   # 8 bytes key + 8 bytes data
+BUCKET_SIZE = 2
+SCORE_OFFSET = 1 << 31
+
+# Packed data layout:
+#   bits  0..31  score + SCORE_OFFSET
+#   bits 32..39  depth
+#   bits 40..41  bound type
+#   bits 42..60  move (encode_move) + 1, 0 for no move
+def pack_entry(depth: int, score: int, bound: int, move: Move | None) -> int:
+    """Pack depth, score, bound type and move into one 64-bit number.
+    """
+    move_bits = 0 if move is None else encode_move(move) + 1
+    return (score + SCORE_OFFSET) | (depth << 32) | (bound << 40) | (move_bits << 42)
+
+def unpack_entry(data: int) -> "TableEntry":
+    """Unpack a number created by pack_entry.
+    """
+    move_bits = data >> 42
+    return TableEntry((data >> 32) & 0xFF, (data & 0xFFFFFFFF) - SCORE_OFFSET, (data >> 40) & 3,
+                      None if move_bits == 0 else decode_move(move_bits - 1))
+
+class TableEntry:
+    """One stored search result.
+    """
+    __slots__ = ("depth", "score", "bound", "move")
+
+    def __init__(self, depth: int, score: int, bound: int, move: Move | None):
+        """Create an entry.
+        """
+        self.depth = depth
+        self.score = score
+        self.bound = bound
+        self.move = move
+
+    def __repr__(self) -> str:
+        """Return a readable representation of the entry.
+        """
+        return f"TableEntry(depth={self.depth}, score={self.score}, bound={self.bound}, move={self.move!r})"
+
+class TranspositionTable:
+    """Fixed-size hash table of search results keyed by Zobrist key.
+    """
+    def __init__(self, size_mb: float = 16):
+        """Create a table using at most size_mb megabytes.
+        The number of buckets is rounded down to a power of two.
+        """
+        buckets = max(1, int(size_mb * 1024 * 1024) // (ENTRY_BYTES * BUCKET_SIZE))
+        buckets = 1 << (buckets.bit_length() - 1) # Power of two, so the index is key & mask
+
+        self.size_mb = size_mb
+        self.bucket_mask = buckets - 1
+        self.keys = array("Q", bytes(8 * buckets * BUCKET_SIZE))
+        self.data = array("Q", bytes(8 * buckets * BUCKET_SIZE))
+
+        self.hits = 0       # Probes that found their position
+        self.misses = 0     # Probes that did not
+        self.collisions = 0 # Misses where the bucket held other positions
+        self.stores = 0
+        self.overwrites = 0 # Stores that replaced another position
+
+    def __len__(self) -> int:
+        """Return the number of entry slots.
+        """
+        return len(self.keys)
+
+    def probe(self, key: int) -> TableEntry | None:
+        """Return the stored entry for a position key, or None.
+        """
+        slot = (key & self.bucket_mask) * BUCKET_SIZE
+        keys = self.keys
+        data = self.data
+
+        for i in (slot, slot + 1):
+            if keys[i] == key and data[i]:
+                self.hits += 1
+                return unpack_entry(data[i])
+
+        self.misses += 1
+        if data[slot] or data[slot + 1]:
+            self.collisions += 1
+        return None
+
+    def store(self, key: int, depth: int, score: int, bound: int, move: Move | None = None) -> None:
+        """Store a search result using the depth-preferred/always-replace scheme.
+        """
+        slot = (key & self.bucket_mask) * BUCKET_SIZE
+        keys = self.keys
+        data = self.data
+        self.stores += 1
+
+        # Same position already in the bucket: update it in place, keeping a known best move
+        for i in (slot, slot + 1):
+            if keys[i] == key and data[i]:
+                if i == slot and depth < (data[i] >> 32) & 0xFF:
+                    break # Keep the deeper result in slot 0, store this one in slot 1
+                if move is None:
+                    old_move_bits = data[i] >> 42
+                    data[i] = pack_entry(depth, score, bound, None) | (old_move_bits << 42)
+                else:
+                    data[i] = pack_entry(depth, score, bound, move)
+                return
+
+        entry = pack_entry(depth, score, bound, move)
+
+        if not data[slot] or depth >= (data[slot] >> 32) & 0xFF:
+            # Depth-preferred slot: move its old entry down to the always-replace slot
+            if data[slot] and keys[slot] != key:
+                if data[slot + 1] and keys[slot + 1] != key:
+                    self.overwrites += 1
+                keys[slot + 1] = keys[slot]
+                data[slot + 1] = data[slot]
+            keys[slot] = key
+            data[slot] = entry
+        else:
+            if data[slot + 1] and keys[slot + 1] != key:
+                self.overwrites += 1
+            keys[slot + 1] = key
+            data[slot + 1] = entry
+
+    def clear(self) -> None:
+        """Empty the table and reset the counters.
+        """
+        size = len(self.keys)
+        self.keys = array("Q", bytes(8 * size))
+        self.data = array("Q", bytes(8 * size))
+        self.hits = self.misses = self.collisions = self.stores = self.overwrites = 0
+
+    def hashfull(self) -> int:
+        """Return how full the table is in permille, sampled over the first 1000 slots.
+        """
+        sample = min(1000, len(self.data))
+        used = sum(1 for i in range(sample) if self.data[i])
+        return used * 1000 // sample
+
+    def stats(self) -> dict[str, int]:
+        """Return the counters, e.g. for tuning the table size.
+        """
+        probes = self.hits + self.misses
+        return {
+            "entries": len(self.keys),
+            "hits": self.hits,
+            "misses": self.misses,
+            "collisions": self.collisions,
+            "stores": self.stores,
+            "overwrites": self.overwrites,
+            "hit_rate_permille": self.hits * 1000 // probes if probes else 0,
+            "hashfull": self.hashfull(),
+        }
@@ -57,4 +57,29 @@ def position_to_square(position: tuple[int, int]) -> str:
     file = FILES[col]       # Convert column index to file letter
     rank = str(8 - row)     # Convert row index to rank
 
-    return file + rank
\ No newline at end of file
+    return file + rank
+
+# Integer square indexing used by the rule engine.
+#
+# index = row * 8 + col, using the same rows and columns as above:
+# a8 -> 0, b8 -> 1, ..., h8 -> 7, a7 -> 8, ..., h1 -> 63
+SQUARE_NAMES = [FILES[col] + str(8 - row) for row in range(8) for col in range(8)]
+SQUARE_INDEX = {name: index for index, name in enumerate(SQUARE_NAMES)}
+
+def square_to_index(square: str) -> int:
+    """Converts a chess square into an index 0..63 on the board.
+    """
+    index = SQUARE_INDEX.get(square) # Fast path for clean input like 'e4'
+    if index is not None:
+        return index
+
+    row, col = square_to_position(square) # Validates and normalizes the input
+    return row * 8 + col
+
+def index_to_square(index: int) -> str:
+    """Converts an index 0..63 on the board into a chess square.
+    """
+    if index < 0 or index > 63:
+        raise ValueError("Invalid square index. Must be between 0 and 63.")
+
+    return SQUARE_NAMES[index]
@@ -0,0 +1,249 @@
+# UCI (Universal Chess Interface) Front-End
+#
+# Runs the engine as a headless process driven by a chess GUI or tournament
+# harness over stdin/stdout. Supported commands:
+#   uci, isready, ucinewgame, setoption name Hash value <MB>,
+#   position (startpos | fen <fen>) [moves <uci> ...],
+#   go [depth N] [movetime ms] [nodes N] [wtime ms btime ms winc ms binc ms movestogo N] [infinite],
+#   stop, quit
+#
+# stdin is read on the main thread and the search runs on a worker thread, so
+# 'stop' and 'isready' are answered while the engine thinks. The Board is kept
+# between 'position' commands: when the new move list extends the previous
+# one from the same start, only the new moves are played.
+import sys
+import threading
+import time
+
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.move import Move
+from chessgame.fen import START_FEN
+from chessgame.engine import Searcher, SearchLimits, MATE_SCORE, MAX_PLY, DEFAULT_TABLE_MB
+from chessgame.transposition import TranspositionTable
+
+ENGINE_NAME = "Chess-Game"
+ENGINE_AUTHOR = "Habil7"
+MAX_TABLE_MB = 1024
+DEFAULT_MOVES_TO_GO = 30 # Moves the remaining time is shared over when the GUI does not say
+
+def format_score(score: int) -> str:
+    """Return a UCI score: 'cp <centipawns>' or 'mate <moves>' (negative when getting mated).
+    """
+    if abs(score) >= MATE_SCORE - MAX_PLY:
+        plies = MATE_SCORE - abs(score)
+        moves = (plies + 1) // 2
+        return f"mate {moves if score > 0 else -moves}"
+    return f"cp {score}"
+
+def movetime_for(turn: str, options: dict[str, int]) -> float | None:
+    """Return the seconds to think from the clock fields of a 'go' command (None without a clock).
+    """
+    remaining = options.get("wtime" if turn == WHITE else "btime")
+    if remaining is None:
+        return None
+
+    increment = options.get("winc" if turn == WHITE else "binc", 0)
+    moves_to_go = options.get("movestogo") or DEFAULT_MOVES_TO_GO
+    budget = remaining / moves_to_go + increment * 3 / 4
+    return max(0.01, min(budget, remaining / 2) / 1000)
+
+class UciEngine:
+    """The engine state behind the UCI commands: board, searcher and the search thread.
+    """
+    def __init__(self, output=None):
+        """Create an engine writing its replies through output (print by default).
+        """
+        self.output = output if output is not None else self._print
+        self.output_lock = threading.Lock()
+
+        self.board = Board()
+        self.turn = self.board.set_fen(START_FEN)
+        self.start_fen = START_FEN
+        self.played = [] # UCI moves played from start_fen
+
+        self.searcher = Searcher(self.board)
+        self.search_thread = None
+        self.stop_event = threading.Event()
+
+    @staticmethod
+    def _print(line: str) -> None:
+        """Write one line to stdout straight away.
+        """
+        print(line, flush = True)
+
+    def send(self, line: str) -> None:
+        """Send one line to the GUI (safe from both threads).
+        """
+        with self.output_lock:
+            self.output(line)
+
+    def handle(self, line: str) -> bool:
+        """Handle one command line. Returns False after 'quit'.
+        """
+        words = line.split()
+        if not words:
+            return True
+        command, arguments = words[0], words[1:]
+
+        if command == "uci":
+            self.send(f"id name {ENGINE_NAME}")
+            self.send(f"id author {ENGINE_AUTHOR}")
+            self.send(f"option name Hash type spin default {DEFAULT_TABLE_MB} min 1 max {MAX_TABLE_MB}")
+            self.send("uciok")
+        elif command == "isready":
+            self.send("readyok")
+        elif command == "ucinewgame":
+            self.stop()
+            self.searcher = Searcher(self.board, TranspositionTable(self.searcher.table.size_mb))
+            self.set_position(START_FEN, [], force = True)
+        elif command == "setoption":
+            self.set_option(arguments)
+        elif command == "position":
+            self.stop()
+            self.position(arguments)
+        elif command == "go":
+            self.stop()
+            self.go(arguments)
+        elif command == "stop":
+            self.stop()
+        elif command == "quit":
+            self.stop()
+            return False
+        else:
+            self.send(f"info string Unknown command: {command}")
+
+        return True
+
+    def set_option(self, arguments: list[str]) -> None:
+        """setoption name <name> value <value> (only Hash is supported).
+        """
+        text = " ".join(arguments)
+        name, _, value = text.partition(" value ")
+        if name.removeprefix("name ").strip().lower() == "hash" and value.strip().isdigit():
+            self.stop()
+            size_mb = max(1, min(int(value), MAX_TABLE_MB))
+            self.searcher = Searcher(self.board, TranspositionTable(size_mb))
+        else:
+            self.send(f"info string Unsupported option: {text}")
+
+    def position(self, arguments: list[str]) -> None:
+        """position (startpos | fen <fen>) [moves ...]
+        """
+        if "moves" in arguments:
+            split = arguments.index("moves")
+            setup, moves = arguments[:split], arguments[split + 1:]
+        else:
+            setup, moves = arguments, []
+
+        if setup[:1] == ["startpos"]:
+            fen = START_FEN
+        elif setup[:1] == ["fen"] and len(setup) > 1:
+            fen = " ".join(setup[1:])
+        else:
+            self.send("info string Invalid position command")
+            return
+
+        self.set_position(fen, moves)
+
+    def set_position(self, fen: str, moves: list[str], force: bool = False) -> None:
+        """Bring the board to fen + moves, playing only the new moves when the previous
+        position command was the same start with a prefix of these moves.
+        """
+        played = self.played
+        if force or fen != self.start_fen or moves[:len(played)] != played:
+            try:
+                self.turn = self.board.set_fen(fen)
+            except ValueError as error:
+                self.send(f"info string {error}")
+                self.start_fen = None # Rebuild from scratch on the next position command
+                self.played = []
+                return
+            self.start_fen = fen
+            self.played = played = []
+
+        for text in moves[len(played):]:
+            try:
+                move = Move.from_uci(text)
+            except ValueError:
+                move = None
+            if move is None or not self.board.play_move(move, self.turn):
+                self.send(f"info string Illegal move: {text}")
+                break
+            played.append(text)
+            self.turn = BLACK if self.turn == WHITE else WHITE
+
+    def go(self, arguments: list[str]) -> None:
+        """go [depth N] [movetime ms] [nodes N] [wtime/btime/winc/binc ms] [movestogo N] [infinite]
+        Starts the search on a worker thread; it sends 'info' lines and then 'bestmove'.
+        """
+        options = {}
+        infinite = "infinite" in arguments
+        for name, value in zip(arguments, arguments[1:]):
+            if value.lstrip("-").isdigit():
+                options[name] = int(value)
+
+        movetime = options.get("movetime")
+        limits = SearchLimits(
+            depth = options.get("depth", MAX_PLY - 1 if infinite else None),
+            movetime = movetime / 1000 if movetime is not None else movetime_for(self.turn, options),
+            nodes = options.get("nodes"),
+        )
+        if infinite:
+            limits.movetime = limits.nodes = None
+
+        self.stop_event.clear()
+        self.searcher.stopped = False
+        self.searcher.on_iteration = self.send_info
+        self.search_thread = threading.Thread(target = self._search, args = (self.turn, limits, infinite),
+                                              daemon = True)
+        self.search_thread.start()
+
+    def _search(self, turn: str, limits: SearchLimits, infinite: bool) -> None:
+        """Search thread: run the search and send the best move.
+        """
+        start = time.perf_counter()
+        result = self.searcher.search(turn, limits)
+
+        if infinite:
+            self.stop_event.wait() # 'go infinite' answers only after 'stop'
+
+        elapsed = time.perf_counter() - start
+        self.send(f"info nodes {result.nodes} nps {int(result.nodes / max(elapsed, 1e-6))} "
+                  f"time {int(elapsed * 1000)}")
+        self.send(f"bestmove {result.move.uci() if result.move is not None else '0000'}")
+
+    def send_info(self, result) -> None:
+        """Send the 'info' line of one finished search depth.
+        """
+        elapsed = max(result.elapsed, 1e-6)
+        self.send(f"info depth {result.depth} score {format_score(result.score)} nodes {result.nodes} "
+                  f"nps {int(result.nodes / elapsed)} time {int(elapsed * 1000)} "
+                  f"hashfull {self.searcher.table.hashfull()} pv {' '.join(move.uci() for move in result.pv)}")
+
+    def stop(self) -> None:
+        """Stop a running search and wait for its thread, which sends 'bestmove'.
+        """
+        if self.search_thread is not None and self.search_thread.is_alive():
+            self.searcher.stop()
+            self.stop_event.set()
+        self.wait_for_search()
+
+    def wait_for_search(self) -> None:
+        """Wait until the search thread (if any) has finished.
+        """
+        if self.search_thread is not None:
+            self.search_thread.join()
+            self.search_thread = None
+
+def run(lines=None, output=None) -> None:
+    """Read UCI commands (stdin by default) until 'quit' or the end of the input.
+    """
+    engine = UciEngine(output)
+    for line in (sys.stdin if lines is None else lines):
+        if not engine.handle(line.strip()):
+            return
+    engine.stop()
+
+if __name__ == "__main__":
+    run()
@@ -1,12 +1,50 @@
+# Pygame Front-End
+#
+# Play with the mouse against another person or the engine:
+#   python -m chessgame.ui.pygame_ui        two players
+#   python -m chessgame.ui.pygame_ui b      the computer plays black (w: white)
+# Click a piece to see its legal moves, then click a highlighted square.
+# Keys: Q/R/B/N choose the promotion piece, F shows/hides the FPS overlay, Esc deselects.
+#
+# Only squares that changed are redrawn and pushed to the screen (dirty rects).
+# Piece images are rendered once from a font and pre-scaled to the square size.
+# The engine searches a copy of the board on a worker thread and posts its
+# move back as an event, so the window keeps drawing while it thinks.
+#
+# Needs pygame (pip install pygame).
+import sys
+import threading
+import time
+
 import pygame
 
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.fen import START_FEN
+from chessgame.engine import Searcher, SearchLimits
+from chessgame.san import move_to_san
+
 SQUARE_SIZE = 80
 BOARD_SIZE = 8
 WINDOW_SIZE = SQUARE_SIZE * BOARD_SIZE
+STATUS_HEIGHT = 28 # Status bar under the board (side to move, result, FPS overlay)
 
 LIGHT = (238, 238, 210)
 DARK  = (118, 150, 86)
-SELECT = (246, 246, 105)   # highlight selected
+SELECT = (246, 246, 105)       # highlight selected
+LAST_MOVE = (205, 210, 106)    # squares of the last move
+TARGET = (20, 85, 30, 110)     # legal destination marker (RGBA)
+STATUS_BACKGROUND = (40, 40, 40)
+STATUS_TEXT = (230, 230, 230)
+
+MAX_FPS = 60
+OVERLAY_INTERVAL = 0.25 # Seconds between FPS overlay updates
+ENGINE_MOVETIME = 2.0   # Seconds the computer thinks per move
+ENGINE_MOVE = pygame.USEREVENT + 1 # Posted by the engine thread with the move it found
+
+# Solid chess symbols: both colors use them and are told apart by the fill color
+PIECE_GLYPHS = {"K": "♚", "Q": "♛", "R": "♜", "B": "♝", "N": "♞", "P": "♟"}
+PIECE_FONTS = "dejavusans,segoeuisymbol,freeserif,notosanssymbols2,arialunicodems"
 
 def square_from_mouse(pos):
     x, y = pos
@@ -14,14 +52,318 @@ def square_from_mouse(pos):
     row = y // SQUARE_SIZE
     return row, col
 
-def draw_board(screen, selected=None):
-    for row in range(8):
-        for col in range(8):
-            color = LIGHT if (row + col) % 2 == 0 else DARK
-            rect = pygame.Rect(col*SQUARE_SIZE, row*SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
-            pygame.draw.rect(screen, color, rect)
-
-    if selected is not None:
-        row, col = selected
-        rect = pygame.Rect(col*SQUARE_SIZE, row*SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
-        pygame.draw.rect(screen, SELECT, rect, 4)
+def render_piece_sprites(size: int = SQUARE_SIZE) -> dict[str, pygame.Surface]:
+    """Render every piece once, scaled to fit a square, keyed by piece symbol ('K', 'p', ...).
+    Pieces are drawn from a font with chess symbols, or as lettered discs if none is found.
+    """
+    font = pygame.font.SysFont(PIECE_FONTS, int(size * 0.85))
+    has_glyphs = all(metrics is not None for metrics in font.metrics("".join(PIECE_GLYPHS.values())))
+    letter_font = pygame.font.SysFont(None, int(size * 0.5), bold = True)
+
+    sprites = {}
+    for letter, glyph in PIECE_GLYPHS.items():
+        for symbol, fill, edge in ((letter, (250, 250, 250), (20, 20, 20)),
+                                   (letter.lower(), (20, 20, 20), (250, 250, 250))):
+            if has_glyphs:
+                # An outline (the glyph drawn around the piece) keeps both colors visible on both squares
+                shape = font.render(glyph, True, fill)
+                outline = font.render(glyph, True, edge)
+                image = pygame.Surface((shape.get_width() + 4, shape.get_height() + 4), pygame.SRCALPHA)
+                for dx, dy in ((0, 0), (4, 0), (0, 4), (4, 4), (2, 0), (0, 2), (4, 2), (2, 4)):
+                    image.blit(outline, (dx, dy))
+                image.blit(shape, (2, 2))
+            else:
+                image = pygame.Surface((size, size), pygame.SRCALPHA)
+                pygame.draw.circle(image, edge, (size // 2, size // 2), size * 3 // 8)
+                pygame.draw.circle(image, fill, (size // 2, size // 2), size * 3 // 8 - 3)
+                text = letter_font.render(letter, True, edge)
+                image.blit(text, text.get_rect(center = (size // 2, size // 2)))
+
+            # Scale once to fit the square, keeping the aspect ratio
+            scale = size * 0.9 / max(image.get_width(), image.get_height())
+            scaled = (max(1, round(image.get_width() * scale)), max(1, round(image.get_height() * scale)))
+            sprites[symbol] = pygame.transform.smoothscale(image, scaled).convert_alpha()
+
+    return sprites
+
+def render_target_markers(size: int = SQUARE_SIZE) -> tuple[pygame.Surface, pygame.Surface]:
+    """Return the legal destination markers: a dot for empty squares, a ring for captures.
+    """
+    dot = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(dot, TARGET, (size // 2, size // 2), size // 7)
+
+    ring = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(ring, TARGET, (size // 2, size // 2), size // 2 - 2, size // 12)
+    return dot, ring
+
+class ChessUI:
+    """Game state of the window: the board, the selection and the squares waiting to be redrawn.
+    """
+    def __init__(self, screen: pygame.Surface, board: Board, turn: str, computer_color: str | None = None):
+        """Create the UI for a board with turn to move (computer_color: the engine's side, or None).
+        """
+        self.screen = screen
+        self.board = board
+        self.turn = turn
+        self.computer_color = computer_color
+        self.flipped = computer_color == WHITE # Show the human's side at the bottom
+
+        self.sprites = render_piece_sprites()
+        self.dot, self.ring = render_target_markers()
+        self.status_font = pygame.font.SysFont(None, 22)
+
+        self.selected = None   # Square index of the selected piece
+        self.targets = {}      # Destination index -> legal moves of the selected piece
+        self.last_move = ()    # (from index, to index) of the last move played
+        self.last_san = ""     # The last move in SAN, shown in the status bar
+        self.promotion = "Q"   # Piece a pawn promotes to
+        self.result = None     # (result, reason) once the game is over
+
+        self.searcher = Searcher(board.copy()) if computer_color is not None else None
+        self.thinking = False
+
+        self.show_overlay = True
+        self.overlay_text = ""
+        self.dirty = set(range(64)) # Squares to redraw on the next frame
+        self.status_dirty = True
+
+    def square_rect(self, index: int) -> pygame.Rect:
+        """Return the screen rectangle of a square index.
+        """
+        row, col = index >> 3, index & 7
+        if self.flipped:
+            row, col = 7 - row, 7 - col
+        return pygame.Rect(col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+
+    def square_at(self, pos) -> int | None:
+        """Return the square index under a mouse position, or None outside the board.
+        """
+        row, col = square_from_mouse(pos)
+        if not (0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE):
+            return None
+        if self.flipped:
+            row, col = 7 - row, 7 - col
+        return row * 8 + col
+
+    def human_to_move(self) -> bool:
+        """Check whether the mouse may move pieces now.
+        """
+        return self.result is None and not self.thinking and self.turn != self.computer_color
+
+    def click(self, index: int) -> None:
+        """Select a piece, move the selected piece to a highlighted square, or clear the selection.
+        """
+        if not self.human_to_move():
+            return
+
+        if self.selected is not None and index in self.targets:
+            moves = self.targets[index]
+            move = next((m for m in moves if m.promotion == self.promotion), moves[0])
+            self.select(None)
+            self.play(move)
+            return
+
+        piece = self.board.squares[index]
+        if piece is not None and piece.color == self.turn and index != self.selected:
+            self.select(index)
+        else:
+            self.select(None)
+
+    def select(self, index: int | None) -> None:
+        """Select a square (or nothing) and highlight the legal destinations of its piece.
+        The moves come from the board's cached legal move list.
+        """
+        self.dirty.update(self.targets)
+        if self.selected is not None:
+            self.dirty.add(self.selected)
+
+        self.selected = index
+        self.targets = {}
+        if index is not None:
+            for move in self.board.generate_legal_moves(self.turn):
+                if move.from_index == index:
+                    self.targets.setdefault(move.to_index, []).append(move)
+            self.dirty.add(index)
+            self.dirty.update(self.targets)
+
+    def play(self, move) -> None:
+        """Play a legal move, mark the squares it changed and hand over to the engine if it is next.
+        """
+        board = self.board
+        before = board.squares[:]
+        san = move_to_san(board, move, self.turn)
+        if not board.play_move(move, self.turn):
+            return
+
+        # Redraw what the move changed (castling and en passant touch more than two squares)
+        squares = board.squares
+        self.dirty.update(index for index in range(64) if squares[index] is not before[index])
+        self.dirty.update(self.last_move)
+        self.last_move = (move.from_index, move.to_index)
+        self.dirty.update(self.last_move)
+
+        self.last_san = san
+        self.turn = BLACK if self.turn == WHITE else WHITE
+        self.result = board.game_result(self.turn)
+        self.status_dirty = True
+
+        if self.result is None and self.turn == self.computer_color:
+            self.start_engine()
+
+    def start_engine(self) -> None:
+        """Search the position on a worker thread; the move arrives as an ENGINE_MOVE event.
+        The search runs on a copy of the board, so drawing never reads a board in the middle of a search.
+        """
+        self.thinking = True
+        self.status_dirty = True
+        self.searcher.board = self.board.copy()
+
+        def think(turn: str) -> None:
+            result = self.searcher.search(turn, SearchLimits(movetime = ENGINE_MOVETIME))
+            try:
+                pygame.event.post(pygame.event.Event(ENGINE_MOVE, move = result.move))
+            except pygame.error:
+                pass # The window was closed while the engine was thinking
+
+        threading.Thread(target = think, args = (self.turn,), daemon = True).start()
+
+    def engine_moved(self, move) -> None:
+        """Play the move found by the engine thread.
+        """
+        self.thinking = False
+        if move is not None and self.result is None:
+            self.play(move)
+        self.status_dirty = True
+
+    def stop_engine(self) -> None:
+        """Ask a running search to stop (when the window closes).
+        """
+        if self.thinking:
+            self.searcher.stop()
+
+    def draw_square(self, index: int) -> pygame.Rect:
+        """Draw one square with its highlight, piece and legal destination marker.
+        """
+        rect = self.square_rect(index)
+        row, col = index >> 3, index & 7
+        color = LIGHT if (row + col) % 2 == 0 else DARK
+        if index == self.selected:
+            color = SELECT
+        elif index in self.last_move:
+            color = LAST_MOVE
+        self.screen.fill(color, rect)
+
+        piece = self.board.squares[index]
+        if piece is not None:
+            sprite = self.sprites[piece.symbol()]
+            self.screen.blit(sprite, sprite.get_rect(center = rect.center))
+
+        if index in self.targets:
+            self.screen.blit(self.ring if piece is not None else self.dot, rect)
+        return rect
+
+    def status_text(self) -> str:
+        """Return the status bar text (the FPS overlay is drawn separately).
+        """
+        last = f"Last move {self.last_san} - " if self.last_san else ""
+        if self.result is not None:
+            return f"{last}{self.result[0]} ({self.result[1]})"
+        text = f"{last}{self.turn.capitalize()} to move"
+        if self.thinking:
+            text += " - thinking..."
+        if self.board.is_in_check(self.turn):
+            text += " - check"
+        return f"{text}   promote to {self.promotion}"
+
+    def draw_status(self) -> pygame.Rect:
+        """Draw the status bar with the FPS overlay on its right.
+        """
+        rect = pygame.Rect(0, WINDOW_SIZE, WINDOW_SIZE, STATUS_HEIGHT)
+        self.screen.fill(STATUS_BACKGROUND, rect)
+
+        text = self.status_font.render(self.status_text(), True, STATUS_TEXT)
+        self.screen.blit(text, text.get_rect(midleft = (8, rect.centery)))
+        if self.show_overlay and self.overlay_text:
+            overlay = self.status_font.render(self.overlay_text, True, STATUS_TEXT)
+            self.screen.blit(overlay, overlay.get_rect(midright = (WINDOW_SIZE - 8, rect.centery)))
+        return rect
+
+    def update_overlay(self, fps: float, frame_ms: float) -> None:
+        """Set the FPS overlay text; the status bar is redrawn only if it changed.
+        """
+        text = f"{fps:4.0f} fps  {frame_ms:5.2f} ms/frame"
+        if text != self.overlay_text:
+            self.overlay_text = text
+            self.status_dirty = self.status_dirty or self.show_overlay
+
+    def draw(self) -> list[pygame.Rect]:
+        """Redraw the dirty squares (and the status bar if needed) and return the changed rectangles.
+        """
+        rects = [self.draw_square(index) for index in self.dirty]
+        self.dirty.clear()
+
+        if self.status_dirty:
+            rects.append(self.draw_status())
+            self.status_dirty = False
+        return rects
+
+    def key(self, key: int) -> None:
+        """Handle a key press.
+        """
+        if key == pygame.K_ESCAPE:
+            self.select(None)
+        elif key == pygame.K_f:
+            self.show_overlay = not self.show_overlay
+            self.status_dirty = True
+        elif key in (pygame.K_q, pygame.K_r, pygame.K_b, pygame.K_n):
+            self.promotion = pygame.key.name(key).upper()
+            self.status_dirty = True
+
+def run(computer_color: str | None = None, fen: str = START_FEN) -> None:
+    """Open the window and play until it is closed.
+    """
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_SIZE, WINDOW_SIZE + STATUS_HEIGHT))
+    pygame.display.set_caption("Chess Game")
+
+    board, turn = Board.from_fen(fen)
+    ui = ChessUI(screen, board, turn, computer_color)
+    if turn == computer_color:
+        ui.start_engine()
+
+    clock = pygame.time.Clock()
+    last_overlay = 0.0
+    running = True
+
+    while running:
+        frame_start = time.perf_counter()
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+                index = ui.square_at(event.pos)
+                if index is not None:
+                    ui.click(index)
+            elif event.type == pygame.KEYDOWN:
+                ui.key(event.key)
+            elif event.type == ENGINE_MOVE:
+                ui.engine_moved(event.move)
+
+        rects = ui.draw()
+        if rects:
+            pygame.display.update(rects) # Push only the changed rectangles
+
+        # Frame time is the work done in a frame, without the wait for the next one
+        now = time.perf_counter()
+        if now - last_overlay >= OVERLAY_INTERVAL:
+            ui.update_overlay(clock.get_fps(), (now - frame_start) * 1000)
+            last_overlay = now
+        clock.tick(MAX_FPS)
+
+    ui.stop_engine()
+    pygame.quit()
+
+if __name__ == "__main__":
+    side = sys.argv[1].lower() if len(sys.argv) > 1 else ""
+    run({"w": WHITE, "white": WHITE, "b": BLACK, "black": BLACK}.get(side))
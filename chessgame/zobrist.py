@@ -0,0 +1,65 @@
+# Zobrist Hashing
+#
+# A Zobrist key identifies a position with one 64-bit number. Every
+# (piece, square) pair, every castling-rights combination, every en passant
+# file and the side to move gets a fixed random number, and the key of a
+# position is the XOR of the numbers of everything in it. Because XOR undoes
+# itself, the Board can update the key piece by piece as squares change.
+import random
+
+from chessgame.pieces import Pawn, WHITE, BLACK
+from chessgame.attacks import PAWN_CAPTURES
+
+# Piece codes 0..11: white pawn..king, then black pawn..king (Piece.type_code + color offset)
+COLOR_CODE_OFFSET = {WHITE: 0, BLACK: 6}
+
+# Castling rights as bits of a 0..15 number
+WHITE_KINGSIDE = 1
+WHITE_QUEENSIDE = 2
+BLACK_KINGSIDE = 4
+BLACK_QUEENSIDE = 8
+
+_rng = random.Random(20240611) # Fixed seed: the same position always gets the same key
+
+PIECE_KEYS = [[_rng.getrandbits(64) for _ in range(64)] for _ in range(12)]
+CASTLING_KEYS = [_rng.getrandbits(64) for _ in range(16)]
+EN_PASSANT_KEYS = [_rng.getrandbits(64) for _ in range(8)] # One per file
+BLACK_TO_MOVE_KEY = _rng.getrandbits(64)
+
+def piece_square_key(piece, index: int) -> int:
+    """Return the key of one piece standing on one square.
+    """
+    return PIECE_KEYS[COLOR_CODE_OFFSET[piece.color] + piece.type_code][index]
+
+def en_passant_key(board, color: str) -> int:
+    """Return the en passant part of the key for the side to move.
+    The en passant square only counts when a pawn of that side could capture on it.
+    """
+    target = board.en_passant_index
+    if target is None:
+        return 0
+
+    # A capturing pawn stands where an opponent pawn on the target square would capture
+    opponent = BLACK if color == WHITE else WHITE
+    for index in PAWN_CAPTURES[opponent][target]:
+        piece = board.squares[index]
+        if piece is not None and piece.color == color and isinstance(piece, Pawn):
+            return EN_PASSANT_KEYS[target & 7]
+
+    return 0
+
+def compute_zobrist_key(board, color: str) -> int:
+    """Compute the key of a position from scratch (Board keeps it incrementally).
+    """
+    key = 0
+    for index in range(64):
+        piece = board.squares[index]
+        if piece is not None:
+            key ^= piece_square_key(piece, index)
+
+    key ^= CASTLING_KEYS[board.castling_rights()]
+    key ^= en_passant_key(board, color)
+    if color == BLACK:
+        key ^= BLACK_TO_MOVE_KEY
+
+    return key
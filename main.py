@@ -1,6 +1,13 @@
 from chessgame.board import Board
 from chessgame.pieces import WHITE, BLACK
-from chessgame.save_load import save_game, load_game, list_saves
+from chessgame.save_load import save_game, load_game, list_saves, load_history, SAVES_DIR
+from chessgame.move import Move
+from chessgame.types import square_to_index
+from chessgame.engine import Searcher, SearchLimits
+from chessgame.pgn import Game, write_games
+from chessgame.san import parse_san, move_to_san
+
+ENGINE_MOVETIME = 2.0 # Seconds the computer thinks per move
 
 def is_valid_square(square: str) -> bool:
     """Check if the given square (e.g., 'e4') is a valid chess board square.
@@ -19,12 +26,18 @@ def is_valid_square(square: str) -> bool:
     
     return True
 
+def is_coordinate_move(text: str) -> bool:
+    """Check if the text is a move in coordinates like 'e2e4' or 'e7e8q' (not SAN).
+    """
+    return len(text) in (4, 5) and is_valid_square(text[0:2]) and is_valid_square(text[2:4])
+
 def main():
     """Main function to start the chess game.
     """
     print("Chess Game and First Project started and launched!")
 
     board = Board() # Initialize the chess board
+    start_fen, played = None, [] # Moves played from start_fen, for saves and 'pgn NAME'
 
     # Offer to load a saved game or start a new one
     print("1) New game")  
@@ -57,63 +70,130 @@ def main():
                 else:
                     save_name = saves[idx]
                     turn = load_game(board, save_name)
+                    start_fen, played = load_history(save_name)
+                    if played:
+                        # Replay the saved moves so repetitions count from the start of the game
+                        turn = board.set_fen(start_fen)
+                        for saved_move in played:
+                            board.play_move(saved_move, turn)
+                            turn = BLACK if turn == WHITE else WHITE
 
     else:
         board.setup_starting_position()
         turn = WHITE  # White starts first, always
 
+    # Choose which side (if any) the computer plays
+    computer = input("Computer plays (w/b, Enter for none): ").strip().lower()
+    computer_color = {"w": WHITE, "white": WHITE, "b": BLACK, "black": BLACK}.get(computer)
+    searcher = Searcher(board) if computer_color is not None else None
+
+    if start_fen is None:
+        start_fen = board.to_fen(turn)
+
     board.print_board()
   
     while True:
         print(f"\nTurn: {turn}") # Indicate whose turn it is
-        move = input("Enter move (e2 e4), 'save NAME', or 'quit': ").strip()
 
-        # Handle quitting the game
-        if move == "quit" or move == "exit":
-            print("Exiting the game.")
-            break
+        if turn == computer_color:
+            # Computer move
+            result = searcher.search(turn, SearchLimits(movetime = ENGINE_MOVETIME))
+            print(f"Computer plays {move_to_san(board, result.move, turn)} (depth {result.depth}, score {result.score}, "
+                  f"{result.nodes} nodes)")
+            board.play_move(result.move, turn)
+            played.append(result.move)
+        else:
+            move = input("Enter move (e2 e4, e7e8q, Nf3 or O-O), 'save NAME', 'pgn NAME', 'draw', or 'quit': ").strip()
+
+            # Handle quitting the game
+            if move == "quit" or move == "exit":
+                print("Exiting the game.")
+                break
+
+            # Handle claiming a draw (threefold repetition or the 50-move rule)
+            if move == "draw":
+                result = board.game_result(turn, claim_draw = True)
+                if result is None:
+                    print("No draw can be claimed in this position.")
+                    continue
+                print(f"DRAW! {result[1].capitalize()}.")
+                break
+
+            # Handle saving the game
+            if move.lower().startswith("save"):
+                parts = move.split()
+                if len(parts) != 2:
+                    print("Use: save NAME")
+                    continue
+                save_name = parts[1]
+                save_game(board, turn, save_name, played, start_fen)
+                print(f"Game saved as '{save_name}'.")
+                continue
+
+            # Handle exporting the moves played so far as PGN
+            if move.lower().startswith("pgn"):
+                parts = move.split()
+                if len(parts) != 2:
+                    print("Use: pgn NAME")
+                    continue
+                SAVES_DIR.mkdir(exist_ok = True)
+                path = SAVES_DIR / f"{parts[1]}.pgn"
+                players = {color.capitalize(): "Computer" if color == computer_color else "Player" for color in (WHITE, BLACK)}
+                write_games([Game.from_moves(played, players, fen = start_fen)], path)
+                print(f"Game exported to '{path}'.")
+                continue
 
-        # Handle saving the game
-        if move.lower().startswith("save"):
             parts = move.split()
-            if len(parts) != 2:
-                print("Use: save NAME")
+
+            # Standard Algebraic Notation: "Nf3", "exd5", "O-O", "e8=Q+"
+            if len(parts) == 1 and not is_coordinate_move(parts[0]):
+                try:
+                    san_move = parse_san(board, parts[0], turn)
+                except ValueError as error:
+                    print(f"{error}. Please try again.")
+                    continue
+                parts = [san_move.from_square, san_move.to_square] + ([san_move.promotion] if san_move.promotion else [])
+
+            # Accept "e2 e4", "e7 e8 q", "e2e4" and "e7e8q"
+            if len(parts) == 1 and len(parts[0]) in (4, 5):
+                text = parts[0]
+                parts = [text[0:2], text[2:4]] + ([text[4]] if len(text) == 5 else [])
+
+            if len(parts) not in (2, 3):
+                print("Invalid move format. Please enter moves like 'e2 e4'.")
                 continue
-            save_name = parts[1]
-            save_game(board, turn, save_name)
-            print(f"Game saved as '{save_name}'.")
-            continue
 
-        parts = move.split()
+            from_square, to_square = parts[0], parts[1]
 
-        if len(parts) != 2:
-            print("Invalid move format. Please enter moves like 'e2 e4'.")
-            continue
+            if not is_valid_square(from_square) or not is_valid_square(to_square):
+                print("Invalid square. Please use squares like e2 e4.")
+                continue
 
-        from_square, to_square = parts
+            promotion = parts[2] if len(parts) == 3 else None
+            if promotion is not None and promotion.upper() not in ("Q", "R", "B", "N"):
+                print("Invalid promotion piece. Please use Q, R, B or N.")
+                continue
 
-        if not is_valid_square(from_square) or not is_valid_square(to_square):
-            print("Invalid square. Please use squares like e2 e4.")
-            continue
-        
-        # Try to move a piece from one square to another
-        move_successful = board.move_piece(from_square, to_square, turn)
+            # Pawn promotion choice, asked before the move so the position is recorded with the new piece
+            piece = board.get_piece(from_square)
+            from_index, to_index = square_to_index(from_square), square_to_index(to_square)
+
+            # Check that the piece exists, is a pawn and legally reaches the last rank
+            if promotion is None and piece is not None and piece.__class__.__name__ == "Pawn":
+                if (piece.color == WHITE and to_square[1] == "8") or (piece.color == BLACK and to_square[1] == "1"):
+                    if board.follows_move_rules(from_index, to_index, turn) and board.is_legal_move(from_index, to_index, turn):
+                        # Ask the player what piece to promote to (anything else promotes to a queen)
+                        choice = input("Promote pawn to (Q/R/B/N): ").strip().upper()
+                        promotion = choice if choice in ("Q", "R", "B", "N") else "Q"
+
+            # Try to move a piece from one square to another
+            move_successful = board.play_move(Move.from_squares(from_square, to_square, promotion), turn)
         
-        if not move_successful:
-            print("Invalid move. Please try again.")
-            continue
-
-        # Pawn promotion choice 
-        piece = board.get_piece(to_square)
-
-        # Check that the piece exists and is a pawn
-        if piece is not None and piece.__class__.__name__ == "Pawn":
-            # Check if the pawn reached the last rank for promotion
-            if (piece.color == WHITE and to_square[1] == "8") or (piece.color == BLACK and to_square[1] == "1"):
-                # Ask the player what piece to promote to
-                choice = input("Promote pawn to (Q/R/B/N): ")
-                # Promote the pawn using the Board method
-                board.promote_pawn(to_square, choice)
+            if not move_successful:
+                print("Invalid move. Please try again.")
+                continue
+
+            played.append(Move.from_squares(from_square, to_square, promotion))
 
         board.print_board() # Print the board after the move
 
@@ -134,6 +214,15 @@ def main():
             print("STALEMATE! The game is a draw.")
             break
 
+        # Check for the automatic draws: insufficient material, fivefold repetition, 75-move rule
+        result = board.game_result(opponent)
+        if result is not None:
+            print(f"DRAW! {result[1].capitalize()}.")
+            break
+
+        if board.is_threefold_repetition() or board.is_fifty_move_rule():
+            print("A draw can be claimed: enter 'draw'.")
+
         # Switch the turn
         turn = opponent
 
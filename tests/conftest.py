@@ -1,5 +1,18 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
-sys.path.insert(0, str(PROJECT_ROOT))
\ No newline at end of file
+sys.path.insert(0, str(PROJECT_ROOT))
+
+def pytest_addoption(parser):
+    parser.addoption("--board-backend", default = "list", choices = ["list", "bitboard"],
+                     help = "Board backend used by the tests that construct Board()")
+
+# Run the whole suite against another backend with: pytest --board-backend=bitboard
+@pytest.fixture(autouse = True)
+def board_backend(request, monkeypatch):
+    if request.config.getoption("--board-backend") == "bitboard" and hasattr(request.module, "Board"):
+        from chessgame.bitboard import BitboardBoard
+        monkeypatch.setattr(request.module, "Board", BitboardBoard)
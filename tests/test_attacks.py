@@ -0,0 +1,30 @@
+from chessgame.attacks import (KNIGHT_TARGETS, KING_TARGETS, PAWN_CAPTURES, RAYS, DIRECTION_TO,
+                               SQUARES_BETWEEN, NORTH, SOUTH_EAST)
+from chessgame.pieces import WHITE, BLACK
+from chessgame.types import square_to_index, index_to_square
+
+def names(indices):
+    return sorted(index_to_square(i) for i in indices)
+
+# Test knight and king jump tables, including the board edges
+def test_jump_tables():
+    assert names(KNIGHT_TARGETS[square_to_index("a1")]) == ["b3", "c2"]
+    assert len(KNIGHT_TARGETS[square_to_index("d4")]) == 8
+    assert names(KING_TARGETS[square_to_index("h8")]) == ["g7", "g8", "h7"]
+
+# Test pawn capture squares for both colors
+def test_pawn_capture_tables():
+    assert names(PAWN_CAPTURES[WHITE][square_to_index("e4")]) == ["d5", "f5"]
+    assert names(PAWN_CAPTURES[BLACK][square_to_index("a5")]) == ["b4"]
+
+# Test rays are ordered nearest first and stop at the edge
+def test_ray_tables():
+    assert [index_to_square(i) for i in RAYS[square_to_index("e4")][NORTH]] == ["e5", "e6", "e7", "e8"]
+    assert [index_to_square(i) for i in RAYS[square_to_index("a8")][SOUTH_EAST]][-1] == "h1"
+
+# Test line lookups between aligned squares
+def test_line_tables():
+    c1, f4, c3 = square_to_index("c1"), square_to_index("f4"), square_to_index("c3")
+    assert names(SQUARES_BETWEEN[c1][f4]) == ["d2", "e3"]
+    assert DIRECTION_TO[c1][c3] == NORTH
+    assert DIRECTION_TO[c3][f4] is None
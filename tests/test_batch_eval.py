@@ -0,0 +1,49 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.evaluation import MAX_PHASE
+from chessgame.packing import pack_board
+from chessgame.perft import PERFT_SUITE
+from chessgame.fen import board_from_fen
+from chessgame.save_load import save_game, load_game
+from chessgame.batch_eval import positions_to_array, packed_to_array, evaluate_array, batch_evaluate
+
+def piece_square_score(board, color):
+    phase = min(board.phase, MAX_PHASE)
+    score = (board.eval_mg * phase + board.eval_eg * (MAX_PHASE - phase)) // MAX_PHASE
+    return score if color == WHITE else -score
+
+# Test that the array scores match the Board's incremental piece-square scores
+def test_batch_matches_board_scores():
+    positions = [board_from_fen(fen) for _, fen, _ in PERFT_SUITE]
+    scores = batch_evaluate(positions)
+
+    assert scores.shape == (len(positions),)
+    assert list(scores) == [piece_square_score(board, turn) for board, turn in positions]
+
+# Test that packed boards give the same array as boards
+def test_packed_boards():
+    positions = [board_from_fen(fen) for _, fen, _ in PERFT_SUITE]
+    codes, sides = positions_to_array(positions)
+
+    packed_codes, packed_sides = packed_to_array(b"".join(pack_board(b, t) for b, t in positions))
+    assert packed_codes.dtype == np.int8 and packed_codes.shape == (len(positions), 64)
+    assert (packed_codes == codes).all() and (packed_sides == sides).all()
+
+    mixed = batch_evaluate([positions[0], pack_board(*positions[1]), PERFT_SUITE[2][1]])
+    assert list(mixed) == list(evaluate_array(codes[:3], sides[:3]))
+
+# Test that boards loaded from a save file can be scored
+def test_loaded_board(tmp_path, monkeypatch):
+    monkeypatch.setattr("chessgame.save_load.SAVES_DIR", tmp_path)
+    b = Board()
+    b.setup_starting_position()
+    assert b.move_piece("e2", "e4", WHITE) is True
+    save_game(b, BLACK, "batch")
+
+    loaded = Board()
+    turn = load_game(loaded, "batch")
+    assert list(batch_evaluate([(loaded, turn)])) == [piece_square_score(b, BLACK)]
@@ -0,0 +1,54 @@
+from chessgame.board import Board as ListBoard, create_board
+from chessgame.bitboard import BitboardBoard, PAWN, KING
+from chessgame.pieces import Pawn, Rook, Bishop, Queen, King, WHITE, BLACK
+from chessgame.types import square_to_index
+
+# Test that the backend is selected when the board is constructed
+def test_create_board_selects_backend():
+    assert type(create_board()) is ListBoard
+    assert isinstance(create_board("bitboard"), BitboardBoard)
+
+# Test that the bitboards follow every change to the squares
+def test_bitboards_track_pieces():
+    b = BitboardBoard()
+    b.setup_starting_position()
+
+    assert b.pieces_of(WHITE, PAWN) == 0xFF << 48
+    assert b.pieces_of(BLACK, PAWN) == 0xFF << 8
+    assert bin(b.occupied).count("1") == 32
+
+    assert b.move_piece("e2", "e4", WHITE) is True
+    assert b.pieces_of(WHITE, PAWN) >> square_to_index("e4") & 1
+    assert not b.pieces_of(WHITE, PAWN) >> square_to_index("e2") & 1
+    assert b.find_king("black") == "e8"
+
+# Test that attack queries agree with the list backend
+def test_attacks_match_list_backend():
+    boards = [ListBoard(), BitboardBoard()]
+    for b in boards:
+        b.set_piece("e1", King(WHITE))
+        b.set_piece("d4", Queen(BLACK))
+        b.set_piece("b7", Bishop(BLACK))
+        b.set_piece("h8", Rook(BLACK))
+        b.set_piece("f5", Pawn(WHITE))
+        b.set_piece("c6", Pawn(BLACK))
+
+    for index in range(64):
+        for color in (WHITE, BLACK):
+            assert boards[0].is_index_attacked(index, color) == boards[1].is_index_attacked(index, color)
+
+# Test that checkmate, stalemate and promotion work on the bitboard backend
+def test_bitboard_game_rules():
+    b = BitboardBoard()
+    b.set_piece("a8", King(BLACK))
+    b.set_piece("c6", King(WHITE))
+    b.set_piece("b7", Queen(WHITE))
+    assert b.is_checkmate(BLACK) is True
+
+    b = BitboardBoard()
+    b.set_piece("a7", Pawn(WHITE))
+    assert b.move_piece("a7", "a8", WHITE) is True
+    assert b.promote_pawn("a8", "Q") is True
+    assert b.pieces_of(WHITE, PAWN) == 0
+    assert isinstance(b.get_piece("a8"), Queen)
+    assert b.pieces_of(WHITE, KING) == 0
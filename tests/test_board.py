@@ -1,3 +1,5 @@
+import pytest
+
 from chessgame.board import Board
 from chessgame.pieces import Pawn, Rook, Knight, Bishop, Queen, King, WHITE, BLACK
 
@@ -510,4 +512,30 @@ def test_castle_blocked_if_path_attacked():
     # Attacker rook on f8 attacks f1 down the file (f7..f2 empty by default)
     b.set_piece("f8", Rook(BLACK))
 
-    assert b.move_piece("e1", "g1", WHITE) is False
\ No newline at end of file
+    assert b.move_piece("e1", "g1", WHITE) is False
+
+# Test that the index API and the algebraic-string API see the same squares
+def test_index_api_matches_square_api():
+    from chessgame.types import square_to_index, index_to_square
+
+    b = Board()
+    b.setup_starting_position()
+
+    assert square_to_index("a8") == 0
+    assert square_to_index("h1") == 63
+    assert index_to_square(square_to_index("e4")) == "e4"
+
+    assert b.get_piece_at(square_to_index("e1")) is b.get_piece("e1")
+    assert b.move_by_index(square_to_index("e2"), square_to_index("e4"), WHITE) is True
+    assert isinstance(b.get_piece("e4"), Pawn)
+    assert b.en_passant_target == "e3"
+
+# Test that grid is a read-only view: writing to it fails instead of changing a copy
+def test_grid_is_read_only():
+    b = Board()
+    b.set_piece("e2", Pawn(WHITE))
+    assert b.grid[6][4] is b.get_piece("e2")
+
+    with pytest.raises(TypeError):
+        b.grid[4][4] = Pawn(WHITE)
+    assert b.get_piece("e4") is None
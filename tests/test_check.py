@@ -28,4 +28,30 @@ def test_king_cannot_move_next_to_enemy_king():
     b.set_piece("e6", King(BLACK))
 
     # White king tries to move next to black king
-    assert b.move_piece("e4", "e5", WHITE) is False
\ No newline at end of file
+    assert b.move_piece("e4", "e5", WHITE) is False
+
+# Test that the king square is tracked as the king moves and is removed
+def test_king_square_is_tracked():
+    b = Board()
+    assert b.find_king(WHITE) is None
+
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("e8", King(BLACK))
+    assert b.find_king(WHITE) == "e1"
+
+    assert b.move_piece("e1", "d2", WHITE) is True
+    assert b.find_king(WHITE) == "d2"
+
+    b.set_piece("d2", Rook(BLACK))
+    assert b.find_king(WHITE) is None
+    assert b.find_king(BLACK) == "e8"
+
+# Test that a blocker on the line stops a rook from giving check
+def test_blocked_rook_does_not_give_check():
+    b = Board()
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("e3", Rook(WHITE))
+    b.set_piece("e8", Rook(BLACK))
+
+    assert b.is_in_check(WHITE) is False
+    assert b.is_square_under_attack("e4", BLACK) is True
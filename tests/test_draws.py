@@ -0,0 +1,120 @@
+from chessgame.board import Board, WHITE_WINS, BLACK_WINS, DRAW
+from chessgame.pieces import Pawn, WHITE, BLACK
+from chessgame.move import Move
+from chessgame.fen import board_from_fen
+from chessgame.engine import Searcher, SearchLimits
+
+KNIGHT_SHUFFLE = ["g1f3", "g8f6", "f3g1", "f6g8"]
+
+def play(board, moves, turn = WHITE):
+    """Play coordinate moves through play_move and return the side to move."""
+    for text in moves:
+        assert board.play_move(Move.from_uci(text), turn)
+        turn = BLACK if turn == WHITE else WHITE
+    return turn
+
+# Test threefold and fivefold repetition
+def test_repetition():
+    b = Board()
+    b.setup_starting_position()
+
+    turn = play(b, KNIGHT_SHUFFLE)
+    assert b.repetition_count() == 2
+    assert b.game_result(turn, claim_draw = True) is None
+
+    turn = play(b, KNIGHT_SHUFFLE)
+    assert b.is_threefold_repetition()
+    assert b.game_result(turn) is None
+    assert b.game_result(turn, claim_draw = True) == (DRAW, "threefold repetition")
+
+    turn = play(b, KNIGHT_SHUFFLE * 2)
+    assert b.is_fivefold_repetition()
+    assert b.game_result(turn) == (DRAW, "fivefold repetition")
+
+# Test that castling rights are part of the repeated position
+def test_repetition_needs_same_rights():
+    board, turn = board_from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    turn = play(board, ["e1f1", "e8f8", "f1e1", "f8e8"] * 2, turn)
+    assert board.repetition_count() == 2 # The start position had the rights
+
+# Test that a promotion is recorded once, with the promoted piece on the board
+def test_promotion_recorded_once():
+    board, turn = board_from_fen("8/P6k/8/8/8/8/8/K7 w - - 0 1")
+    start_key = board.zobrist_key(turn)
+
+    turn = play(board, ["a7a8n"], turn)
+    assert board.position_history == [start_key, board.zobrist_key(turn)]
+    assert board.position_counts == {start_key: 1, board.zobrist_key(turn): 1}
+
+    # Promoting outside of a move does not rewrite the recorded positions
+    history = board.position_history[:]
+    board.set_piece("h1", Pawn(BLACK))
+    assert board.promote_pawn("h1", "Q") is True
+    assert board.position_history == history
+
+# Test the 50 and 75 move rules
+def test_move_rules():
+    board, turn = board_from_fen("4k3/8/8/8/8/8/8/R3K3 w - - 99 80")
+    assert not board.is_fifty_move_rule()
+
+    turn = play(board, ["a1a2"], turn)
+    assert board.is_fifty_move_rule()
+    assert board.game_result(turn, claim_draw = True) == (DRAW, "50-move rule")
+    assert board.game_result(turn) is None
+
+    board.halfmove_clock = 150
+    assert board.game_result(turn) == (DRAW, "75-move rule")
+
+# Test insufficient material from the piece counts
+def test_insufficient_material():
+    for fen, expected in [
+        ("4k3/8/8/8/8/8/8/4K3 w - - 0 1", True),         # King against king
+        ("4k3/8/8/8/8/8/8/4KN2 w - - 0 1", True),        # Lone knight
+        ("4k3/8/8/8/8/8/8/2B1K3 w - - 0 1", True),       # Lone bishop
+        ("2b1k3/8/8/8/8/8/8/2B1K3 w - - 0 1", False),    # Bishops on opposite shades
+        ("3bk3/8/8/8/8/8/8/2B1K3 w - - 0 1", True),      # Bishops on the same shade
+        ("4k3/8/8/8/8/8/8/3NKN2 w - - 0 1", False),      # Two knights
+        ("4k3/8/8/8/8/8/8/4K2R w - - 0 1", False),
+        ("4k3/7p/8/8/8/8/8/4K3 w - - 0 1", False),
+    ]:
+        board, turn = board_from_fen(fen)
+        assert board.is_insufficient_material() is expected, fen
+
+    board, turn = board_from_fen("4k3/8/8/8/8/8/5r2/4K3 w - - 0 1")
+    assert not board.is_insufficient_material()
+    turn = play(board, ["e1f2"], turn) # Takes the last rook
+    assert board.game_result(turn) == (DRAW, "insufficient material")
+
+# Test that checkmate and stalemate come through game_result
+def test_mate_results():
+    board, turn = board_from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    play(board, ["a1a8"], turn)
+    assert board.game_result(BLACK) == (WHITE_WINS, "checkmate")
+
+    board, turn = board_from_fen("7k/5Q2/6K1/8/8/8/8/8 b - - 0 1")
+    assert board.game_result(turn) == (DRAW, "stalemate")
+
+    board, turn = board_from_fen("7k/8/8/8/8/8/5PPP/3r2K1 w - - 0 1")
+    assert board.game_result(turn) == (BLACK_WINS, "checkmate")
+
+# Test that the piece counts follow make/unmake and copies
+def test_counts_follow_moves():
+    board, turn = board_from_fen("4k3/8/8/8/8/8/5b2/4KR2 w - - 0 1")
+    undo = board.make_move(Move.from_uci("f1f2"))
+    assert board.piece_counts[8] == 0 and board.bishop_shades == [0, 0]
+
+    board.unmake_move(undo)
+    assert board.piece_counts[8] == 1 and board.bishop_shades == [0, 1]
+
+    copy = board.copy()
+    copy.set_piece_at(53, None)
+    assert board.piece_counts[8] == 1
+
+# Test that the engine steers into a repetition when it is losing
+def test_engine_takes_repetition():
+    board, turn = board_from_fen("7k/8/8/7q/8/8/8/K7 w - - 0 1")
+    turn = play(board, ["a1b1", "h5h6", "b1a1", "h6h5"], turn)
+
+    result = Searcher(board).search(turn, SearchLimits(depth = 2))
+    assert result.move == Move.from_uci("a1b1") # Back to a position of the game
+    assert result.score == 0
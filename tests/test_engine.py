@@ -0,0 +1,72 @@
+from chessgame.board import Board
+from chessgame.pieces import Pawn, Rook, Queen, King, WHITE, BLACK
+from chessgame.engine import Searcher, SearchLimits, best_move, search, MATE_SCORE
+from chessgame.fen import board_from_fen
+
+# Test that the engine finds a back-rank mate in one
+def test_finds_mate_in_one():
+    board, turn = board_from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    result = search(board, turn, SearchLimits(depth = 3))
+
+    assert result.move.uci() == "a1a8"
+    assert result.score == MATE_SCORE - 1
+
+# Test that the engine takes a hanging queen
+def test_captures_hanging_queen():
+    b = Board()
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("e8", King(BLACK))
+    b.set_piece("d1", Rook(WHITE))
+    b.set_piece("d5", Queen(BLACK))
+
+    assert best_move(b, WHITE, SearchLimits(depth = 2)).uci() == "d1d5"
+
+# Test that the engine promotes when it can, choosing a queen
+def test_promotes_pawn():
+    b = Board()
+    b.set_piece("a1", King(WHITE))
+    b.set_piece("h1", King(BLACK))
+    b.set_piece("b7", Pawn(WHITE))
+    b.set_piece("a8", Rook(BLACK))
+
+    move = best_move(b, WHITE, SearchLimits(depth = 2))
+    assert move.uci() == "b7a8q"
+
+# Test that the search leaves the board exactly as it was
+def test_search_leaves_board_unchanged():
+    board, turn = board_from_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+    key = board.zobrist_key(turn)
+    squares = list(board.squares)
+
+    search(board, turn, SearchLimits(depth = 2))
+
+    assert board.zobrist_key(turn) == key
+    assert board.squares == squares
+
+# Test that the node budget stops the search and still gives a legal move
+def test_node_limit_is_respected():
+    b = Board()
+    b.setup_starting_position()
+    result = search(b, WHITE, SearchLimits(nodes = 500))
+
+    assert result.nodes <= 500
+    assert result.move in b.generate_legal_moves(WHITE)
+
+# Test that a search with no legal moves returns no move
+def test_no_move_when_mated():
+    board, turn = board_from_fen("R5k1/5ppp/8/8/8/8/8/6K1 b - - 0 1")
+    result = search(board, turn, SearchLimits(depth = 2))
+
+    assert result.move is None
+    assert result.score == -MATE_SCORE
+
+# Test that every finished depth is reported
+def test_iteration_callback():
+    b = Board()
+    b.setup_starting_position()
+    searcher = Searcher(b)
+    depths = []
+    searcher.on_iteration = lambda result: depths.append(result.depth)
+
+    searcher.search(WHITE, SearchLimits(depth = 3))
+    assert depths == [1, 2, 3]
@@ -0,0 +1,106 @@
+import random
+
+import pytest
+
+from chessgame.board import Board
+from chessgame.pieces import Pawn, Rook, Queen, King, WHITE, BLACK
+from chessgame.evaluation import evaluate, evaluate_many, compute_piece_scores, pawn_structure, MAX_PHASE
+from chessgame.perft import PERFT_SUITE
+from chessgame.fen import board_from_fen
+
+def start_board():
+    b = Board()
+    b.setup_starting_position()
+    return b
+
+# Test that the starting position is balanced and the phase is full
+def test_start_position_is_equal():
+    b = start_board()
+    assert evaluate(b, WHITE) == 0
+    assert evaluate(b, BLACK) == 0
+    assert b.phase == MAX_PHASE
+
+# Test that the score is from the point of view of the given side
+def test_score_is_side_relative():
+    b = start_board()
+    b.set_piece("d8", None) # Black loses the queen
+
+    assert evaluate(b, WHITE) > 800
+    assert evaluate(b, BLACK) == -evaluate(b, WHITE)
+
+# Test that the incremental sums match a full recount through moves, captures,
+# castling, en passant, promotions and their undo
+def test_incremental_scores_match_recount():
+    rng = random.Random(7)
+
+    for _, fen, _ in PERFT_SUITE:
+        board, turn = board_from_fen(fen)
+        undos = []
+        for _ in range(40):
+            moves = board.generate_legal_moves(turn)
+            if not moves:
+                break
+            undos.append(board.make_move(rng.choice(moves)))
+            turn = BLACK if turn == WHITE else WHITE
+            assert (board.eval_mg, board.eval_eg, board.phase) == compute_piece_scores(board)
+
+        for undo in reversed(undos):
+            board.unmake_move(undo)
+        assert (board.eval_mg, board.eval_eg, board.phase) == compute_piece_scores(board)
+
+# Test that promote_pawn updates the sums
+def test_promotion_updates_scores():
+    b = Board()
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("e8", King(BLACK))
+    b.set_piece("a7", Pawn(WHITE))
+    before = evaluate(b, WHITE)
+
+    assert b.move_piece("a7", "a8", WHITE) is True
+    assert b.promote_pawn("a8", "Q") is True
+    assert evaluate(b, WHITE) > before + 600
+    assert (b.eval_mg, b.eval_eg, b.phase) == compute_piece_scores(b)
+
+# Test doubled, isolated and passed pawns
+def test_pawn_structure():
+    b = Board()
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("e8", King(BLACK))
+    b.set_piece("a2", Pawn(WHITE))
+    b.set_piece("a3", Pawn(WHITE)) # Doubled and isolated
+    b.set_piece("h7", Pawn(BLACK))
+    b.set_piece("g7", Pawn(BLACK))
+    _, eg = pawn_structure(b)
+
+    b.set_piece("d6", Pawn(WHITE)) # Passed (but isolated) pawn far up the board
+    _, passed_eg = pawn_structure(b)
+
+    assert eg < 0
+    assert passed_eg > eg
+
+# Test that a pawn shield in front of a castled king counts
+def test_king_shield():
+    b = Board()
+    b.set_piece("g1", King(WHITE))
+    b.set_piece("g8", King(BLACK))
+    b.set_piece("d1", Queen(WHITE))
+    b.set_piece("d8", Queen(BLACK))
+    b.set_piece("a1", Rook(WHITE))
+    b.set_piece("a8", Rook(BLACK))
+    for square in ("f7", "g7", "h7", "f2", "g2", "h2"):
+        b.set_piece(square, Pawn(WHITE if square[1] == "2" else BLACK))
+    assert evaluate(b, WHITE) == 0
+
+    b.set_piece("g2", None)
+    b.set_piece("g3", Pawn(WHITE)) # Weaker shield
+    assert evaluate(b, WHITE) < 0
+
+# Test the batch entry point, including the loop used without numpy
+@pytest.mark.parametrize("with_numpy", [True, False])
+def test_evaluate_many(monkeypatch, with_numpy):
+    if not with_numpy:
+        monkeypatch.setattr("chessgame.evaluation.numpy", None)
+
+    positions = [board_from_fen(fen) for _, fen, _ in PERFT_SUITE]
+    positions += [(board, BLACK if turn == WHITE else WHITE) for board, turn in positions]
+    assert evaluate_many(positions) == [evaluate(board, turn) for board, turn in positions]
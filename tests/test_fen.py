@@ -0,0 +1,85 @@
+import pytest
+
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.fen import START_FEN, board_from_fen, fen_to_packed, read_fen_file, split_fen
+from chessgame.packing import pack_board
+from chessgame.perft import PERFT_SUITE
+
+# Test that every suite position round-trips through Board.from_fen / to_fen
+@pytest.mark.parametrize("name, fen, expected", PERFT_SUITE, ids = [p[0] for p in PERFT_SUITE])
+def test_round_trip(name, fen, expected):
+    board, turn = Board.from_fen(fen)
+    assert board.to_fen(turn) == fen
+
+# Test that the start position matches setup_starting_position
+def test_start_position():
+    b = Board()
+    b.setup_starting_position()
+    board, turn = Board.from_fen(START_FEN)
+
+    assert turn == WHITE
+    assert board.zobrist_key(WHITE) == b.zobrist_key(WHITE)
+    assert b.to_fen(WHITE) == START_FEN
+
+# Test that castling rights become has_moved flags
+def test_castling_rights_map_to_has_moved():
+    board, _ = Board.from_fen("r3k2r/8/8/8/8/8/8/R3K2R w Kq - 0 1")
+
+    assert board.get_piece("e1").has_moved is False
+    assert board.get_piece("h1").has_moved is False
+    assert board.get_piece("a1").has_moved is True
+    assert board.get_piece("a8").has_moved is False
+    assert board.get_piece("h8").has_moved is True
+    assert board.try_move_no_turn_switch("e1", "c1", WHITE) is False
+    assert board.try_move_no_turn_switch("e1", "g1", WHITE) is True
+
+# Test that the move counters follow the moves and are undone
+def test_move_counters():
+    b, turn = Board.from_fen(START_FEN)
+    assert b.move_piece("g1", "f3", WHITE) is True
+    assert b.to_fen(BLACK) == "rnbqkbnr/pppppppp/8/8/8/5N2/PPPPPPPP/RNBQKB1R b KQkq - 1 1"
+
+    assert b.move_piece("e7", "e5", BLACK) is True
+    assert b.to_fen(WHITE) == "rnbqkbnr/pppp1ppp/8/4p3/8/5N2/PPPPPPPP/RNBQKB1R w KQkq e6 0 2"
+
+    moves = b.generate_legal_moves(WHITE)
+    undo = b.make_move(moves[0])
+    b.unmake_move(undo)
+    assert b.to_fen(WHITE).endswith(" 0 2")
+
+# Test that short FENs get default fields and bad ones are rejected
+def test_defaults_and_errors():
+    assert split_fen("8/8/8/8/8/8/8/8") == ("8/8/8/8/8/8/8/8", "w", "-", "-", 0, 1)
+
+    for bad in ["", "8/8/8/8/8/8/8 w - - 0 1", "9/8/8/8/8/8/8/8 w", "7x/8/8/8/8/8/8/8 w",
+                "8/8/8/8/8/8/8/8 x", "8/8/8/8/8/8/8/8 w KX", "8/8/8/8/8/8/8/8 w - z9"]:
+        with pytest.raises(ValueError):
+            Board.from_fen(bad)
+
+# Test that a FEN with a bad piece letter leaves the board unchanged
+def test_bad_fen_leaves_board_unchanged():
+    board, _ = Board.from_fen(START_FEN)
+
+    with pytest.raises(ValueError, match = "Invalid FEN piece 'x'"):
+        board.set_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNx w KQkq - 0 1")
+    assert board.to_fen(WHITE) == START_FEN
+
+# Test that the bitboard backend can be filled from a FEN
+def test_bitboard_backend():
+    board, turn = board_from_fen(PERFT_SUITE[1][1], "bitboard")
+    assert len(board.generate_legal_moves(turn)) == 48
+
+# Test that the direct packed path agrees with packing a Board
+@pytest.mark.parametrize("name, fen, expected", PERFT_SUITE, ids = [p[0] for p in PERFT_SUITE])
+def test_fen_to_packed(name, fen, expected):
+    assert fen_to_packed(fen) == pack_board(*Board.from_fen(fen))
+
+# Test reading a FEN file with comments and blank lines
+def test_read_fen_file(tmp_path):
+    path = tmp_path / "positions.fen"
+    path.write_text("# suite\n" + "\n".join(fen for _, fen, _ in PERFT_SUITE) + "\n\n", encoding = "utf-8")
+
+    boards = list(read_fen_file(path))
+    assert [board.to_fen(turn) for board, turn in boards] == [fen for _, fen, _ in PERFT_SUITE]
+    assert len(list(read_fen_file(path, packed = True))) == len(PERFT_SUITE)
@@ -0,0 +1,121 @@
+import copy
+import pickle
+
+import pytest
+
+from chessgame.board import Board
+from chessgame.pieces import Pawn, Rook, Queen, King, WHITE, BLACK, shared_piece
+from chessgame.move import Move
+from chessgame.types import SQUARE_INDEX
+from chessgame.perft import PERFT_SUITE, perft
+from chessgame.fen import START_FEN, board_from_fen
+
+def move(from_square, to_square, promotion = None):
+    return Move.from_squares(from_square, to_square, promotion)
+
+# Test that pieces use __slots__ instead of a per-instance __dict__
+def test_pieces_have_slots():
+    pawn = Pawn(WHITE)
+    assert not hasattr(pawn, "__dict__")
+
+    with pytest.raises(AttributeError):
+        pawn.value = 1
+
+# Test that shared pieces are single immutable instances that still look like normal pieces
+def test_shared_piece_is_immutable():
+    rook = shared_piece(Rook, WHITE)
+
+    assert shared_piece(Rook, WHITE) is rook
+    assert shared_piece(type(rook), WHITE) is rook
+    assert isinstance(rook, Rook) and rook.__class__.__name__ == "Rook"
+
+    with pytest.raises(AttributeError):
+        rook.has_moved = True
+
+# Test that a flyweight board keeps has_moved itself and shares the pieces
+def test_flyweight_board_tracks_has_moved():
+    b = Board(flyweight = True)
+    b.setup_starting_position()
+
+    assert b.get_piece("a2") is b.get_piece("h2")
+    assert b.castling_rights() == 15
+
+    assert b.move_piece("e2", "e4", WHITE) is True
+    assert b.has_moved_at(SQUARE_INDEX["e4"]) is True
+    assert b.get_piece("e4").has_moved is False # The shared piece itself never changes
+
+# Test that a moved piece placed on a flyweight board keeps its has_moved
+def test_flyweight_board_takes_has_moved_from_piece():
+    b = Board(flyweight = True)
+    king = King(WHITE)
+    king.has_moved = True
+    b.set_piece("e1", king)
+    b.set_piece("h1", Rook(WHITE))
+
+    assert b.get_piece("e1") is shared_piece(King, WHITE)
+    assert b.castling_rights() == 0
+    assert b.try_move_no_turn_switch("e1", "g1", WHITE) is False
+
+# Test that make/unmake restores the moved state of a captured rook
+def test_flyweight_unmake_restores_captured_has_moved():
+    b = Board(flyweight = True)
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("e8", King(BLACK))
+    b.set_piece("a8", Rook(BLACK))
+    b.set_piece("a1", Queen(WHITE))
+    rook = Rook(WHITE)
+    rook.has_moved = True
+    b.set_piece("h1", rook)
+
+    undo = b.make_move(move("a8", "a1"))
+    b.unmake_move(undo)
+    undo = b.make_move(move("a1", "a8"))
+    b.unmake_move(undo)
+
+    assert b.has_moved_at(63) is True
+    assert b.has_moved_at(56) is False
+    assert b.has_moved_at(0) is False
+
+# Test that promotion on a flyweight board places a shared piece
+def test_flyweight_promotion():
+    b = Board(flyweight = True)
+    b.set_piece("a7", Pawn(WHITE))
+
+    assert b.play_move(move("a7", "a8", "N"), WHITE) is True
+    assert b.get_piece("a8").is_shared
+
+# Test that copies are independent of the original board
+@pytest.mark.parametrize("flyweight", [False, True])
+def test_copy_is_independent(flyweight):
+    b = Board(flyweight = flyweight)
+    b.setup_starting_position()
+    c = b.copy()
+
+    assert c.move_piece("e2", "e4", WHITE) is True
+    assert b.get_piece("e2") is not None and b.get_piece("e4") is None
+    assert b.has_moved_at(52) is False
+    assert c.zobrist_key(BLACK) != b.zobrist_key(BLACK)
+
+# Test that a flyweight board can be deep-copied and pickled and keeps its shared pieces
+@pytest.mark.parametrize("backend", ["list", "bitboard"])
+def test_flyweight_board_deepcopy_and_pickle(backend):
+    b, turn = board_from_fen(START_FEN, backend, flyweight = True)
+    assert b.move_piece("e2", "e4", WHITE) is True
+
+    assert copy.copy(shared_piece(Pawn, WHITE)) is shared_piece(Pawn, WHITE)
+    assert copy.deepcopy(shared_piece(Pawn, WHITE)) is shared_piece(Pawn, WHITE)
+
+    for c in (copy.deepcopy(b), pickle.loads(pickle.dumps(b))):
+        assert c.to_fen(BLACK) == b.to_fen(BLACK)
+        assert c.get_piece("a2") is shared_piece(Pawn, WHITE)
+        assert c.has_moved_at(SQUARE_INDEX["e4"]) is True
+        assert c.move_piece("e7", "e5", BLACK) is True
+        assert b.get_piece("e5") is None
+
+# Test that the flyweight mode gives the same perft counts
+@pytest.mark.parametrize("backend", ["list", "bitboard"])
+def test_flyweight_perft(backend):
+    for name, fen, expected in PERFT_SUITE:
+        board, turn = board_from_fen(fen, backend, flyweight = True)
+        assert perft(board, turn, 2) == expected[2], name
+        assert perft(board.copy(), turn, 2) == expected[2], name
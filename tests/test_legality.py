@@ -0,0 +1,131 @@
+from chessgame.board import Board, ALL_SQUARES
+from chessgame.pieces import King, Rook, Bishop, Knight, Pawn, WHITE, BLACK
+from chessgame.types import SQUARE_INDEX
+from chessgame.save_load import save_game, load_game
+
+def destinations(b, square, color):
+    """Return the destinations of the legal moves from one square.
+    """
+    index = SQUARE_INDEX[square]
+    return sorted(move.uci()[2:4] for move in b.generate_legal_moves(color) if move.from_index == index)
+
+# Test that a pinned piece is found with the squares it may still move to
+def test_pinned_piece_and_its_ray():
+    b, _ = Board.from_fen("4k3/4r3/8/8/8/8/4R3/4K3 w - - 0 1")
+    info = b.legality(WHITE)
+
+    assert info.checkers == []
+    assert info.check_mask == ALL_SQUARES
+    assert list(info.pins) == [SQUARE_INDEX["e2"]]
+    assert destinations(b, "e2", WHITE) == ["e3", "e4", "e5", "e6", "e7"]
+
+# Test that a pinned knight cannot move at all and a bishop pin allows the diagonal only
+def test_pinned_pieces_cannot_leave_the_line():
+    b, _ = Board.from_fen("4k3/8/8/b7/8/8/3B4/4K1Nr w - - 0 1")
+
+    assert destinations(b, "g1", WHITE) == [] # Pinned by the rook on h1
+    assert destinations(b, "d2", WHITE) == ["a5", "b4", "c3"]
+
+# Test that out of a single check only captures, blocks and king moves are legal
+def test_single_check_mask():
+    b, _ = Board.from_fen("4k3/8/8/8/8/8/3N1PPP/r3K3 w - - 0 1")
+    info = b.legality(WHITE)
+
+    assert info.checkers == [SQUARE_INDEX["a1"]]
+    # d1 and f1 are on the rook's rank
+    assert sorted(move.uci() for move in b.generate_legal_moves(WHITE)) == ["d2b1", "e1e2"]
+
+# Test that in double check only the king moves, and not further along the checking line
+def test_double_check():
+    b = Board()
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("e8", King(BLACK))
+    b.set_piece("e5", Rook(BLACK))
+    b.set_piece("f3", Knight(BLACK))
+    b.set_piece("a2", Rook(WHITE))
+    info = b.legality(WHITE)
+
+    assert len(info.checkers) == 2 and info.check_mask == 0
+    assert b.move_piece("a2", "e2", WHITE) is False # Blocking one checker is not enough
+    assert b.is_legal_move(SQUARE_INDEX["e1"], SQUARE_INDEX["e2"], WHITE) is False
+    # d2 is covered by the knight
+    assert sorted(move.uci() for move in b.generate_legal_moves(WHITE)) == ["e1d1", "e1f1", "e1f2"]
+
+# Test that the king cannot step away from a slider along the line it is checked on
+def test_king_cannot_retreat_along_check_ray():
+    b = Board()
+    b.set_piece("d4", King(WHITE))
+    b.set_piece("a7", Bishop(BLACK))
+    b.set_piece("h8", King(BLACK))
+
+    assert b.is_legal_move(SQUARE_INDEX["d4"], SQUARE_INDEX["e3"], WHITE) is False
+    assert b.is_legal_move(SQUARE_INDEX["d4"], SQUARE_INDEX["d5"], WHITE) is True # Leaves the line
+
+# Test the en passant capture that would uncover a check along the rank
+def test_en_passant_along_pinned_rank():
+    b, turn = Board.from_fen("8/8/8/K2pP2r/8/8/8/7k w - d6 0 1")
+
+    assert "e5d6" not in [move.uci() for move in b.generate_legal_moves(turn)]
+    assert b.legality_cache is not None # Still cached after trying the capture
+
+# Test that every change to the board drops the cache
+def test_cache_is_dropped_on_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    b, _ = Board.from_fen("4k3/4r3/8/8/8/8/4R3/4K3 w - - 0 1")
+    pinned = b.legality(WHITE)
+    assert b.legality(WHITE) is pinned # Cached
+
+    assert b.move_piece("e2", "e7", WHITE) is True
+    assert b.legality_cache is None
+    assert b.legality(WHITE).pins == {}
+
+    b.set_piece("a7", Pawn(WHITE))
+    b.legality(BLACK)
+    assert b.move_piece("a7", "a8", WHITE) is True
+    b.legality(BLACK)
+    assert b.promote_pawn("a8", "R") is True
+    assert b.legality_cache is None
+    assert b.legality(BLACK).checkers == [SQUARE_INDEX["e7"], SQUARE_INDEX["a8"]]
+
+    save_game(b, BLACK, "pinned")
+    b.set_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    b.legality(BLACK)
+    assert load_game(b, "pinned") == BLACK
+    assert len(b.legality(BLACK).checkers) == 2
+
+# Test that the checkmate, stalemate and result checks of one position share one move generation
+def test_status_checks_share_the_cached_moves():
+    b, turn = Board.from_fen("rnb1kbnr/pppp1ppp/8/4p3/6Pq/5P2/PPPPP2P/RNBQKBNR w KQkq - 1 3")
+
+    assert b.is_in_check(turn) is True
+    assert b.is_checkmate(turn) is True
+    assert b.is_stalemate(turn) is False
+    assert b.game_result(turn) is not None
+    assert b.cache_stats() == {"hits": 4, "misses": 2} # One check test, one move generation
+
+# Test that callers get their own copy of the cached list
+def test_cached_moves_are_copied():
+    b, turn = Board.from_fen("4k3/8/8/8/8/8/8/4K2R w K - 0 1")
+    moves = b.generate_legal_moves(turn)
+    moves.clear()
+
+    assert len(b.generate_legal_moves(turn)) == 15
+    assert b.cache_hits == 1
+
+# Test that moves, castling and en passant changes give a fresh move list
+def test_move_cache_follows_the_position():
+    b, turn = Board.from_fen("4k3/8/8/3pP3/8/8/8/4K2R w K - 0 1")
+    count = len(b.generate_legal_moves(turn))
+
+    b.en_passant_target = "d6" # Set directly, without set_piece_at
+    assert len(b.generate_legal_moves(turn)) == count + 1
+    b.get_piece("h1").has_moved = True # The same
+    assert len(b.generate_legal_moves(turn)) == count # Castling is gone, en passant added
+    assert b.cache_hits == 0
+
+    assert b.try_castle("e1", "g1", WHITE) is False
+    assert b.move_piece("h1", "h8", WHITE) is True
+    assert b.is_in_check(BLACK) is True
+    b.set_piece("g8", Rook(BLACK))
+    assert b.is_in_check(BLACK) is False
+    assert b.cache_hits == 0
@@ -0,0 +1,68 @@
+from chessgame.board import Board
+from chessgame.pieces import Pawn, Rook, Queen, King, WHITE, BLACK
+from chessgame.move import Move
+
+def snapshot(b):
+    return (list(b.squares), [p.has_moved for p in b.squares if p is not None], b.en_passant_target)
+
+def move(from_square, to_square, promotion = None):
+    return Move.from_squares(from_square, to_square, promotion)
+
+# Test that a normal capture is undone exactly
+def test_make_unmake_capture():
+    b = Board()
+    b.setup_starting_position()
+    b.set_piece("d5", Pawn(BLACK))
+    b.set_piece("e4", Pawn(WHITE))
+    before = snapshot(b)
+
+    undo = b.make_move(move("e4", "d5"))
+    assert b.get_piece("d5").color == WHITE
+    b.unmake_move(undo)
+
+    assert snapshot(b) == before
+
+# Test that castling moves and restores the rook and has_moved flags
+def test_make_unmake_castling():
+    b = Board()
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("h1", Rook(WHITE))
+    before = snapshot(b)
+
+    undo = b.make_move(move("e1", "g1"))
+    assert isinstance(b.get_piece("f1"), Rook)
+    assert b.get_piece("f1").has_moved is True
+    b.unmake_move(undo)
+
+    assert snapshot(b) == before
+    assert b.get_piece("h1").has_moved is False
+
+# Test that en passant restores the captured pawn behind the target square
+def test_make_unmake_en_passant():
+    b = Board()
+    b.set_piece("e5", Pawn(WHITE))
+    b.set_piece("d7", Pawn(BLACK))
+    assert b.move_piece("d7", "d5", BLACK) is True
+    before = snapshot(b)
+
+    undo = b.make_move(move("e5", "d6"))
+    assert b.get_piece("d5") is None
+    assert b.en_passant_target is None
+    b.unmake_move(undo)
+
+    assert snapshot(b) == before
+    assert b.en_passant_target == "d6"
+
+# Test that a promotion is taken back to the original pawn
+def test_make_unmake_promotion():
+    b = Board()
+    pawn = Pawn(WHITE)
+    b.set_piece("a7", pawn)
+
+    undo = b.make_move(move("a7", "a8", "Q"))
+    assert isinstance(b.get_piece("a8"), Queen)
+    b.unmake_move(undo)
+
+    assert b.get_piece("a7") is pawn
+    assert b.get_piece("a8") is None
+    assert pawn.has_moved is False
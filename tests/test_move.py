@@ -0,0 +1,65 @@
+import pytest
+
+from chessgame.board import Board
+from chessgame.move import Move, encode_move, decode_move, CAPTURE, EN_PASSANT
+from chessgame.pieces import Pawn, Queen, Knight, King, WHITE, BLACK
+
+# Test building moves from squares and coordinate notation
+def test_move_from_squares_and_uci():
+    m = Move.from_squares("e7", "e8", "q")
+    assert m.from_square == "e7"
+    assert m.to_square == "e8"
+    assert m.promotion == "Q"
+    assert m.uci() == "e7e8q"
+    assert Move.from_uci("e7e8q") == m
+    assert Move.from_uci("e2e4") != m
+
+# Test that packing a move into an int keeps every field
+def test_encode_decode_round_trip():
+    m = Move.from_squares("d5", "e6", None)
+    m.flags = CAPTURE | EN_PASSANT
+
+    value = encode_move(m)
+    assert value < 1 << 32
+    assert encode_move(Move.from_squares("a7", "a8", "N")) < 1 << 16
+
+    back = decode_move(value)
+    assert back == m
+    assert back.flags == m.flags
+    assert back.is_capture() is True
+
+# Test that play_move performs a Move and promotes right away
+def test_play_move_with_promotion_move():
+    b = Board()
+    b.set_piece("a7", Pawn(WHITE))
+
+    assert b.play_move(Move.from_squares("a7", "a8", "N"), WHITE) is True
+    assert isinstance(b.get_piece("a8"), Knight)
+
+# Test that move_piece still takes squares and requires the player's color
+def test_move_piece_requires_color():
+    b = Board()
+    b.setup_starting_position()
+
+    with pytest.raises(TypeError):
+        b.move_piece("e2", "e4")
+    assert b.get_piece("e2") is not None
+
+# Test that only a pawn reaching the last rank can carry a promotion
+def test_promotion_move_must_reach_last_rank():
+    b = Board()
+    b.set_piece("e2", Pawn(WHITE))
+    b.set_piece("e1", King(WHITE))
+
+    assert b.play_move(Move.from_squares("e2", "e3", "Q"), WHITE) is False
+    assert b.play_move(Move.from_squares("e1", "d1", "Q"), WHITE) is False
+    assert isinstance(b.get_piece("e2"), Pawn)
+
+# Test that promote_pawn accepts a Move
+def test_promote_pawn_with_move():
+    b = Board()
+    b.set_piece("h2", Pawn(BLACK))
+
+    assert b.move_piece("h2", "h1", BLACK) is True
+    assert b.promote_pawn(Move.from_squares("h2", "h1", "Q")) is True
+    assert isinstance(b.get_piece("h1"), Queen)
@@ -0,0 +1,83 @@
+from chessgame.board import Board
+from chessgame.pieces import Pawn, Rook, Bishop, King, WHITE, BLACK
+from chessgame.types import position_to_square
+from chessgame.move import Move
+
+# Reference: the old approach that probes every destination square
+def brute_force_legal_moves(b, color):
+    moves = []
+    for from_row in range(8):
+        for from_col in range(8):
+            piece = b.grid[from_row][from_col]
+            if piece is None or piece.color != color:
+                continue
+            from_square = position_to_square((from_row, from_col))
+            for to_row in range(8):
+                for to_col in range(8):
+                    to_square = position_to_square((to_row, to_col))
+                    if b.try_move_no_turn_switch(from_square, to_square, color):
+                        moves.append((from_square, to_square))
+    return sorted(moves)
+
+# Compare generated moves by their squares, like the brute-force scan does
+def square_pairs(moves):
+    return sorted(set((m.from_square, m.to_square) for m in moves))
+
+# Test that the starting position has exactly 20 legal moves for each side
+def test_starting_position_has_twenty_moves():
+    b = Board()
+    b.setup_starting_position()
+
+    assert len(b.generate_legal_moves(WHITE)) == 20
+    assert len(b.generate_legal_moves(BLACK)) == 20
+
+# Test that the generator agrees with the brute-force scan in a busy position
+def test_generator_matches_brute_force():
+    b = Board()
+    b.setup_starting_position()
+
+    for from_square, to_square, color in [("e2", "e4", WHITE), ("d7", "d5", BLACK),
+                                          ("e4", "d5", WHITE), ("g8", "f6", BLACK),
+                                          ("f1", "b5", WHITE), ("c7", "c6", BLACK)]:
+        assert b.move_piece(from_square, to_square, color) is True
+
+    assert square_pairs(b.generate_legal_moves(WHITE)) == brute_force_legal_moves(b, WHITE)
+    assert square_pairs(b.generate_legal_moves(BLACK)) == brute_force_legal_moves(b, BLACK)
+
+# Test that castling and en passant show up as legal moves
+def test_generator_includes_castling_and_en_passant():
+    b = Board()
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("h1", Rook(WHITE))
+    b.set_piece("e5", Pawn(WHITE))
+    b.set_piece("e8", King(BLACK))
+    b.set_piece("d7", Pawn(BLACK))
+
+    assert b.move_piece("d7", "d5", BLACK) is True
+
+    moves = b.generate_legal_moves(WHITE)
+    assert Move.from_squares("e1", "g1") in moves
+    assert Move.from_squares("e5", "d6") in moves
+    assert square_pairs(moves) == brute_force_legal_moves(b, WHITE)
+
+# Test that pinned pieces only get moves along the pin
+def test_generator_respects_pins():
+    b = Board()
+    b.set_piece("e1", King(WHITE))
+    b.set_piece("e2", Bishop(WHITE))
+    b.set_piece("e8", Rook(BLACK))
+    b.set_piece("a8", King(BLACK))
+
+    moves = b.generate_legal_moves(WHITE)
+    assert all(m.from_square != "e2" for m in moves)
+    assert square_pairs(moves) == brute_force_legal_moves(b, WHITE)
+
+# Test that a pawn reaching the last rank gives one move per promotion choice
+def test_generator_lists_promotions():
+    b = Board()
+    b.set_piece("a1", King(WHITE))
+    b.set_piece("h8", King(BLACK))
+    b.set_piece("c7", Pawn(WHITE))
+
+    promotions = [m.promotion for m in b.generate_legal_moves(WHITE) if m.from_square == "c7"]
+    assert sorted(promotions) == ["B", "N", "Q", "R"]
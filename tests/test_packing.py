@@ -0,0 +1,36 @@
+import pytest
+
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.packing import pack_board, unpack_board, PACKED_SIZE
+from chessgame.perft import PERFT_SUITE
+from chessgame.fen import board_from_fen
+
+# Test that every suite position survives packing, with castling and en passant state
+@pytest.mark.parametrize("name, fen, expected", PERFT_SUITE, ids = [p[0] for p in PERFT_SUITE])
+def test_pack_round_trip(name, fen, expected):
+    board, turn = board_from_fen(fen)
+    data = pack_board(board, turn)
+    assert len(data) == PACKED_SIZE
+
+    copy, copy_turn = unpack_board(data)
+    assert copy_turn == turn
+    assert copy.zobrist_key(copy_turn) == board.zobrist_key(turn)
+    assert [type(p) for p in copy.squares] == [type(p) for p in board.squares]
+
+# Test that the en passant target and has_moved flags are kept
+def test_pack_keeps_move_state():
+    b = Board()
+    b.setup_starting_position()
+    assert b.move_piece("e2", "e4", WHITE) is True
+
+    copy, turn = unpack_board(pack_board(b, BLACK), "bitboard", flyweight = True)
+    assert turn == BLACK
+    assert copy.en_passant_target == "e3"
+    assert copy.has_moved_at(36) is True
+    assert copy.has_moved_at(51) is False # d2 pawn
+
+# Test that malformed data is rejected
+def test_unpack_rejects_wrong_size():
+    with pytest.raises(ValueError):
+        unpack_board(b"\x00" * 10)
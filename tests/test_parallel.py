@@ -0,0 +1,56 @@
+import pytest
+
+from chessgame.engine import search, SearchLimits, MATE_SCORE
+from chessgame.move import Move, encode_move
+from chessgame.parallel import ParallelSearcher, merge_results
+from chessgame.perft import PERFT_SUITE
+from chessgame.fen import board_from_fen
+
+@pytest.fixture(scope = "module")
+def searcher():
+    with ParallelSearcher(2) as parallel:
+        yield parallel
+
+# Test that the parallel search finds the same score as the serial search
+@pytest.mark.parametrize("index", [0, 2, 4])
+def test_parallel_matches_serial_score(searcher, index):
+    board, turn = board_from_fen(PERFT_SUITE[index][1])
+    serial = search(board, turn, SearchLimits(depth = 2))
+    parallel = searcher.search(board, turn, SearchLimits(depth = 2))
+
+    assert parallel.score == serial.score
+    assert parallel.depth == 2
+    assert parallel.move in board.generate_legal_moves(turn)
+
+# Test that workers see the game's repetitions and the 50-move rule like the serial search
+def test_parallel_sees_draw_rules(searcher):
+    board, turn = board_from_fen("7k/8/8/7q/8/8/8/K7 w - - 0 1")
+    for text in ["a1b1", "h5h6", "b1a1", "h6h5"]:
+        board.play_move(Move.from_uci(text), turn)
+        turn = "black" if turn == "white" else "white"
+
+    result = searcher.search(board, turn, SearchLimits(depth = 2))
+    assert result.move == Move.from_uci("a1b1") # Back to a position of the game
+    assert result.score == 0
+
+    board, turn = board_from_fen("7k/8/8/7q/8/8/8/K7 b - - 99 80")
+    assert searcher.search(board, turn, SearchLimits(depth = 2)).score == 0 # Any quiet move ends the game
+
+# Test that repeated searches give the same move
+def test_parallel_is_deterministic(searcher):
+    board, turn = board_from_fen(PERFT_SUITE[5][1])
+    moves = {searcher.search(board, turn, SearchLimits(depth = 2)).move for _ in range(3)}
+    assert len(moves) == 1
+
+# Test the merge: shallowest common depth, best score, ties by root order
+def test_merge_results():
+    a, b, c = Move(52, 36), Move(51, 35), Move(62, 45)
+    root = [a, b, c]
+    parts = [
+        [(1, encode_move(a), 10), (2, encode_move(a), 5), (3, encode_move(a), 50)],
+        [(1, encode_move(b), 20), (2, encode_move(b), 5)],
+    ]
+    assert merge_results(root, parts) == (a, 5, 2)
+
+    parts.append([(1, encode_move(c), MATE_SCORE - 1)]) # Mate ends that worker early
+    assert merge_results(root, parts) == (c, MATE_SCORE - 1, 2)
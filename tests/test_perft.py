@@ -0,0 +1,27 @@
+import pytest
+
+from chessgame.perft import PERFT_SUITE, perft, divide
+from chessgame.fen import board_from_fen
+
+# Test every suite position at a depth that runs quickly
+@pytest.mark.parametrize("name, fen, expected", PERFT_SUITE, ids = [p[0] for p in PERFT_SUITE])
+@pytest.mark.parametrize("backend", ["list", "bitboard"])
+def test_perft_suite_shallow(name, fen, expected, backend):
+    board, turn = board_from_fen(fen, backend)
+    assert perft(board, turn, 2) == expected[2]
+
+# Test the starting position one level deeper
+def test_perft_start_depth_three():
+    board, turn = board_from_fen(PERFT_SUITE[0][1])
+    assert perft(board, turn, 3) == 8902
+
+# Test that divide splits the count over the root moves and leaves the board unchanged
+def test_divide_sums_to_perft():
+    board, turn = board_from_fen(PERFT_SUITE[1][1])
+    key = board.zobrist_key(turn)
+
+    counts = divide(board, turn, 2)
+    assert len(counts) == 48
+    assert sum(counts.values()) == 2039
+    assert counts["e1g1"] == 43 # Castling kingside
+    assert board.zobrist_key(turn) == key
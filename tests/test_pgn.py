@@ -0,0 +1,94 @@
+import io
+
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.move import Move
+from chessgame.pgn import Game, read_games, write_games, format_game
+
+ARCHIVE = """[Event "Casual"]
+[Site "?"]
+[White "A \\"Ace\\" Player"]
+[Black "B"]
+[Result "1-0"]
+
+1. e4 e5 2. Nf3 {a comment
+that spans lines} Nc6 (2... d6 3. d4 (3. Bc4)) 3. Bc4 $1 Nd4?! ; to the end
+4. Nxe5 Qg5 5. Nxf7 Qxg2 6. Rf1 Qxe4+ 7. Be2 Nf3# 0-1
+
+[Event "Second"]
+[Result "*"]
+
+1.d4 d5 2.c4 *
+
+[Event "No result token"]
+
+1. e4 c5
+"""
+
+# Test that games come out one by one with headers, moves and results
+def test_read_games():
+    games = list(read_games(io.StringIO(ARCHIVE)))
+    assert len(games) == 3
+
+    first = games[0]
+    assert first.headers["White"] == 'A "Ace" Player'
+    assert first.moves[:6] == ["e4", "e5", "Nf3", "Nc6", "Bc4", "Nd4?!"]
+    assert len(first.moves) == 14
+    assert first.result == "0-1"
+
+    assert games[1].moves == ["d4", "d5", "c4"] and games[1].result == "*"
+    assert games[2].moves == ["e4", "c5"]
+
+# Test that reading is lazy: the first game comes before the rest is read
+def test_read_games_is_lazy():
+    consumed = []
+
+    def lines():
+        for line in io.StringIO(ARCHIVE):
+            consumed.append(line)
+            yield line
+
+    games = read_games(lines())
+    next(games)
+    assert len(consumed) < len(ARCHIVE.splitlines())
+
+# Test that replaying a game ends in the right position
+def test_replay():
+    game = next(read_games(io.StringIO(ARCHIVE)))
+    board, turn = game.final_position()
+
+    assert turn == WHITE
+    assert board.is_checkmate(WHITE)
+    assert len(list(game.replay())) == 14
+
+# Test a round trip through the writer and reader, with promotion and castling
+def test_write_and_read_back(tmp_path):
+    moves = [Move.from_uci(text) for text in
+             ("e2e4", "d7d5", "e4d5", "g8f6", "g1f3", "f6d5", "f1c4", "c8g4", "e1g1", "g4f3", "d1f3")]
+    game = Game.from_moves(moves, {"White": "W", "Black": "B"}, "1/2-1/2")
+    assert game.moves[-3:] == ["O-O", "Bxf3", "Qxf3"]
+
+    start = "4k3/1P6/8/8/8/8/8/4K3 b - - 0 40"
+    promotion = Game.from_moves([Move.from_uci("e8d7"), Move.from_uci("b7b8n")], fen = start)
+    assert promotion.moves == ["Kd7", "b8=N+"]
+    assert "40... Kd7 41. b8=N+" in format_game(promotion)
+
+    path = tmp_path / "games.pgn"
+    assert write_games([game, promotion], path) == 2
+
+    first, second = read_games(path)
+    assert first.moves == game.moves and first.result == "1/2-1/2"
+    assert first.headers["Event"] == "?"
+    board, turn = second.final_position()
+    assert turn == BLACK
+    assert board.get_piece("b8").__class__.__name__ == "Knight"
+
+# Test that long movetext is wrapped at 80 columns
+def test_line_width():
+    b = Board()
+    b.setup_starting_position()
+    moves = [Move.from_uci(text) for text in ("g1f3", "g8f6", "f3g1", "f6g8") * 10]
+    text = format_game(Game.from_moves(moves))
+
+    assert max(len(line) for line in text.splitlines()) <= 80
+    assert len(next(read_games(io.StringIO(text))).moves) == 40
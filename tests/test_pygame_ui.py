@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy") # No window needed
+pygame = pytest.importorskip("pygame")
+
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.types import SQUARE_INDEX
+from chessgame.ui.pygame_ui import ChessUI, WINDOW_SIZE, STATUS_HEIGHT, SQUARE_SIZE
+
+@pytest.fixture
+def screen():
+    pygame.init()
+    yield pygame.display.set_mode((WINDOW_SIZE, WINDOW_SIZE + STATUS_HEIGHT))
+    pygame.quit()
+
+def new_ui(screen, fen, computer_color=None):
+    """Create a UI for a FEN with everything drawn once.
+    """
+    board, turn = Board.from_fen(fen)
+    ui = ChessUI(screen, board, turn, computer_color)
+    ui.draw()
+    return ui
+
+# Test that selecting a piece highlights exactly its legal destinations
+def test_select_highlights_legal_moves(screen):
+    ui = new_ui(screen, "4k3/8/8/8/8/8/4P3/4K2R w K - 0 1")
+    ui.click(SQUARE_INDEX["e1"])
+
+    targets = sorted(ui.targets)
+    assert targets == sorted(SQUARE_INDEX[s] for s in ("d1", "d2", "f1", "f2", "g1"))
+    assert set(ui.dirty) == set(targets) | {SQUARE_INDEX["e1"]}
+
+# Test that only the changed squares are redrawn after castling
+def test_move_redraws_only_changed_squares(screen):
+    ui = new_ui(screen, "4k3/8/8/8/8/8/8/4K2R w K - 0 1")
+    ui.click(SQUARE_INDEX["e1"])
+    ui.draw()
+    ui.click(SQUARE_INDEX["g1"])
+
+    assert ui.board.get_piece("f1").symbol() == "R"
+    assert ui.status_text().startswith("Last move O-O - Black to move")
+    assert ui.turn == BLACK
+    dirty = set(ui.dirty)
+    assert {SQUARE_INDEX[s] for s in ("e1", "f1", "g1", "h1")} <= dirty
+    assert len(dirty) < 64
+    assert len(ui.draw()) == len(dirty) + 1 # Those squares and the status bar
+    assert ui.draw() == []
+
+# Test that the board is drawn from the human's side when the computer plays white
+def test_flipped_board_mouse_mapping(screen):
+    ui = new_ui(screen, "4k3/8/8/8/8/8/8/4K3 b - - 0 1", computer_color = WHITE)
+
+    assert ui.square_at((0, 0)) == SQUARE_INDEX["h1"]
+    assert ui.square_at((WINDOW_SIZE - 1, WINDOW_SIZE - 1)) == SQUARE_INDEX["a8"]
+    assert ui.square_at((10, WINDOW_SIZE + 5)) is None
+    assert ui.square_rect(SQUARE_INDEX["a8"]).topleft == (7 * SQUARE_SIZE, 7 * SQUARE_SIZE)
+
+# Test that the engine thinks on another thread and its move arrives as an event
+def test_engine_move_arrives_as_event(screen):
+    ui = new_ui(screen, "6k1/5ppp/8/8/8/8/8/R5K1 b - - 0 1", computer_color = WHITE)
+    ui.click(SQUARE_INDEX["g8"])
+    ui.click(SQUARE_INDEX["h8"])
+    assert ui.thinking is True
+
+    event = pygame.event.wait(20000)
+    while event.type != pygame.USEREVENT + 1:
+        event = pygame.event.wait(20000)
+    ui.engine_moved(event.move)
+
+    assert ui.board.get_piece("a8").symbol() == "R"
+    assert ui.result == ("1-0", "checkmate")
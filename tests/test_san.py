@@ -0,0 +1,71 @@
+import pytest
+
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.move import Move
+from chessgame.fen import board_from_fen
+from chessgame.san import move_to_san, parse_san
+from chessgame.perft import PERFT_SUITE
+
+# Test plain pawn and piece moves from the start position
+def test_start_position_moves():
+    b = Board()
+    b.setup_starting_position()
+
+    assert move_to_san(b, Move.from_squares("e2", "e4"), WHITE) == "e4"
+    assert move_to_san(b, Move.from_squares("g1", "f3"), WHITE) == "Nf3"
+    assert parse_san(b, "Nc3", WHITE) == Move.from_squares("b1", "c3")
+    assert parse_san(b, "d4", WHITE) == Move.from_squares("d2", "d4")
+
+# Test file, rank and full-square disambiguation
+def test_disambiguation():
+    board, _ = board_from_fen("8/6k1/8/8/8/1N3N2/4K3/R6R w - - 0 1")
+
+    assert move_to_san(board, Move.from_squares("b3", "d4"), WHITE) == "Nbd4"
+    assert move_to_san(board, Move.from_squares("a1", "d1"), WHITE) == "Rad1"
+    assert parse_san(board, "Nfd4", WHITE) == Move.from_squares("f3", "d4")
+
+    with pytest.raises(ValueError):
+        parse_san(board, "Nd4", WHITE) # Ambiguous
+
+    board, _ = board_from_fen("8/6k1/8/8/R7/8/8/R3K3 w - - 0 1")
+    assert move_to_san(board, Move.from_squares("a4", "a2"), WHITE) == "R4a2"
+
+    board, _ = board_from_fen("8/6k1/8/8/Q1Q5/8/Q7/4K3 w - - 0 1")
+    assert move_to_san(board, Move.from_squares("a4", "b3"), WHITE) == "Qa4b3"
+
+# Test castling, promotion, en passant and the check and mate suffixes
+def test_special_moves():
+    board, _ = board_from_fen("r3k2r/8/8/8/8/8/8/R3K2R w KQkq - 0 1")
+    assert move_to_san(board, Move.from_squares("e1", "g1"), WHITE) == "O-O"
+    assert parse_san(board, "O-O-O", BLACK) == Move.from_squares("e8", "c8")
+    assert parse_san(board, "0-0", WHITE) == Move.from_squares("e1", "g1")
+
+    board, _ = board_from_fen("4k3/1P6/8/8/8/8/8/4K3 w - - 0 1")
+    assert move_to_san(board, Move.from_squares("b7", "b8", "Q"), WHITE) == "b8=Q+"
+    assert parse_san(board, "b8=N", WHITE) == Move.from_squares("b7", "b8", "N")
+
+    board, _ = board_from_fen("4k3/8/8/3pP3/8/8/8/4K3 w - d6 0 1")
+    assert move_to_san(board, Move.from_squares("e5", "d6"), WHITE) == "exd6"
+
+    board, _ = board_from_fen("6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    assert move_to_san(board, Move.from_squares("a1", "a8"), WHITE) == "Ra8#"
+    assert parse_san(board, "Ra8#", WHITE) == Move.from_squares("a1", "a8")
+
+# Test that bad input raises ValueError
+def test_invalid_san():
+    b = Board()
+    b.setup_starting_position()
+
+    for text in ("e5", "Ke2", "Zz9", "O-O"):
+        with pytest.raises(ValueError):
+            parse_san(b, text, WHITE)
+
+# Test that every legal move of the suite positions survives move_to_san and parse_san
+def test_round_trip_suite():
+    for _, fen, _ in PERFT_SUITE:
+        board, turn = board_from_fen(fen)
+        key = board.zobrist_key(turn)
+        for move in board.generate_legal_moves(turn):
+            assert parse_san(board, move_to_san(board, move, turn), turn) == move
+        assert board.zobrist_key(turn) == key
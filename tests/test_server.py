@@ -0,0 +1,83 @@
+import asyncio
+
+from chessgame.server import GameHost, start_server
+
+# Test creating a game and playing moves in both notations
+def test_new_game_and_moves():
+    host = GameHost()
+    assert host.handle("NEW") == "OK 1 white"
+    assert host.handle("MOVE 1 e2e4") == "OK e2e4 *"
+    assert host.handle("MOVE 1 e5") == "OK e7e5 *"
+    assert host.handle("MOVE 1 Nf3") == "OK g1f3 *"
+    assert host.handle("FEN 1") == "OK rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2"
+    assert host.handle("STATUS 1") == "OK black *"
+    assert len(host.handle("MOVES 1").split()) == 1 + 29
+
+# Test that bad requests get an error and change nothing
+def test_errors():
+    host = GameHost(max_games = 1)
+    host.handle("NEW")
+
+    assert host.handle("MOVE 1 e2e5") == "ERR Illegal move: e2e5"
+    assert host.handle("MOVE 1 Qh5") == "ERR Illegal move: Qh5"
+    assert host.handle("MOVE 2 e2e4").startswith("ERR No game")
+    assert host.handle("NEW").startswith("ERR Server is full")
+    assert host.handle("JUMP 1").startswith("ERR Unknown command")
+    assert host.handle("DRAW 1") == "ERR No draw can be claimed"
+    assert host.handle("MOVE 1 +") == "ERR Missing move"
+    assert host.handle("MOVE 1 !") == "ERR Missing move"
+    assert host.handle("STATUS 1") == "OK white *"
+
+# Test that an unexpected failure is answered instead of dropping the connection
+def test_unexpected_error_is_answered():
+    host = GameHost()
+    host.handle("NEW")
+    host.commands["MOVE"] = lambda argument: [][0]
+
+    assert host.handle("MOVE 1 e2e4") == "ERR IndexError: list index out of range"
+    assert host.handle("STATUS 1") == "OK white *"
+
+# Test promotion, checkmate and the moves after the end
+def test_promotion_and_game_end():
+    host = GameHost()
+    host.handle("NEW 7k/P7/6K1/8/8/8/8/8 w - - 0 1")
+    assert host.handle("MOVE 1 a8") == "OK a7a8q 1-0 checkmate"
+    assert host.handle("MOVE 1 Kg8").startswith("ERR Game is over")
+    assert host.handle("MOVES 1") == "OK"
+
+    host.handle("NEW 7k/P7/6K1/8/8/8/8/8 w - - 0 1")
+    assert host.handle("MOVE 2 a7a8r") == "OK a7a8r 1-0 checkmate"
+
+    host.handle("NEW 4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert host.handle("STATUS 3") == "OK white 1/2-1/2 insufficient material"
+
+# Test claiming a draw by repetition and closing games
+def test_draw_claim_and_close():
+    host = GameHost()
+    host.handle("NEW")
+    for _ in range(2):
+        for move in ("Nf3", "Nf6", "Ng1", "Ng8"):
+            host.handle(f"MOVE 1 {move}")
+
+    assert host.handle("DRAW 1") == "OK 1/2-1/2 threefold repetition"
+    assert host.handle("CLOSE 1") == "OK"
+    assert host.handle("STATS") == "OK games=0 moves=8"
+
+# Test the protocol over a real connection
+def test_tcp_round_trip():
+    async def session():
+        server = await start_server(GameHost(), port = 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            replies = []
+            for line in ("NEW", "MOVE 1 d4", "", "STATS"):
+                writer.write(line.encode() + b"\n")
+                if line:
+                    replies.append((await reader.readline()).decode().strip())
+            writer.write(b"QUIT\n")
+            assert await reader.readline() == b"" # Closed by the server
+            writer.close()
+            return replies
+
+    assert asyncio.run(session()) == ["OK 1 white", "OK d2d4 *", "OK games=1 moves=1"]
@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from chessgame.board import Board
+from chessgame.pieces import WHITE, BLACK
+from chessgame.move import Move
+from chessgame.fen import START_FEN, board_from_fen
+from chessgame.store import GameStore, pack_position, POSITION_SIZE
+from chessgame.save_load import save_game, load_game, list_saves, load_history
+
+# Test appending games and reading them back by id
+def test_append_and_read(tmp_path):
+    store = GameStore(tmp_path / "games.store")
+    assert len(store) == 0
+
+    b = Board()
+    b.setup_starting_position()
+    moves = [Move.from_uci(text) for text in ("e2e4", "e7e5", "g1f3")]
+    start = pack_position(b, WHITE)
+    for move in moves:
+        b.make_move(move)
+
+    first = store.append("opening", b, BLACK, moves, start)
+    second = store.append("empty", Board(), WHITE)
+    assert (first, second, len(store)) == (0, 1, 2)
+
+    game = store.game(0)
+    assert game.name == "opening"
+    assert game.moves() == moves
+    assert bytes(game.start) == start
+    assert len(game.position) == POSITION_SIZE
+
+    loaded = Board()
+    assert store.load(0, loaded) == BLACK
+    assert loaded.to_fen(BLACK) == b.to_fen(BLACK)
+    assert store.game(1).moves() == []
+
+    with pytest.raises(IndexError):
+        store.game(2)
+    store.close()
+
+# Test that a reader sees games appended after it mapped the files
+def test_reader_sees_appends(tmp_path):
+    path = tmp_path / "games.store"
+    writer, reader = GameStore(path), GameStore(path)
+    board, turn = board_from_fen(START_FEN)
+
+    writer.append("a", board, turn)
+    view = reader.position(0) # Keeps the first map alive across the remap
+    writer.append("b", board, turn)
+
+    assert reader.game(1).name == "b"
+    assert bytes(view) == bytes(reader.position(0))
+    assert reader.names() == {"a": 0, "b": 1}
+    reader.close()
+
+# Test that saving a name again replaces it and that the move history is kept
+def test_save_load_through_store(tmp_path, monkeypatch):
+    monkeypatch.setattr("chessgame.save_load.SAVES_DIR", tmp_path)
+
+    board, turn = board_from_fen(START_FEN)
+    save_game(board, turn, "game")
+
+    move = Move.from_uci("d2d4")
+    board.play_move(move, WHITE)
+    save_game(board, BLACK, "game", [move], START_FEN)
+
+    assert list_saves() == ["game"]
+    loaded = Board()
+    assert load_game(loaded, "game") == BLACK
+    assert loaded.to_fen(BLACK) == board.to_fen(BLACK)
+    assert load_history("game") == (START_FEN, [move])
+
+# Test that saves from before the game store still list and load
+def test_old_json_saves(tmp_path, monkeypatch):
+    monkeypatch.setattr("chessgame.save_load.SAVES_DIR", tmp_path)
+    data = {"turn": WHITE, "en_passant_target": None,
+            "pieces": [{"square": "e1", "type": "King", "color": WHITE, "has_moved": True}]}
+    (tmp_path / "old.json").write_text(json.dumps(data), encoding = "utf-8")
+
+    assert list_saves() == ["old"]
+    b = Board()
+    assert load_game(b, "old") == WHITE
+    assert b.get_piece("e1").has_moved is True
+    assert load_history("old") == (None, [])
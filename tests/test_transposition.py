@@ -0,0 +1,75 @@
+from chessgame.board import Board
+from chessgame.pieces import WHITE
+from chessgame.move import Move, CASTLE
+from chessgame.transposition import (TranspositionTable, pack_entry, unpack_entry,
+                                     EXACT, LOWER_BOUND, UPPER_BOUND)
+from chessgame.engine import Searcher, SearchLimits
+
+# Test that entries survive packing into one number
+def test_pack_round_trip():
+    move = Move.from_squares("e1", "g1")
+    move.flags = CASTLE
+
+    entry = unpack_entry(pack_entry(7, -99990, LOWER_BOUND, move))
+    assert (entry.depth, entry.score, entry.bound) == (7, -99990, LOWER_BOUND)
+    assert entry.move == move and entry.move.flags == CASTLE
+
+    assert unpack_entry(pack_entry(0, 0, UPPER_BOUND, None)).move is None
+
+# Test that the memory cap decides the number of entries
+def test_size_is_bounded():
+    table = TranspositionTable(1)
+    assert len(table) * 16 <= 1024 * 1024
+    assert len(table) == 65536
+
+    for key in range(200000):
+        table.store(key * 0x9E3779B97F4A7C15 & (2 ** 64 - 1), 1, 0, EXACT)
+    assert len(table) == 65536
+
+# Test the hit, miss and collision counters
+def test_probe_counters():
+    table = TranspositionTable(0.001) # A handful of buckets
+    buckets = table.bucket_mask + 1
+
+    table.store(5, 3, 42, EXACT, Move(12, 28))
+    entry = table.probe(5)
+    assert entry.score == 42 and entry.move == Move(12, 28)
+
+    assert table.probe(5 + buckets) is None # Same bucket, other position
+    assert table.probe(6) is None           # Empty bucket
+
+    stats = table.stats()
+    assert (stats["hits"], stats["misses"], stats["collisions"]) == (1, 2, 1)
+
+# Test the depth-preferred and always-replace slots of a bucket
+def test_replacement_scheme():
+    table = TranspositionTable(0.001)
+    buckets = table.bucket_mask + 1
+    deep, shallow, newer = 1, 1 + buckets, 1 + 2 * buckets
+
+    table.store(deep, 8, 1, EXACT)
+    table.store(shallow, 2, 2, EXACT)
+    table.store(newer, 3, 3, EXACT) # Replaces the shallow entry, not the deep one
+
+    assert table.probe(deep).depth == 8
+    assert table.probe(shallow) is None
+    assert table.probe(newer).depth == 3
+    assert table.overwrites == 1
+
+    table.store(shallow, 9, 4, EXACT) # Deeper: takes slot 0, the old deep entry moves down
+    assert table.probe(shallow).depth == 9
+    assert table.probe(deep).depth == 8
+
+# Test that the engine uses the table and gives the same move with it warm
+def test_engine_uses_table():
+    b = Board()
+    b.setup_starting_position()
+    searcher = Searcher(b, TranspositionTable(1))
+
+    first = searcher.search(WHITE, SearchLimits(depth = 3))
+    second = searcher.search(WHITE, SearchLimits(depth = 3))
+
+    assert searcher.table.hits > 0
+    assert second.nodes < first.nodes
+    assert second.move in b.generate_legal_moves(WHITE)
+    assert second.pv[0] == second.move
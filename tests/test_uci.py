@@ -0,0 +1,92 @@
+from chessgame.pieces import WHITE, BLACK
+from chessgame.engine import MATE_SCORE
+from chessgame.uci import UciEngine, format_score, movetime_for
+
+def new_engine():
+    """Create an engine that collects its output lines in a list."""
+    lines = []
+    return UciEngine(lines.append), lines
+
+# Test the handshake
+def test_uci_and_isready():
+    engine, lines = new_engine()
+    engine.handle("uci")
+    engine.handle("isready")
+
+    assert lines[0] == "id name Chess-Game"
+    assert lines[-2:] == ["uciok", "readyok"]
+
+# Test that a longer move list only plays the new moves
+def test_position_is_incremental():
+    engine, _ = new_engine()
+    board = engine.board
+
+    engine.handle("position startpos moves e2e4")
+    assert len(board.position_history) == 2
+
+    engine.handle("position startpos moves e2e4 e7e5 g1f3")
+    assert engine.board is board
+    assert len(board.position_history) == 4 # Extended, not rebuilt
+    assert engine.turn == BLACK
+    assert board.to_fen(BLACK) == "rnbqkbnr/pppp1ppp/8/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R b KQkq - 1 2"
+
+    engine.handle("position startpos moves d2d4") # Another game: rebuilt from the start
+    assert len(board.position_history) == 2
+    assert board.get_piece("e4") is None
+
+    engine.handle("position fen 7k/P7/8/8/8/8/8/K7 w - - 0 1 moves a7a8q")
+    assert board.get_piece("a8").__class__.__name__ == "Queen"
+    assert engine.turn == BLACK
+
+# Test that illegal moves are reported and stop the move list
+def test_illegal_position_move():
+    engine, lines = new_engine()
+    engine.handle("position startpos moves e2e5 e7e5")
+
+    assert lines == ["info string Illegal move: e2e5"]
+    assert engine.turn == WHITE
+
+# Test that a bad FEN does not leave a half-set board for the next position command
+def test_bad_fen_then_startpos():
+    engine, lines = new_engine()
+    engine.handle("position startpos")
+    engine.handle("position fen rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNx w KQkq - 0 1")
+    assert lines[-1].startswith("info string Invalid FEN piece")
+
+    engine.handle("position startpos moves e2e4 e7e5")
+    assert lines[-1].startswith("info string Invalid FEN piece") # No illegal move reported
+    assert engine.board.to_fen(engine.turn) == "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2"
+
+# Test a fixed-depth search: info lines with nodes and nps, then bestmove
+def test_go_depth():
+    engine, lines = new_engine()
+    engine.handle("position fen 6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1")
+    engine.handle("go depth 3")
+    engine.wait_for_search()
+
+    assert lines[-1] == "bestmove a1a8"
+    infos = [line for line in lines if line.startswith("info depth")]
+    assert infos and " nodes " in infos[0] and " nps " in infos[0]
+    assert "score mate 1" in infos[-1]
+
+# Test that 'go infinite' answers only after 'stop'
+def test_go_infinite_and_stop():
+    engine, lines = new_engine()
+    engine.handle("position startpos")
+    engine.handle("go infinite")
+    engine.handle("isready")
+    assert "readyok" in lines and not any(line.startswith("bestmove") for line in lines)
+
+    engine.handle("stop")
+    assert lines[-1].startswith("bestmove ")
+    assert engine.handle("quit") is False
+
+# Test score formatting and the time budget from the clock
+def test_helpers():
+    assert format_score(35) == "cp 35"
+    assert format_score(MATE_SCORE - 3) == "mate 2"
+    assert format_score(-(MATE_SCORE - 2)) == "mate -1"
+
+    assert movetime_for(WHITE, {}) is None
+    assert movetime_for(WHITE, {"wtime": 60000, "btime": 1000}) == 2.0
+    assert movetime_for(BLACK, {"wtime": 60000, "btime": 1000, "movestogo": 1}) == 0.5
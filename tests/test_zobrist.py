@@ -0,0 +1,70 @@
+import random
+
+from chessgame.board import Board
+from chessgame.pieces import Pawn, King, Rook, WHITE, BLACK
+from chessgame.zobrist import compute_zobrist_key
+
+def start_board():
+    b = Board()
+    b.setup_starting_position()
+    return b
+
+# Test that the same position reached by different moves has the same key
+def test_transposition_has_same_key():
+    b = start_board()
+    start_key = b.zobrist_key(WHITE)
+
+    for from_square, to_square, color in [("g1", "f3", WHITE), ("g8", "f6", BLACK),
+                                          ("f3", "g1", WHITE), ("f6", "g8", BLACK)]:
+        assert b.move_piece(from_square, to_square, color) is True
+
+    assert b.zobrist_key(WHITE) == start_key
+
+# Test that the side to move is part of the key
+def test_side_to_move_changes_key():
+    b = start_board()
+    assert b.zobrist_key(WHITE) != b.zobrist_key(BLACK)
+
+# Test that castling rights (from has_moved) are part of the key
+def test_castling_rights_change_key():
+    b = Board()
+    b.set_piece("e1", King(WHITE))
+    rook = Rook(WHITE)
+    b.set_piece("h1", rook)
+    key = b.zobrist_key(WHITE)
+
+    rook.has_moved = True
+    assert b.zobrist_key(WHITE) != key
+
+# Test that an en passant square only counts when it can be captured
+def test_en_passant_changes_key_only_when_capturable():
+    b = Board()
+    b.set_piece("e5", Pawn(WHITE))
+    b.set_piece("d5", Pawn(BLACK))
+    key = b.zobrist_key(WHITE)
+
+    b.en_passant_target = "d6"
+    assert b.zobrist_key(WHITE) != key
+
+    b.en_passant_target = "a6" # No white pawn next to it
+    assert b.zobrist_key(WHITE) == key
+
+# Test that the incremental key always matches a full recomputation
+def test_incremental_key_matches_recomputation():
+    rng = random.Random(7)
+    b = start_board()
+    color = WHITE
+    undos = []
+
+    for _ in range(80):
+        moves = b.generate_legal_moves(color)
+        if not moves:
+            break
+        undos.append(b.make_move(rng.choice(moves)))
+        color = BLACK if color == WHITE else WHITE
+        assert b.zobrist_key(color) == compute_zobrist_key(b, color)
+
+    while undos:
+        b.unmake_move(undos.pop())
+
+    assert b.zobrist_key(WHITE) == start_board().zobrist_key(WHITE)